@@ -0,0 +1,108 @@
+# examples/benchmark_transport.py
+
+"""
+HTTP/1.1(연결 풀)과 HTTP/2(다중화) 전송 계층의 동시 조회 성능을 비교하는 벤치마크입니다.
+
+사용 예시:
+    # 실제 API (.env의 인증 정보 사용): 플레이버 목록 500회, 동시 50개
+    python examples/benchmark_transport.py --requests 500 --concurrency 50
+
+    # 로컬 대체 서버
+    python examples/benchmark_transport.py --endpoint https://127.0.0.1:8443 --path /v2/test/flavors
+
+HTTP/2 측정에는 httpx가 필요합니다: pip install 'httpx[http2]'
+"""
+
+import sys
+import os
+import argparse
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dotenv import load_dotenv
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(project_root)
+
+dotenv_path = os.path.join(project_root, '.env')
+load_dotenv(dotenv_path=dotenv_path)
+
+from nhn_api_module.auth import get_token
+from nhn_api_module.client import create_client_context, new_session
+from nhn_api_module.transport import TRANSPORTS
+
+def run_benchmark(ctx, url, total_requests, concurrency):
+    """
+    같은 URL에 GET 요청을 동시에 보내고 지연 시간 통계를 반환합니다.
+    """
+    def one_request(_):
+        started = time.perf_counter()
+        try:
+            response = ctx.session.get(url, headers=ctx.headers)
+            ok = response.status_code < 400
+            version = getattr(response, 'http_version', None) or f"HTTP/{response.raw.version / 10:.1f}"
+        except Exception:
+            ok, version = False, None
+        return time.perf_counter() - started, ok, version
+
+    # 연결 수립 비용이 측정에 섞이지 않도록 한 번 미리 요청합니다.
+    one_request(None)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(one_request, range(total_requests)))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(r[0] for r in results)
+    return {
+        "elapsed": elapsed,
+        "throughput": total_requests / elapsed,
+        "p50": latencies[len(latencies) // 2],
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        "mean": statistics.mean(latencies),
+        "errors": sum(1 for r in results if not r[1]),
+        "versions": sorted({r[2] for r in results if r[2]}),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP/1.1 vs HTTP/2 전송 계층 벤치마크")
+    parser.add_argument("--requests", type=int, default=500, help="전송 방식별 총 요청 수")
+    parser.add_argument("--concurrency", type=int, default=50, help="동시 요청 수")
+    parser.add_argument("--service", default="compute", help="요청할 서비스 (compute, network, image)")
+    parser.add_argument("--path", default=None, help="요청 경로 (기본값: /v2/{tenant_id}/flavors)")
+    parser.add_argument("--region", default="kr1", help="리전 코드")
+    parser.add_argument("--endpoint", default=None, help="서비스 엔드포인트를 이 URL로 덮어씀 (로컬 대체 서버)")
+    parser.add_argument("--transports", default=",".join(TRANSPORTS), help="비교할 전송 방식 목록")
+    args = parser.parse_args()
+
+    if args.endpoint:
+        token_data = {"token_id": "local-benchmark"}
+    else:
+        token_data = get_token()
+        if not token_data:
+            return
+
+    print(f"--- 전송 계층 벤치마크 (요청 {args.requests}회, 동시 {args.concurrency}개) ---")
+    for kind in args.transports.split(","):
+        try:
+            # 동일한 GET이 합쳐지면 전송 계층을 측정할 수 없으므로 요청 합치기를 끕니다.
+            session = new_session(pool_maxsize=args.concurrency, coalesce_reads=False, transport=kind)
+        except ImportError as e:
+            print(f"[{kind}] 건너뜀: {e}")
+            continue
+
+        overrides = {args.service: args.endpoint} if args.endpoint else None
+        ctx = create_client_context(token_data, endpoint_overrides=overrides, session=session)
+        path = args.path or f"/v2/{ctx.tenant_id}/flavors"
+        url = ctx.url(args.service, path, args.region)
+
+        result = run_benchmark(ctx, url, args.requests, args.concurrency)
+        session.close()
+        print(
+            f"[{kind}] {result['elapsed']:.2f}s, {result['throughput']:.1f} req/s, "
+            f"p50 {result['p50'] * 1000:.1f}ms, p99 {result['p99'] * 1000:.1f}ms, "
+            f"오류 {result['errors']}건, 프로토콜 {', '.join(result['versions']) or '-'}"
+        )
+
+if __name__ == "__main__":
+    main()
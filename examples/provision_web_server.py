@@ -2,7 +2,6 @@
 
 import sys
 import os
-import base64
 from dotenv import load_dotenv
 
 # 프로젝트 루트 디렉토리를 Python Path에 추가합니다.
@@ -20,27 +19,48 @@ load_dotenv(dotenv_path=dotenv_path)
 
 # nhn_api_module에서 필요한 함수들을 임포트합니다.
 from nhn_api_module.auth import get_token
+from nhn_api_module.client import create_client_context
 from nhn_api_module.networking import (
     create_vpc,
     create_vpc_subnet,
     get_vpc_details,
     get_external_network_id,
     create_internet_gateway,
-    attach_gateway_to_routing_table,
-    create_floating_ip,
-    associate_floating_ip
+    attach_gateway_to_routing_table
 )
 from nhn_api_module.compute import (
-    create_instance,
+    launch_instance_with_floating_ip,
     list_flavors,
     list_key_pairs
 )
+from nhn_api_module.bootlog import wait_for_cloud_init
+from nhn_api_module.cidr import CidrAllocator, load_vpc_allocator
+from nhn_api_module.image import bake_image
+from nhn_api_module.profiling import Profiler
+from nhn_api_module.readiness import wait_for_ready
+from nhn_api_module.storage import create_container, upload_object, set_temp_url_key, generate_temp_url, build_fetch_script
+from nhn_api_module.userdata import build_user_data
 from nhn_api_module.security import (
     create_security_group,
-    create_security_group_rule
+    apply_security_group_rules
 )
 
 def main():
+    """
+    NHN Cloud에 웹 서버 환경을 프로비저닝하는 전체 과정을 실행하고, 단계별 소요 시간 보고서를 출력합니다.
+    PROFILE_TRACE_FILE 환경 변수를 지정하면 Chrome Trace(JSON) 파일도 저장합니다.
+    """
+    profiler = Profiler()
+    try:
+        provision(profiler)
+    finally:
+        profiler.end_phase()
+        print(profiler.report())
+        trace_file = os.getenv("PROFILE_TRACE_FILE")
+        if trace_file:
+            profiler.save_chrome_trace(trace_file)
+
+def provision(profiler):
     """
     NHN Cloud에 웹 서버 환경을 프로비저닝하는 전체 과정을 실행합니다.
     """
@@ -49,6 +69,7 @@ def main():
 
     # --- 1. 환경 변수 및 설정 불러오기 ---
     print("--- 1. 환경 변수 및 설정 불러오기 ---")
+    profiler.begin_phase("1. 설정 불러오기")
     
     # 민감 정보 로드
     tenant_id = os.getenv("TENANT_ID")
@@ -63,9 +84,11 @@ def main():
     # 예제용 설정 (필요시 수정 가능)
     region_code = "kr1"
     vpc_name = "my-python-vpc"
-    vpc_cidr = "10.0.0.0/16"
+    # VPC/서브넷 CIDR은 기존 대역과 겹치지 않도록 아래 대역에서 자동으로 할당합니다.
+    vpc_cidr_pool = "10.0.0.0/8"
+    vpc_prefixlen = 16
     subnet_name = "my-python-subnet"
-    subnet_cidr = "10.0.1.0/24"
+    subnet_prefixlen = 24
     sg_name = "my-python-sg"
     sg_description = "웹 서버 및 SSH 접속을 위한 보안 그룹"
     instance_name = "my-web-instance"
@@ -81,29 +104,48 @@ def main():
         print("🚨 오류: 프로젝트 루트에 index.html 파일이 없습니다. 스크립트를 중단합니다.")
         return
         
-    encoded_html = base64.b64encode(html_content.encode('utf-8')).decode('utf-8')
-    nginx_user_data_script = f"""#!/bin/bash
+    # Nginx 설치 부분은 골든 이미지로 베이킹할 수 있도록 사이트 배포 부분과 분리합니다.
+    nginx_install_script = """#!/bin/bash
 exec > >(tee /var/log/user-data.log|logger -t user-data -s 2>/dev/console) 2>&1
 apt-get update
 apt-get install -y nginx
-echo "{encoded_html}" | base64 -d > /var/www/html/index.html
 systemctl enable nginx
+"""
+    site_deploy_script = """#!/bin/bash
 systemctl restart nginx
 """
+    # index.html은 cloud-config write_files 파트로 전달됩니다. (스크립트 내 Base64 이중 인코딩 불필요)
+    site_files = [{"path": "/var/www/html/index.html", "content": html_content}]
+
+    # BAKE_IMAGE=true 이면 Nginx가 설치된 이미지를 한 번만 베이킹하고 재사용합니다.
+    use_baked_image = os.getenv("BAKE_IMAGE", "false").lower() == "true"
+    # ASSET_CONTAINER와 TEMP_URL_KEY를 지정하면 index.html을 Object Storage에 올리고, 인스턴스는 임시 URL로 내려받습니다.
+    asset_container = os.getenv("ASSET_CONTAINER")
+    temp_url_key = os.getenv("TEMP_URL_KEY")
     print("✅ 설정 로드 완료")
 
 
     # --- 2. 인증 토큰 발급 ---
     print("--- 2. 인증 토큰 발급 ---")
+    profiler.begin_phase("2. 인증 토큰 발급")
     token_data = get_token()
     if not token_data:
         return
-    auth_token = token_data["token_id"]
+    # 토큰 응답의 서비스 카탈로그로 엔드포인트/헤더/세션을 한 번만 구성해 모든 호출에서 재사용합니다.
+    # 이 컨텍스트로 나가는 모든 API 호출은 프로파일러에 기록됩니다.
+    ctx = profiler.instrument(create_client_context(token_data, tenant_id))
 
 
     # --- 3. VPC 생성 ---
     print(f"--- 3. VPC '{vpc_name}' 생성 ---")
-    vpc_id = create_vpc(auth_token, vpc_name, vpc_cidr, region_code)
+    profiler.begin_phase("3. VPC 생성")
+    vpc_allocator = load_vpc_allocator(ctx, vpc_cidr_pool, region_code)
+    vpc_cidr = vpc_allocator.allocate(vpc_prefixlen) if vpc_allocator else None
+    if not vpc_cidr:
+        print(f"🚨 VPC CIDR을 할당하지 못해 스크립트를 중단합니다.")
+        return
+    print(f"✅ VPC CIDR 할당: {vpc_cidr}")
+    vpc_id = create_vpc(ctx, vpc_name, vpc_cidr, region_code)
     if not vpc_id:
         print(f"🚨 VPC 생성에 실패하여 스크립트를 중단합니다.")
         return
@@ -111,7 +153,10 @@ systemctl restart nginx
 
     # --- 4. 서브넷 생성 ---
     print(f"--- 4. 서브넷 '{subnet_name}' 생성 ---")
-    subnet_id = create_vpc_subnet(auth_token, vpc_id, subnet_name, subnet_cidr, region_code)
+    profiler.begin_phase("4. 서브넷 생성")
+    # 방금 만든 VPC이므로 기존 서브넷 없이 VPC CIDR 안에서 바로 할당합니다.
+    subnet_cidr = CidrAllocator(vpc_cidr).allocate(subnet_prefixlen)
+    subnet_id = create_vpc_subnet(ctx, vpc_id, subnet_name, subnet_cidr, region_code)
     if not subnet_id:
         print(f"🚨 서브넷 생성에 실패하여 스크립트를 중단합니다.")
         return
@@ -121,7 +166,8 @@ systemctl restart nginx
     print("--- 5. 인터넷 게이트웨이 설정 ---")
     
     # 5-1. 라우팅 테이블 ID 조회
-    vpc_details = get_vpc_details(auth_token, vpc_id, region_code)
+    profiler.begin_phase("5-1. 라우팅 테이블 조회")
+    vpc_details = get_vpc_details(ctx, vpc_id, region_code)
     routing_table_id = None
     if vpc_details and vpc_details.get('subnets'):
         routing_table_id = vpc_details['subnets'][0].get('routingtable', {}).get('id')
@@ -131,20 +177,23 @@ systemctl restart nginx
         return
 
     # 5-2. 외부 네트워크 ID 조회
-    external_network_id = get_external_network_id(auth_token, region_code)
+    profiler.begin_phase("5-2. 외부 네트워크 조회")
+    external_network_id = get_external_network_id(ctx, region_code)
     if not external_network_id:
         print("🚨 외부 네트워크 ID를 찾지 못해 스크립트를 중단합니다.")
         return
 
     # 5-3. 인터넷 게이트웨이 생성
+    profiler.begin_phase("5-3. 인터넷 게이트웨이 생성")
     ig_name = f"{vpc_name}-igw"
-    internet_gateway_id = create_internet_gateway(auth_token, ig_name, external_network_id, region_code)
+    internet_gateway_id = create_internet_gateway(ctx, ig_name, external_network_id, region_code)
     if not internet_gateway_id:
         print(f"🚨 인터넷 게이트웨이 생성에 실패하여 스크립트를 중단합니다.")
         return
 
     # 5-4. 라우팅 테이블에 게이트웨이 연결
-    attached = attach_gateway_to_routing_table(auth_token, routing_table_id, internet_gateway_id, region_code)
+    profiler.begin_phase("5-4. 인터넷 게이트웨이 연결")
+    attached = attach_gateway_to_routing_table(ctx, routing_table_id, internet_gateway_id, region_code)
     if not attached:
         print(f"🚨 인터넷 게이트웨이를 라우팅 테이블에 연결하는 데 실패하여 스크립트를 중단합니다.")
         return
@@ -153,25 +202,27 @@ systemctl restart nginx
 
     # --- 6. 보안 그룹 및 규칙 생성 ---
     print(f"--- 6. 보안 그룹 '{sg_name}' 생성 및 규칙 추가 ---")
-    security_group_id = create_security_group(auth_token, sg_name, sg_description, region_code)
+    profiler.begin_phase("6. 보안 그룹 생성")
+    security_group_id = create_security_group(ctx, sg_name, sg_description, region_code)
     if not security_group_id:
         print(f"🚨 보안 그룹 생성에 실패하여 스크립트를 중단합니다.")
         return
 
-    # HTTP 규칙
-    create_security_group_rule(
-        auth_token, security_group_id, "ingress", "tcp", 80, 80, my_ip_for_ssh, "HTTP 허용"
-    )
-    # SSH 규칙
-    create_security_group_rule(
-        auth_token, security_group_id, "ingress", "tcp", 22, 22, my_ip_for_ssh, "SSH 허용"
-    )
+    # 규칙은 병합/중복 제거 후 한 번에 적용됩니다. (이미 있는 규칙은 건너뜀)
+    sg_rules = [
+        {"direction": "ingress", "protocol": "tcp", "port_range_min": 80, "port_range_max": 80, "remote_ip_prefix": my_ip_for_ssh, "description": "HTTP 허용"},
+        {"direction": "ingress", "protocol": "tcp", "port_range_min": 22, "port_range_max": 22, "remote_ip_prefix": my_ip_for_ssh, "description": "SSH 허용"},
+    ]
+    if not apply_security_group_rules(ctx, security_group_id, sg_rules, region_code):
+        print(f"🚨 보안 그룹 규칙 추가에 실패하여 스크립트를 중단합니다.")
+        return
     print("✅ 보안 그룹 규칙 추가 완료")
 
 
     # --- 7. 인스턴스 사양(Flavor) 선택 ---
     print("--- 7. 인스턴스 사양(Flavor) 선택 ---")
-    flavors = list_flavors(auth_token, tenant_id, region_code)
+    profiler.begin_phase("7. 플레이버 선택")
+    flavors = list_flavors(ctx, tenant_id, region_code)
     selected_flavor_id = None
     if flavors:
         # 가장 작은 사양 중 하나인 'u2.c1m2'를 우선 선택
@@ -190,41 +241,90 @@ systemctl restart nginx
         return
     
     
-    # --- 8. 인스턴스 생성 ---
-    print("--- 8. 인스턴스 생성 ---")
-    instance_id, port_id = create_instance(
-        auth_token, tenant_id, instance_name, key_name, image_ref,
-        selected_flavor_id, subnet_id, [sg_name], nginx_user_data_script,
-        volume_size, region_code
+    # --- 8. User Data 및 이미지 준비 ---
+    print("--- 8. User Data 및 이미지 준비 ---")
+    profiler.begin_phase("8. User Data 및 이미지 준비")
+    if use_baked_image:
+        baked_image_ref = bake_image(
+            ctx, tenant_id, image_ref, nginx_install_script, selected_flavor_id,
+            subnet_id, [sg_name], key_name, f"{instance_name}-nginx", volume_size, region_code
+        )
+        if not baked_image_ref:
+            print("🚨 골든 이미지 베이킹에 실패하여 스크립트를 중단합니다.")
+            return
+        image_ref = baked_image_ref
+        user_data_scripts = [site_deploy_script]
+    else:
+        user_data_scripts = [nginx_install_script, site_deploy_script]
+
+    if asset_container and temp_url_key:
+        # 내용이 바뀌지 않았으면 업로드를 건너뛰고, User Data에는 내려받기 스크립트만 넣습니다.
+        asset_name = "site/index.html"
+        if not (create_container(ctx, tenant_id, asset_container, region_code)
+                and upload_object(ctx, tenant_id, asset_container, asset_name, os.path.join(project_root, 'index.html'), region_code)
+                and set_temp_url_key(ctx, tenant_id, temp_url_key, region_code)):
+            print("🚨 사이트 파일 업로드에 실패하여 스크립트를 중단합니다.")
+            return
+        asset_url = generate_temp_url(ctx, tenant_id, asset_container, asset_name, temp_url_key, 3600, region_code)
+        user_data_scripts.insert(-1, build_fetch_script({"/var/www/html/index.html": asset_url}))
+        site_files = []
+
+    nginx_user_data = build_user_data(scripts=user_data_scripts, files=site_files)
+    if not nginx_user_data:
+        print("🚨 User Data 구성에 실패하여 스크립트를 중단합니다.")
+        return
+    print("✅ User Data 및 이미지 준비 완료")
+
+
+    # --- 9. 인스턴스 생성 및 Floating IP 연결 ---
+    # 인스턴스가 빌드되는 동안 Floating IP를 할당하고, 포트가 생기는 즉시 연결합니다.
+    print("--- 9. 인스턴스 생성 및 Floating IP 연결 ---")
+    profiler.begin_phase("9. 인스턴스 생성 및 Floating IP 연결")
+    instance_id, port_id, fip_data = launch_instance_with_floating_ip(
+        ctx, tenant_id, instance_name, key_name, image_ref,
+        selected_flavor_id, subnet_id, [sg_name], nginx_user_data,
+        external_network_id, volume_size, region_code
     )
     if not instance_id:
         print(f"🚨 인스턴스 생성에 실패하여 스크립트를 중단합니다.")
         return
-
-        
-    # --- 9. Floating IP 생성 및 연결 ---
-    print("--- 9. Floating IP 생성 및 연결 ---")
-    fip_data = create_floating_ip(auth_token, external_network_id, region_code)
     if not fip_data:
-        print("🚨 Floating IP 생성에 실패하여 스크립트를 중단합니다.")
+        print("🚨 Floating IP 생성 또는 연결에 실패하여 스크립트를 중단합니다.")
         return
 
-    floating_ip_id = fip_data['id']
     floating_ip_address = fip_data['ip_address']
 
-    associated = associate_floating_ip(auth_token, floating_ip_id, port_id, region_code)
-    if not associated:
-        print("🚨 Floating IP 연결에 실패하여 스크립트를 중단합니다.")
+    # --- 10. User Data 실행 결과 확인 ---
+    # 콘솔 로그에서 cloud-init 완료/실패 표시를 찾아, User Data 스크립트가 실패했으면 바로 알립니다.
+    print("--- 10. User Data(cloud-init) 실행 결과 확인 ---")
+    profiler.begin_phase("10. cloud-init 완료 대기")
+    cloud_init = wait_for_cloud_init(ctx, tenant_id, [instance_id], region_code)[instance_id]
+    if cloud_init["status"] == "failed":
+        print(f"🚨 User Data 실행에 실패했습니다: {cloud_init['marker']}")
+        print(f"    인스턴스 '{instance_id}'의 콘솔 로그를 확인하세요. (Floating IP: {floating_ip_address})")
         return
-    
 
-    # --- 10. 최종 결과 출력 ---
-    print("🎉 모든 리소스 프로비저닝 성공! 🎉")
+    # --- 11. 웹 서버 준비 확인 ---
+    # 고정된 시간을 기다리지 않고, Nginx가 응답하는 즉시 다음으로 넘어갑니다.
+    print("--- 11. 웹 서버 준비 확인 (HTTP 80, SSH 22) ---")
+    profiler.begin_phase("11. 웹 서버 준비 확인")
+    readiness = wait_for_ready(
+        [floating_ip_address],
+        checks=[{"type": "http", "port": 80, "path": "/"}, {"type": "tcp", "port": 22}],
+        deadline_seconds=600
+    )
+    profiler.end_phase()
+
+    # --- 12. 최종 결과 출력 ---
+    if readiness["not_ready"]:
+        print("❗ 리소스는 모두 생성되었지만 웹 서버가 제한 시간 안에 응답하지 않았습니다.")
+        print(f"    마지막 오류: {readiness['results'][floating_ip_address]['last_error']}")
+    else:
+        print("🎉 모든 리소스 프로비저닝 성공! 🎉")
     print("-----------------------------------------")
     print(f"✅ 웹 서버 접속 주소: http://{floating_ip_address}")
     print(f"✅ SSH 접속: ssh ubuntu@{floating_ip_address}")
     print("-----------------------------------------")
-    print("(참고: 인스턴스 부팅 및 Nginx 설치에 약 1~2분 소요될 수 있습니다.)")
 
 
 if __name__ == "__main__":
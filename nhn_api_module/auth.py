@@ -1,7 +1,9 @@
 import requests
 import json
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 import os
+
+from .client import DEFAULT_ENDPOINTS, ENDPOINT_ENV_PREFIX
 # from dotenv import load_dotenv # 진입점에서 로드하므로 여기서는 필요 없음
 
 # token.json 파일의 경로를 프로젝트 루트 기준으로 지정합니다.
@@ -9,18 +11,22 @@ import os
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
 TOKEN_FILE = os.path.join(project_root, "token.json")
 
-def save_token(token_data):
+def tenant_token_file(tenant_id):
+    """테넌트별 토큰 캐시 파일 경로를 반환합니다. (여러 테넌트를 동시에 다룰 때 사용)"""
+    return os.path.join(project_root, f"token_{tenant_id}.json")
+
+def save_token(token_data, token_file=None):
     """토큰 데이터를 JSON 파일에 저장합니다."""
-    with open(TOKEN_FILE, 'w') as f:
+    with open(token_file or TOKEN_FILE, 'w') as f:
         json.dump(token_data, f, indent=4)
 
-def load_token():
+def load_token(token_file=None):
     """
     JSON 파일에서 토큰 데이터를 로드합니다.
     파일이 존재하고 유효한 경우 토큰 데이터를 반환하고, 그렇지 않으면 None을 반환합니다.
     """
     try:
-        with open(TOKEN_FILE, 'r') as f:
+        with open(token_file or TOKEN_FILE, 'r') as f:
             token_data = json.load(f)
             return token_data
     except (FileNotFoundError, json.JSONDecodeError):
@@ -35,28 +41,51 @@ def parse_datetime(dt_str):
         dt_str = dt_str[:-1] + '+00:00'
     return datetime.fromisoformat(dt_str)
 
-def get_token():
+def get_token(tenant_id=None, username=None, password=None, token_file=None, min_valid_seconds=0):
     """
     NHN Cloud API 인증 토큰을 발급받습니다.
 
     먼저 `token.json` 파일에 캐시된 유효한 토큰이 있는지 확인합니다.
     유효한 토큰이 없거나 만료된 경우, API를 통해 새 토큰을 발급받고 파일에 캐시합니다.
     
-    필요한 환경 변수:
+    인증 정보를 인자로 넘기지 않으면 다음 환경 변수를 사용합니다:
     - TENANT_ID: NHN Cloud 프로젝트의 테넌트 ID
     - API_USERNAME: NHN Cloud API 사용자 이름
     - API_PASSWORD: NHN Cloud API 비밀번호
 
+    tenant_id를 인자로 넘기면 username/password도 인자로만 받으며(환경 변수를 사용하지 않음),
+    토큰은 테넌트별 파일(`token_{tenant_id}.json`)에 캐시되어 여러 테넌트의 토큰이 섞이지 않습니다.
+
+    Args:
+        tenant_id: 테넌트 ID (생략 시 환경 변수 TENANT_ID)
+        username: API 사용자 이름 (tenant_id 생략 시 환경 변수 API_USERNAME)
+        password: API 비밀번호 (tenant_id 생략 시 환경 변수 API_PASSWORD)
+        token_file: 토큰 캐시 파일 경로 (생략 시 위 규칙에 따름)
+        min_valid_seconds: 캐시된 토큰의 남은 유효 시간이 이보다 짧으면 새 토큰을 발급 (초, 오래 실행되는 작업용)
+
     Returns:
-        성공 시 토큰 정보가 담긴 dict, 실패 시 None
+        성공 시 토큰 정보(token_id, token_expires, token_issued_at, tenant_id, service_catalog)가 담긴 dict,
+        실패 시 None
     """
     
+    if tenant_id:
+        # 테넌트를 명시한 경우 다른 테넌트의 인증 정보(환경 변수)가 섞이지 않도록 인자만 사용합니다.
+        if token_file is None:
+            token_file = tenant_token_file(tenant_id)
+    else:
+        # .env 파일에서 민감한 정보 로드
+        tenant_id = os.getenv("TENANT_ID")
+        username = username or os.getenv("API_USERNAME")
+        password = password or os.getenv("API_PASSWORD")
+
     # 기존에 캐시된 토큰이 있는지 확인
-    cached_token = load_token()
+    cached_token = load_token(token_file)
     if cached_token:
         try:
             expires_at = parse_datetime(cached_token['token_expires'])
-            if expires_at > datetime.now(timezone.utc):
+            if cached_token.get('tenant_id', tenant_id) != tenant_id:
+                print("캐시된 토큰의 테넌트가 다릅니다. 새 토큰을 발급합니다.")
+            elif expires_at > datetime.now(timezone.utc) + timedelta(seconds=min_valid_seconds):
                 print("유효한 캐시 토큰을 사용합니다.")
                 return cached_token
             else:
@@ -65,13 +94,8 @@ def get_token():
             print(f"캐시된 토큰 처리 중 오류 발생: {e}. 새 토큰을 발급합니다.")
 
     print("API로부터 새 토큰을 발급합니다.")
-    url = "https://api-identity-infrastructure.nhncloudservice.com"
+    url = os.getenv(ENDPOINT_ENV_PREFIX + "IDENTITY") or DEFAULT_ENDPOINTS["identity"]
     uri = "/v2.0/tokens"
-    
-    # .env 파일에서 민감한 정보 로드
-    tenant_id = os.getenv("TENANT_ID")
-    username = os.getenv("API_USERNAME")
-    password = os.getenv("API_PASSWORD")
 
     if not all([tenant_id, username, password]):
         print("🚨 오류: TENANT_ID, API_USERNAME, API_PASSWORD 환경 변수가 설정되지 않았습니다.")
@@ -95,16 +119,20 @@ def get_token():
         response = requests.post(url + uri, json=body, headers=headers)
         response.raise_for_status()  # 4xx 또는 5xx 응답 코드인 경우 예외 발생
 
-        token_data = response.json()["access"]["token"]
+        access = response.json()["access"]
+        token_data = access["token"]
         
         token_dict = {
             "token_id": token_data["id"],
             'token_expires': token_data["expires"],
-            'token_issued_at': token_data["issued_at"]
+            'token_issued_at': token_data["issued_at"],
+            'tenant_id': tenant_id,
+            # 서비스별/리전별 엔드포인트 해석에 사용합니다. (client.create_client_context 참고)
+            'service_catalog': access.get("serviceCatalog", [])
         }
 
-        save_token(token_dict)
-        print("✅ 새 토큰을 발급받아 token.json 파일에 저장했습니다.")
+        save_token(token_dict, token_file)
+        print(f"✅ 새 토큰을 발급받아 {os.path.basename(token_file or TOKEN_FILE)} 파일에 저장했습니다.")
         return token_dict
 
     except requests.exceptions.HTTPError as http_err:
@@ -0,0 +1,361 @@
+# nhn_api_module/autoscale.py
+
+"""
+웹 서버 플릿의 응답 지연(p99)과 오류율을 주기적으로 측정해 인스턴스 수를 자동으로 늘리고 줄이는 모듈입니다.
+- 각 서버에 HTTP 프로브를 보내 지연 시간과 실패 여부를 수집 (readiness.probe_http 사용, asyncio로 동시 측정)
+- 최근 측정 구간(window)의 p99와 오류율이 목표를 넘으면 확장, 충분히 낮으면 축소
+- 확장/축소마다 별도 쿨다운과 최소/최대 인스턴스 수를 지킴
+- 새로 생성한 서버는 처음으로 응답하거나 워밍업 시간이 지날 때까지 측정에서 제외 (부팅 중 실패로 인한 연쇄 확장 방지)
+- 인스턴스 생성/삭제는 fleet 객체에 맡김 (기본: 로드 밸런서 풀에 등록/제거하는 LoadBalancerFleet,
+  테스트에서는 같은 메서드를 가진 가짜 객체나 로컬 가짜 API 엔드포인트를 사용)
+
+사용 예시:
+    fleet = LoadBalancerFleet(ctx, tenant_id, web_lb, launch_spec)
+    controller = AutoscalingController(fleet, servers, policy={"min_size": 2, "max_size": 10, "target_p99_ms": 300})
+    controller.run()  # Ctrl+C 또는 controller.stop()으로 종료
+"""
+
+import asyncio
+import itertools
+import math
+import threading
+import time
+
+from .client import as_context
+from .compute import delete_instance
+from .loadbalancer import launch_fleet_members, remove_fleet_members
+from .readiness import probe_http
+
+# 자동 확장 정책 기본값 (AutoscalingController의 policy로 일부만 덮어쓸 수 있음)
+DEFAULT_AUTOSCALE_POLICY = {
+    "min_size": 1,
+    "max_size": 10,
+    "target_p99_ms": 500,        # p99가 이 값을 넘으면 확장
+    "scale_in_p99_ms": 150,      # p99가 이 값보다 낮고 오류가 없으면 축소
+    "max_error_rate": 0.05,      # 오류율이 이 값을 넘으면 확장
+    "max_scale_out_step": 4,     # 한 번에 늘리는 최대 인스턴스 수
+    "scale_in_step": 1,          # 한 번에 줄이는 인스턴스 수
+    "scale_out_cooldown": 180,   # 확장 후 다음 확장까지 대기 (초)
+    "scale_in_cooldown": 600,    # 확장/축소 후 다음 축소까지 대기 (초)
+    "window_seconds": 60,        # 판단에 사용하는 최근 측정 구간 (초)
+    "min_samples": 20,           # 구간 안의 측정 수가 이보다 적으면 판단 보류
+    "warmup_seconds": 300,       # 새 서버가 이 시간 안에 응답하지 않으면 그때부터 측정에 포함
+    "interval": 15,              # 측정/판단 주기 (초)
+    "samples_per_server": 3,     # 주기마다 서버 하나에 보내는 프로브 수
+    "probe_port": 80,
+    "probe_path": "/",
+    "probe_timeout": 2.0,        # 이 시간 안에 응답하지 않으면 실패 (지연 시간은 제한 시간으로 기록)
+    "max_concurrency": 64,
+}
+
+def percentile(values, pct: float):
+    """
+    nearest-rank 방식의 백분위수를 계산합니다.
+
+    :param values: 숫자 리스트
+    :param pct: 백분위 (0~100, 예: 99)
+    :return: 백분위수 값, values가 비어 있으면 None
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+async def _probe_once(host: str, port: int, path: str, timeout: float, semaphore):
+    async with semaphore:
+        started = time.monotonic()
+        ok, _ = await probe_http(host, port, path, timeout)
+        return host, ok, (time.monotonic() - started) * 1000
+
+async def _probe_servers(hosts, samples_per_server: int, port: int, path: str, timeout: float, max_concurrency: int):
+    semaphore = asyncio.Semaphore(max_concurrency)
+    return await asyncio.gather(*(
+        _probe_once(host, port, path, timeout, semaphore) for host in hosts for _ in range(samples_per_server)
+    ))
+
+def sample_fleet(hosts, samples_per_server: int = 3, port: int = 80, path: str = "/", timeout: float = 2.0, max_concurrency: int = 64):
+    """
+    서버 여러 대에 HTTP 프로브를 동시에 보내 응답 지연 시간과 성공 여부를 측정합니다.
+
+    :param hosts: 프로브할 주소 리스트
+    :param samples_per_server: 서버 하나에 보내는 프로브 수
+    :param port: 포트
+    :param path: 요청 경로
+    :param timeout: 프로브 하나의 제한 시간 (초)
+    :param max_concurrency: 동시에 진행할 최대 프로브 수
+    :return: [(주소, 성공 여부, 지연 시간 ms), ...]
+    """
+    if not hosts:
+        return []
+    return asyncio.run(_probe_servers(list(hosts), samples_per_server, port, path, timeout, max_concurrency))
+
+def decide_scaling(size: int, p99_ms, error_rate, sample_count: int, policy: dict, since_scale_out: float, since_scale_in: float):
+    """
+    측정 결과와 정책으로 이번 주기에 늘리거나 줄일 인스턴스 수를 정합니다. (부작용 없음)
+
+    :param size: 현재 인스턴스 수 (워밍업 중인 서버 포함)
+    :param p99_ms: 측정 구간의 p99 지연 시간 (ms), 측정이 없으면 None
+    :param error_rate: 측정 구간의 오류율 (0~1), 측정이 없으면 None
+    :param sample_count: 측정 구간의 측정 수
+    :param policy: 자동 확장 정책 (DEFAULT_AUTOSCALE_POLICY와 같은 키)
+    :param since_scale_out: 마지막 확장 후 지난 시간 (초)
+    :param since_scale_in: 마지막 확장 또는 축소 후 지난 시간 (초)
+    :return: (변경할 인스턴스 수(양수는 확장, 음수는 축소, 0은 유지), 사유) 튜플
+    """
+    if size < policy["min_size"]:
+        # 생성이 계속 실패하는 경우 주기마다 다시 생성하지 않도록 확장 쿨다운을 똑같이 적용
+        if since_scale_out < policy["scale_out_cooldown"]:
+            return 0, f"최소 인스턴스 수({policy['min_size']}) 미달이지만 확장 쿨다운 중"
+        return policy["min_size"] - size, f"최소 인스턴스 수({policy['min_size']}) 미달"
+    if size > policy["max_size"]:
+        return policy["max_size"] - size, f"최대 인스턴스 수({policy['max_size']}) 초과"
+    if sample_count < policy["min_samples"]:
+        return 0, f"측정 부족 ({sample_count}/{policy['min_samples']})"
+
+    overloaded = p99_ms > policy["target_p99_ms"] or error_rate > policy["max_error_rate"]
+    if overloaded:
+        if size >= policy["max_size"]:
+            return 0, f"과부하이지만 최대 인스턴스 수({policy['max_size']}) 도달"
+        if since_scale_out < policy["scale_out_cooldown"]:
+            return 0, "과부하이지만 확장 쿨다운 중"
+        # 지연 시간이 목표를 넘은 비율만큼 늘림 (오류로만 과부하이면 1대씩)
+        wanted = math.ceil(size * p99_ms / policy["target_p99_ms"]) - size if p99_ms > policy["target_p99_ms"] else 1
+        step = min(max(wanted, 1), policy["max_scale_out_step"], policy["max_size"] - size)
+        return step, f"p99 {p99_ms:.0f}ms, 오류율 {error_rate:.1%}"
+
+    if p99_ms < policy["scale_in_p99_ms"] and error_rate == 0 and size > policy["min_size"]:
+        if since_scale_in < policy["scale_in_cooldown"]:
+            return 0, "여유가 있지만 축소 쿨다운 중"
+        return -min(policy["scale_in_step"], size - policy["min_size"]), f"p99 {p99_ms:.0f}ms, 오류 없음"
+    return 0, "목표 범위 안"
+
+class LoadBalancerFleet:
+    """
+    웹 로드 밸런서 뒤의 인스턴스를 생성/삭제하는 fleet 구현입니다.
+    생성 시 launch_fleet_members로 인스턴스를 만들어 풀에 등록하고, 삭제 시 풀에서 먼저 제거한 뒤 인스턴스를 삭제합니다.
+
+    AutoscalingController는 fleet 객체의 launch(names)와 remove(servers)만 사용하므로,
+    다른 생성/연결 방식(예: 인스턴스별 Floating IP)이나 테스트용 가짜 객체도 같은 메서드를 구현하면 됩니다.
+    """
+
+    def __init__(self, token, tenant_id: str, web_lb: dict, launch_spec: dict, region_code: str = "kr1", quota=None):
+        """
+        :param token: 인증 토큰 (문자열 또는 ClientContext)
+        :param tenant_id: 테넌트 ID
+        :param web_lb: loadbalancer.create_web_load_balancer의 반환값
+        :param launch_spec: 인스턴스 생성 설정
+                            {"key_name", "image_ref", "flavor_ref", "security_group_names", "user_data", "volume_size"(선택)}
+        :param region_code: 리전 코드
+        :param quota: quota.QuotaTracker (지정하면 쿼터에 들어가는 만큼만 확장)
+        """
+        self.ctx = as_context(token)
+        self.tenant_id = tenant_id
+        self.web_lb = web_lb
+        self.launch_spec = launch_spec
+        self.region_code = region_code
+        self.quota = quota
+
+    def launch(self, names):
+        """
+        인스턴스를 생성해 풀에 등록합니다.
+
+        :param names: 생성할 인스턴스 이름의 리스트
+        :return: 풀에 등록까지 끝난 서버의 리스트 ([{"name", "instance_id", "port_id", "address"}, ...])
+        """
+        spec = self.launch_spec
+        fleet = launch_fleet_members(
+            self.ctx, self.tenant_id, self.web_lb, list(names), spec["key_name"], spec["image_ref"], spec["flavor_ref"],
+            spec["security_group_names"], spec["user_data"], spec.get("volume_size", 30), self.region_code,
+            quota=self.quota
+        )
+        members = fleet["members"]
+        registered = set(members["added"]) | set(members["existing"]) if members else set()
+        orphans = [server for server in fleet["active"] if server["address"] not in registered]
+        if orphans:
+            # 풀에 등록하지 못한 인스턴스는 트래픽을 받지 못하므로 바로 정리
+            print(f"❗ 풀 등록에 실패한 인스턴스 {len(orphans)}개를 삭제합니다.")
+            for server in orphans:
+                delete_instance(self.ctx, self.tenant_id, server["instance_id"], self.region_code)
+        return [server for server in fleet["active"] if server["address"] in registered]
+
+    def remove(self, servers):
+        """
+        서버를 풀에서 제거한 뒤 인스턴스를 삭제합니다.
+
+        :param servers: 제거할 서버의 리스트 (launch의 반환 항목)
+        :return: 삭제된 인스턴스 ID의 리스트
+        """
+        return remove_fleet_members(self.ctx, self.tenant_id, self.web_lb, list(servers), region_code=self.region_code)["deleted"]
+
+class AutoscalingController:
+    """
+    주기적으로 플릿을 측정하고(observe) 정책에 따라 확장/축소(step)하는 컨트롤러입니다.
+
+    서버는 {"instance_id", "address"} 등을 가진 dict이며, probe_key로 지정한 키의 주소로 프로브합니다.
+    (컨트롤러가 VPC 안에서 실행되면 사설 IP인 "address", 밖에서 실행되면 서버마다 Floating IP를 넣고 그 키를 지정)
+    """
+
+    def __init__(self, fleet, servers=(), policy: dict = None, name_prefix: str = "web-as", probe_key: str = "address", clock=time.monotonic, on_event=None):
+        """
+        :param fleet: launch(names)와 remove(servers)를 가진 객체 (예: LoadBalancerFleet)
+        :param servers: 이미 실행 중인 서버의 리스트 (워밍업 없이 바로 측정에 포함)
+        :param policy: DEFAULT_AUTOSCALE_POLICY 중 바꿀 값만 담은 dict
+        :param name_prefix: 새 인스턴스 이름 접두사
+        :param probe_key: 서버 dict에서 프로브할 주소를 담은 키
+        :param clock: 현재 시각(초)을 돌려주는 함수 (테스트에서 시간을 제어할 때 교체)
+        :param on_event: 확장/축소할 때마다 {"action", "delta", "reason", "size", "p99_ms", "error_rate"}로 호출되는 함수
+        """
+        self.fleet = fleet
+        self.policy = {**DEFAULT_AUTOSCALE_POLICY, **(policy or {})}
+        if self.policy["min_size"] > self.policy["max_size"]:
+            raise ValueError("min_size는 max_size보다 클 수 없습니다.")
+        self.name_prefix = name_prefix
+        self.probe_key = probe_key
+        self.clock = clock
+        self.on_event = on_event
+        now = clock()
+        self.servers = [dict(server, launched_at=now, warm=True) for server in servers]
+        self.samples = []  # (측정 시각, 성공 여부, 지연 시간 ms)
+        self.last_scale_out = self.last_scale_in = float("-inf")
+        self._names = itertools.count(1)
+        self._stop = threading.Event()
+
+    @property
+    def size(self):
+        return len(self.servers)
+
+    def observe(self):
+        """
+        모든 서버에 프로브를 보내 측정 구간에 결과를 추가합니다.
+        워밍업 중인 서버는 성공하면 그때부터 측정에 포함하고, 워밍업 시간이 지나면 실패도 포함합니다.
+
+        :return: 이번에 측정 구간에 추가한 측정 수
+        """
+        policy = self.policy
+        results = sample_fleet(
+            [server[self.probe_key] for server in self.servers], policy["samples_per_server"],
+            policy["probe_port"], policy["probe_path"], policy["probe_timeout"], policy["max_concurrency"]
+        )
+        now = self.clock()
+        by_host = {}
+        for host, ok, latency_ms in results:
+            by_host.setdefault(host, []).append((ok, latency_ms))
+
+        added = 0
+        for server in self.servers:
+            probes = by_host.get(server[self.probe_key], [])
+            if not server["warm"]:
+                if any(ok for ok, _ in probes) or now - server["launched_at"] >= policy["warmup_seconds"]:
+                    server["warm"] = True
+                else:
+                    continue
+            self.samples.extend((now, ok, latency_ms) for ok, latency_ms in probes)
+            added += len(probes)
+
+        cutoff = now - policy["window_seconds"]
+        self.samples = [sample for sample in self.samples if sample[0] >= cutoff]
+        return added
+
+    def metrics(self):
+        """
+        현재 측정 구간의 지표를 계산합니다.
+
+        :return: {"samples", "p99_ms", "error_rate", "size", "warming"} (측정이 없으면 p99_ms와 error_rate는 None)
+        """
+        latencies = [latency for _, _, latency in self.samples]
+        errors = sum(1 for _, ok, _ in self.samples if not ok)
+        return {
+            "samples": len(self.samples),
+            "p99_ms": percentile(latencies, 99),
+            "error_rate": errors / len(self.samples) if self.samples else None,
+            "size": self.size,
+            "warming": sum(1 for server in self.servers if not server["warm"]),
+        }
+
+    def scale_out(self, count: int):
+        """
+        인스턴스를 count개 생성해 플릿에 추가합니다.
+
+        :return: 추가된 서버의 리스트
+        """
+        names = [f"{self.name_prefix}-{int(time.time())}-{next(self._names)}" for _ in range(count)]
+        print(f"🚀 인스턴스 {count}개를 추가합니다: {', '.join(names)}")
+        launched = self.fleet.launch(names) or []
+        now = self.clock()
+        self.servers.extend(dict(server, launched_at=now, warm=False) for server in launched)
+        if len(launched) < count:
+            print(f"❗ 인스턴스 {count}개 중 {len(launched)}개만 추가되었습니다.")
+        return launched
+
+    def scale_in(self, count: int):
+        """
+        가장 최근에 추가한 인스턴스부터 count개를 플릿에서 제거하고 삭제합니다.
+
+        :return: 삭제된 인스턴스 ID의 리스트
+        """
+        victims = self.servers[-count:]
+        print(f"🔻 인스턴스 {count}개를 제거합니다: {', '.join(s.get('name', s['instance_id']) for s in victims)}")
+        deleted = set(self.fleet.remove(victims) or [])
+        self.servers = [server for server in self.servers if server["instance_id"] not in deleted]
+        if len(deleted) < len(victims):
+            print(f"❗ 인스턴스 {len(victims)}개 중 {len(deleted)}개만 삭제되었습니다. 나머지는 다음 주기에 다시 판단합니다.")
+        return list(deleted)
+
+    def step(self):
+        """
+        한 주기를 실행합니다: 측정 → 판단 → 확장/축소.
+        확장/축소를 시도하면 측정 구간을 비웁니다. (이전 용량에서 측정한 값으로 다시 판단하지 않도록)
+
+        :return: {"delta", "reason", "metrics"}
+        """
+        self.observe()
+        metrics = self.metrics()
+        now = self.clock()
+        delta, reason = decide_scaling(
+            self.size, metrics["p99_ms"], metrics["error_rate"], metrics["samples"], self.policy,
+            now - self.last_scale_out, now - max(self.last_scale_out, self.last_scale_in)
+        )
+        if delta > 0:
+            self.last_scale_out = now
+            self.scale_out(delta)
+        elif delta < 0:
+            self.last_scale_in = now
+            self.scale_in(-delta)
+        if delta:
+            self.samples = []
+            if self.on_event:
+                self.on_event({
+                    "action": "scale_out" if delta > 0 else "scale_in", "delta": delta, "reason": reason,
+                    "size": self.size, "p99_ms": metrics["p99_ms"], "error_rate": metrics["error_rate"],
+                })
+        return {"delta": delta, "reason": reason, "metrics": metrics}
+
+    def run(self, max_steps: int = None):
+        """
+        stop()이 호출되거나 max_steps 주기를 실행할 때까지 interval마다 step()을 실행합니다.
+        한 주기에서 발생한 예외는 출력하고 다음 주기에 계속합니다.
+
+        :param max_steps: 실행할 최대 주기 수 (None이면 무제한)
+        """
+        print(f"✅ 자동 확장을 시작합니다. (인스턴스 {self.size}개, 범위 {self.policy['min_size']}~{self.policy['max_size']})")
+        steps = 0
+        while not self._stop.is_set() and (max_steps is None or steps < max_steps):
+            started = time.monotonic()
+            try:
+                result = self.step()
+                m = result["metrics"]
+                p99 = f"{m['p99_ms']:.0f}ms" if m["p99_ms"] is not None else "-"
+                errors = f"{m['error_rate']:.1%}" if m["error_rate"] is not None else "-"
+                print(f"📈 인스턴스 {self.size}개 (워밍업 {m['warming']}), p99 {p99}, 오류율 {errors}: {result['reason']}")
+            except Exception as e:
+                print(f"🚨 자동 확장 주기 실행 중 오류 발생: {e}")
+            steps += 1
+            if max_steps is not None and steps >= max_steps:
+                break
+            self._stop.wait(max(0.0, self.policy["interval"] - (time.monotonic() - started)))
+        print("✅ 자동 확장을 종료했습니다.")
+
+    def stop(self):
+        """run() 루프를 다음 주기 전에 종료합니다."""
+        self._stop.set()
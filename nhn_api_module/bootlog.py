@@ -0,0 +1,173 @@
+# nhn_api_module/bootlog.py
+
+"""
+인스턴스 콘솔 로그를 이어서 읽어(tail) cloud-init(User Data) 완료/실패를 빠르게 감지하는 모듈입니다.
+- 콘솔 로그의 마지막 N줄만 조회하고, 이전에 읽은 줄과 겹치는 위치를 찾아 새 줄만 처리
+- cloud-init 완료/실패 표시가 나타나는 즉시 반환 (인스턴스가 ACTIVE가 된 뒤에도 몇 분 걸리는 User Data 결과를 바로 확인)
+- 여러 인스턴스를 동시에 추적
+
+사용 예시:
+    results = wait_for_cloud_init(ctx, tenant_id, [instance_id_1, instance_id_2], "kr1")
+    failed = [iid for iid, r in results.items() if r["status"] != "finished"]
+"""
+
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .client import as_context
+from .compute import get_console_output
+
+# cloud-init이 모든 단계를 마쳤을 때 출력하는 줄 (예: "Cloud-init v. 23.1 finished at ... Up 45.2 seconds")
+CLOUD_INIT_FINISHED_PATTERNS = (
+    re.compile(r"Cloud-init v\. \S+ finished at"),
+)
+
+# User Data 스크립트나 cloud-init 모듈이 실패했을 때 출력하는 줄
+CLOUD_INIT_FAILED_PATTERNS = (
+    re.compile(r"Failed to run module scripts[-_]user"),
+    re.compile(r"Failed running /var/lib/cloud/instance/scripts/"),
+    re.compile(r"Running module \S+ .* failed"),
+    re.compile(r"cloud-init\[\d+\]: .*Traceback \(most recent call last\)"),
+)
+
+class ConsoleTail:
+    """
+    콘솔 로그를 여러 번 조회하면서 새로 추가된 줄만 돌려줍니다.
+
+    콘솔 로그 API는 오프셋을 받지 않고 "마지막 N줄"만 돌려주므로, 이전에 읽은 마지막 몇 줄(anchor)이
+    새 조회 결과의 어디에 있는지 찾아 그 뒤의 줄만 새 줄로 봅니다. 조회한 범위 안에서 anchor를 찾지 못하면
+    (그 사이에 로그가 많이 쌓였으면) 조회 줄 수를 두 배로 늘려 다시 조회합니다.
+    아직 줄바꿈으로 끝나지 않은 마지막 줄은 다음 조회까지 처리하지 않습니다.
+    """
+
+    def __init__(self, token, tenant_id: str, instance_id: str, region_code: str = "kr1", window: int = 200, max_window: int = 6400, anchor_lines: int = 20):
+        """
+        :param token: 인증 토큰 (문자열 또는 ClientContext)
+        :param tenant_id: 테넌트 ID
+        :param instance_id: 인스턴스 ID
+        :param region_code: 리전 코드
+        :param window: 한 번에 조회할 마지막 줄 수 (처음 값)
+        :param max_window: 조회 줄 수 상한 (넘으면 전체 로그를 조회)
+        :param anchor_lines: 겹치는 위치를 찾을 때 비교할 이전 줄 수
+        """
+        self.ctx = as_context(token)
+        self.tenant_id = tenant_id
+        self.instance_id = instance_id
+        self.region_code = region_code
+        self.window = window
+        self.max_window = max_window
+        self.anchor_lines = anchor_lines
+        self.line_count = 0   # 지금까지 처리한 줄 수 (줄 오프셋)
+        self._anchor = []     # 마지막으로 처리한 줄들
+
+    def _fetch(self, length):
+        output = get_console_output(self.ctx, self.tenant_id, self.instance_id, length, self.region_code)
+        if output is None:
+            return None
+        lines = output.split("\n")
+        lines.pop()  # 줄바꿈으로 끝나지 않은 마지막 줄(또는 빈 문자열)은 다음 조회에서 처리
+        return lines
+
+    def _find_new(self, lines):
+        """(내부 함수) anchor 바로 다음 줄의 위치를 찾습니다. 찾지 못하면 None을 반환합니다."""
+        if not self._anchor:
+            return 0
+        size = len(self._anchor)
+        for end in range(len(lines), size - 1, -1):
+            if lines[end - size:end] == self._anchor:
+                return end
+        return None
+
+    def poll(self):
+        """
+        콘솔 로그를 조회해 새 줄을 반환합니다.
+
+        :return: 새 줄의 리스트 (없으면 빈 리스트), 조회 실패 시 None
+        """
+        length = self.window
+        while True:
+            lines = self._fetch(length)
+            if lines is None:
+                return None
+            start = self._find_new(lines)
+            if start is not None:
+                break
+            if length is None or len(lines) < length:
+                # 전체 로그 안에도 이전 줄이 없으면 로그가 초기화된 것(재부팅 등)으로 보고 처음부터 다시 읽습니다.
+                start = 0
+                break
+            length = length * 2 if length * 2 <= self.max_window else None
+
+        # 다음 조회도 이번에 필요했던 크기에서 시작합니다.
+        if length is not None:
+            self.window = max(self.window, length)
+        new_lines = lines[start:]
+        if new_lines:
+            self.line_count += len(new_lines)
+            self._anchor = (self._anchor + new_lines)[-self.anchor_lines:]
+        return new_lines
+
+def _match_marker(line: str):
+    if any(p.search(line) for p in CLOUD_INIT_FAILED_PATTERNS):
+        return "failed"
+    if any(p.search(line) for p in CLOUD_INIT_FINISHED_PATTERNS):
+        return "finished"
+    return None
+
+def wait_for_cloud_init(token, tenant_id: str, instance_ids, region_code: str = "kr1", timeout_seconds: int = 900, poll_interval: float = 5, max_workers: int = 16, on_line=None, on_result=None):
+    """
+    여러 인스턴스의 콘솔 로그를 동시에 이어서 읽어, 각 인스턴스에서 cloud-init 완료 또는 실패 표시가 나타나면 바로 결과를 확정합니다.
+    모든 인스턴스의 결과가 확정되거나 타임아웃되면 반환합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param tenant_id: 테넌트 ID
+    :param instance_ids: 인스턴스 ID 리스트 (하나만 추적할 때도 리스트로 전달)
+    :param region_code: 리전 코드
+    :param timeout_seconds: 최대 대기 시간 (초, 인스턴스 전체 기준)
+    :param poll_interval: 콘솔 로그 조회 간격 (초)
+    :param max_workers: 동시에 조회할 최대 인스턴스 수
+    :param on_line: 새 줄마다 호출할 콜백 on_line(인스턴스 ID, 줄) (선택, 로그 스트리밍용)
+    :param on_result: 인스턴스 결과가 확정되는 즉시 호출할 콜백 on_result(인스턴스 ID, 결과 dict) (선택)
+    :return: {인스턴스 ID: {"status": "finished" | "failed" | "timeout", "marker": 표시 줄 또는 None,
+                            "elapsed": 초, "lines": 읽은 줄 수}}
+    """
+    ctx = as_context(token)
+    tails = {iid: ConsoleTail(ctx, tenant_id, iid, region_code) for iid in instance_ids}
+    results = {}
+    started = time.time()
+
+    def settle(instance_id, status, marker):
+        results[instance_id] = {
+            "status": status,
+            "marker": marker,
+            "elapsed": round(time.time() - started, 1),
+            "lines": tails[instance_id].line_count,
+        }
+        if status == "finished":
+            print(f"✅ [{instance_id}] cloud-init 완료 ({results[instance_id]['elapsed']}초)")
+        else:
+            print(f"❌ [{instance_id}] cloud-init {'실패' if status == 'failed' else '타임아웃'}: {marker or '-'}")
+        if on_result:
+            on_result(instance_id, results[instance_id])
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while True:
+            pending = [iid for iid in tails if iid not in results]
+            for instance_id, new_lines in zip(pending, executor.map(lambda iid: tails[iid].poll(), pending)):
+                for line in new_lines or []:
+                    if on_line:
+                        on_line(instance_id, line)
+                    status = _match_marker(line)
+                    if status:
+                        settle(instance_id, status, line.strip())
+                        break
+
+            pending = [iid for iid in tails if iid not in results]
+            if not pending:
+                return results
+            if time.time() - started + poll_interval > timeout_seconds:
+                for instance_id in pending:
+                    settle(instance_id, "timeout", None)
+                return results
+            time.sleep(poll_interval)
@@ -0,0 +1,260 @@
+# nhn_api_module/cidr.py
+
+"""
+VPC/서브넷 CIDR을 겹치지 않게 자동으로 할당하는 모듈입니다.
+- 이미 사용 중인 VPC/서브넷 대역 로드 (list_vpcs, list_vpc_subnets, get_vpc_details)
+- 요청한 프리픽스 길이의 빈 블록 할당/반납 (버디 할당, 프리픽스 길이별 힙)
+- 여러 스레드에서 동시에 할당해도 같은 대역이 두 번 나가지 않음
+
+사용 예시:
+    vpc_allocator = load_vpc_allocator(ctx, "10.0.0.0/8", "kr1")
+    vpc_cidr = vpc_allocator.allocate(16)        # 예: "10.1.0.0/16"
+    subnet_allocator = CidrAllocator(vpc_cidr)
+    subnet_cidr = subnet_allocator.allocate(24)  # 예: "10.1.0.0/24"
+"""
+
+import heapq
+import ipaddress
+import threading
+
+from .networking import list_vpcs, list_vpc_subnets, get_vpc_details
+
+class CidrAllocator:
+    """
+    하나의 상위 대역(pool) 안에서 겹치지 않는 CIDR 블록을 할당하는 버디 할당기입니다.
+
+    빈 공간은 프리픽스 길이별 힙(주소 오름차순)으로 관리합니다. 할당은 요청한 크기 이상인 가장 작은 빈 블록을
+    꺼내 반으로 쪼개 가며(남는 절반은 빈 블록으로 반환) 찾고, 반납하면 짝(buddy) 블록과 다시 합칩니다.
+    프리픽스 길이는 최대 32(IPv4)가지이므로 할당/반납은 빈 블록 수 n에 대해 O(log n)입니다.
+    """
+
+    def __init__(self, pool: str = "10.0.0.0/8", reserved=()):
+        """
+        :param pool: 할당에 사용할 상위 대역 (예: "10.0.0.0/8", 서브넷 할당 시에는 VPC CIDR)
+        :param reserved: 이미 사용 중이라 할당하면 안 되는 CIDR 목록
+        """
+        self.pool = ipaddress.ip_network(pool, strict=False)
+        self._lock = threading.Lock()
+        self._heaps = {p: [] for p in range(self.pool.prefixlen, self.pool.max_prefixlen + 1)}
+        self._free = set()       # {(프리픽스 길이, 네트워크 주소 정수)}, 힙의 지연 삭제 판단용
+        self._allocated = {}     # {(프리픽스 길이, 네트워크 주소 정수): "allocated" 또는 "reserved"}
+        self._push(self.pool.prefixlen, int(self.pool.network_address))
+        for cidr in reserved:
+            self.reserve(cidr)
+
+    # --- 내부 자료구조 ---
+
+    def _size(self, prefixlen):
+        return 1 << (self.pool.max_prefixlen - prefixlen)
+
+    def _push(self, prefixlen, address):
+        heapq.heappush(self._heaps[prefixlen], address)
+        self._free.add((prefixlen, address))
+
+    def _pop(self, prefixlen):
+        heap = self._heaps[prefixlen]
+        while heap:
+            address = heapq.heappop(heap)
+            if (prefixlen, address) in self._free:
+                self._free.discard((prefixlen, address))
+                return address
+        return None
+
+    def _network(self, prefixlen, address):
+        return ipaddress.ip_network((address, prefixlen))
+
+    def _clip(self, cidr):
+        """(내부 함수) CIDR을 pool 범위로 자릅니다. pool과 겹치지 않으면 None을 반환합니다."""
+        network = ipaddress.ip_network(cidr, strict=False)
+        if network.version != self.pool.version or not network.overlaps(self.pool):
+            return None
+        return self.pool if network.supernet_of(self.pool) else network
+
+    # --- 공개 메서드 ---
+
+    def allocate(self, prefixlen: int):
+        """
+        요청한 프리픽스 길이의 빈 블록을 할당합니다. (가장 작은 빈 블록 중 주소가 가장 낮은 곳)
+
+        :param prefixlen: 할당할 블록의 프리픽스 길이 (예: VPC는 16, 서브넷은 24)
+        :return: 성공 시 할당된 CIDR 문자열, 빈 공간이 없으면 None
+        """
+        if not self.pool.prefixlen <= prefixlen <= self.pool.max_prefixlen:
+            raise ValueError(f"프리픽스 길이는 {self.pool.prefixlen}~{self.pool.max_prefixlen} 사이여야 합니다: /{prefixlen} (대역: {self.pool})")
+
+        with self._lock:
+            for p in range(prefixlen, self.pool.prefixlen - 1, -1):
+                address = self._pop(p)
+                if address is None:
+                    continue
+                # 요청한 크기가 될 때까지 반으로 쪼개고, 위쪽 절반은 빈 블록으로 돌려놓습니다.
+                while p < prefixlen:
+                    p += 1
+                    self._push(p, address + self._size(p))
+                self._allocated[(prefixlen, address)] = "allocated"
+                return str(self._network(prefixlen, address))
+
+        print(f"❗ 대역 {self.pool} 안에 할당할 수 있는 /{prefixlen} 블록이 없습니다.")
+        return None
+
+    def reserve(self, cidr: str):
+        """
+        이미 사용 중인 CIDR을 할당 대상에서 제외합니다. pool 밖의 대역은 무시합니다.
+        (기존 VPC/서브넷 대역 로드에 사용하며, 서로 겹치는 대역을 여러 번 예약해도 됩니다.)
+        예약한 대역이 allocate()로 할당한 블록을 포함하거나 그 안에 있으면 그 블록이 예약으로 바뀌어,
+        나중에 release()해도 빈 블록으로 돌아가지 않습니다.
+
+        :param cidr: 사용 중인 CIDR (예: "10.0.0.0/16")
+        :return: pool과 겹쳐 예약되었으면 True, pool 밖이면 False
+
+        >>> allocator = CidrAllocator("10.0.0.0/16")
+        >>> block = allocator.allocate(24)
+        >>> allocator.reserve("10.0.0.0/20")
+        True
+        >>> allocator.release(block)
+        False
+        >>> allocator.allocate(24)
+        '10.0.16.0/24'
+        >>> vpc = allocator.allocate(20)
+        >>> allocator.reserve("10.0.36.0/24")
+        True
+        >>> allocator.release(vpc)
+        False
+        >>> allocator.is_free("10.0.36.0/24")
+        False
+        """
+        network = self._clip(cidr)
+        if network is None:
+            return False
+        target = int(network.network_address)
+
+        with self._lock:
+            self._allocated[(network.prefixlen, target)] = "reserved"
+            # 예약할 대역을 포함하는 빈 블록이 있으면 그 블록을 대역 크기까지 쪼갭니다.
+            for p in range(network.prefixlen, self.pool.prefixlen - 1, -1):
+                base = target & ~(self._size(p) - 1)
+                if (p, base) not in self._free:
+                    continue
+                self._free.discard((p, base))
+                while p < network.prefixlen:
+                    p += 1
+                    half = self._size(p)
+                    if target >= base + half:
+                        self._push(p, base)
+                        base += half
+                    else:
+                        self._push(p, base + half)
+                return True
+
+            # 이미 예약/할당된 대역 안쪽(예: 예약된 VPC 안의 서브넷)이면 빈 블록이 없습니다.
+            # 할당된 블록 안쪽이면 그 블록을 예약으로 바꿔, 반납되더라도 예약한 대역이 빈 블록으로 돌아가지 않게 합니다.
+            for p in range(network.prefixlen - 1, self.pool.prefixlen - 1, -1):
+                ancestor = (p, target & ~(self._size(p) - 1))
+                if ancestor in self._allocated:
+                    self._allocated[ancestor] = "reserved"
+                    return True
+
+            # 대역 안쪽이 이미 여러 조각으로 나뉘어 있으면 안쪽의 빈 블록을 모두 제거하고,
+            # 안쪽에 할당된 블록은 예약으로 바꿔 반납되더라도 빈 블록으로 돌아가지 않게 합니다.
+            end = target + network.num_addresses
+            for p, address in list(self._free):
+                if p > network.prefixlen and target <= address < end:
+                    self._free.discard((p, address))
+            for (p, address), kind in list(self._allocated.items()):
+                if kind == "allocated" and p > network.prefixlen and target <= address < end:
+                    self._allocated[(p, address)] = "reserved"
+        return True
+
+    def release(self, cidr: str):
+        """
+        allocate()로 할당했던 블록을 반납합니다. 짝(buddy) 블록이 비어 있으면 합쳐서 큰 블록으로 되돌립니다.
+
+        :param cidr: allocate()가 반환한 CIDR
+        :return: 반납했으면 True, allocate()로 할당한 블록이 아니거나 그 뒤 예약된 대역에 포함되면 False
+        """
+        network = ipaddress.ip_network(cidr, strict=False)
+        p, address = network.prefixlen, int(network.network_address)
+
+        with self._lock:
+            if self._allocated.get((p, address)) != "allocated":
+                return False
+            del self._allocated[(p, address)]
+            # 상위 대역이 예약되어 있으면 그 안의 블록은 빈 블록이 아니므로 돌려놓지 않습니다.
+            if any((q, address & ~(self._size(q) - 1)) in self._allocated for q in range(p - 1, self.pool.prefixlen - 1, -1)):
+                return True
+            while p > self.pool.prefixlen:
+                buddy = address ^ self._size(p)
+                if (p, buddy) not in self._free:
+                    break
+                self._free.discard((p, buddy))
+                address = min(address, buddy)
+                p -= 1
+            self._push(p, address)
+        return True
+
+    def is_free(self, cidr: str):
+        """CIDR 전체가 비어 있어 할당 가능한지 확인합니다."""
+        network = self._clip(cidr)
+        if network is None or network != ipaddress.ip_network(cidr, strict=False):
+            return False
+        target = int(network.network_address)
+        with self._lock:
+            return any(
+                (p, target & ~(self._size(p) - 1)) in self._free
+                for p in range(network.prefixlen, self.pool.prefixlen - 1, -1)
+            )
+
+    def used(self):
+        """할당/예약된 CIDR 목록을 주소 순으로 반환합니다."""
+        with self._lock:
+            keys = sorted(self._allocated, key=lambda k: (k[1], k[0]))
+        return [str(self._network(p, address)) for p, address in keys]
+
+    def free_blocks(self):
+        """빈 블록 목록을 주소 순으로 반환합니다."""
+        with self._lock:
+            keys = sorted(self._free, key=lambda k: (k[1], k[0]))
+        return [str(self._network(p, address)) for p, address in keys]
+
+def load_vpc_allocator(token, pool: str = "10.0.0.0/8", region_code: str = "kr1"):
+    """
+    프로젝트의 기존 VPC/서브넷 대역을 예약한 VPC CIDR 할당기를 만듭니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param pool: VPC CIDR을 할당할 상위 대역
+    :param region_code: 리전 코드
+    :return: 성공 시 CidrAllocator, 목록 조회 실패 시 None
+    """
+    vpcs = list_vpcs(token, region_code)
+    subnets = list_vpc_subnets(token, region_code)
+    if vpcs is None or subnets is None:
+        return None
+
+    allocator = CidrAllocator(pool)
+    for vpc in vpcs:
+        if vpc.get('cidrv4') and not vpc.get('router:external'):
+            allocator.reserve(vpc['cidrv4'])
+    for subnet in subnets:
+        if subnet.get('cidr') and not subnet.get('router:external'):
+            allocator.reserve(subnet['cidr'])
+    print(f"✅ VPC CIDR 할당기 준비 완료: {pool}, 사용 중 {len(allocator.used())}개 (Region: {region_code})")
+    return allocator
+
+def load_subnet_allocator(token, vpc_id: str, region_code: str = "kr1"):
+    """
+    VPC의 기존 서브넷 대역을 예약한 서브넷 CIDR 할당기를 만듭니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param vpc_id: 서브넷을 만들 VPC의 ID
+    :param region_code: 리전 코드
+    :return: 성공 시 CidrAllocator, 조회 실패 시 None
+    """
+    vpc = get_vpc_details(token, vpc_id, region_code)
+    if not vpc or not vpc.get('cidrv4'):
+        return None
+    return CidrAllocator(vpc['cidrv4'], [s['cidr'] for s in vpc.get('subnets', []) if s.get('cidr')])
+
+if __name__ == "__main__":
+    # 할당/예약/반납 동작을 docstring 예제로 확인합니다: python -m nhn_api_module.cidr
+    import doctest
+    doctest.testmod(verbose=False)
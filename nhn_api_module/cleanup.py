@@ -0,0 +1,310 @@
+# nhn_api_module/cleanup.py
+
+"""
+실패한 프로비저닝 등으로 남겨진(고아) 리소스를 찾아 정리하는 모듈입니다.
+- 포트에 연결되지 않은 Floating IP
+- 어떤 포트도 사용하지 않는 보안 그룹
+- 인스턴스, 로드 밸런서 등 어떤 포트도 없는 VPC (서브넷, 게이트웨이 연결 포함)
+- 어떤 라우팅 테이블에도 연결되지 않은 인터넷 게이트웨이
+- 이름 접두사/생성 후 경과 시간 정책에 맞는 인스턴스
+
+기본값은 드라이런(dry run)이며, 삭제는 의존 관계 순서대로 단계별 병렬로 실행합니다.
+
+사용 예시 (명령행):
+    python -m nhn_api_module.cleanup --region kr1 --prefix my-python --min-age-hours 1          # 드라이런
+    python -m nhn_api_module.cleanup --region kr1 --prefix my-python --min-age-hours 1 --apply  # 실제 삭제
+"""
+
+import argparse
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from .auth import get_token, parse_datetime
+from .client import as_context, create_client_context
+from .compute import list_instances, delete_instance, wait_for_instance_deleted
+from .networking import (
+    list_ports,
+    list_floating_ips,
+    delete_floating_ip,
+    list_vpcs,
+    list_vpc_subnets,
+    delete_vpc_subnet,
+    delete_vpc,
+    list_routing_tables,
+    detach_gateway_from_routing_table,
+    list_internet_gateways,
+    delete_internet_gateway,
+)
+from .security import list_security_groups, delete_security_group
+
+# 정리 대상 리소스 종류 (삭제 순서)
+RESOURCE_KINDS = ("instances", "floating_ips", "security_groups", "vpcs", "internet_gateways")
+
+# 생성 후 이 시간(초)이 지나지 않은 리소스는 진행 중인 프로비저닝의 것일 수 있으므로 기본적으로 정리하지 않습니다.
+DEFAULT_MIN_AGE_SECONDS = 3600
+
+# 이름이 이 목록에 있는 보안 그룹/VPC는 사용 중이 아니어도 정리하지 않습니다.
+PROTECTED_NAMES = ("default", "Default Network")
+
+def _age_seconds(resource: dict):
+    """(내부 함수) 리소스의 생성 후 경과 시간(초)을 반환합니다. 생성 시각을 알 수 없으면 None."""
+    created = resource.get('created_at') or resource.get('created') or resource.get('create_time')
+    if not created:
+        return None
+    try:
+        created_at = parse_datetime(created)
+    except ValueError:
+        return None
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    return (datetime.now(timezone.utc) - created_at).total_seconds()
+
+def _matches_policy(resource: dict, name_prefix: str, min_age_seconds: float, named: bool = True):
+    """
+    (내부 함수) 이름 접두사/경과 시간 정책에 맞는지 확인합니다.
+    min_age_seconds가 지정되었는데 생성 시각을 알 수 없는 리소스는 안전을 위해 제외합니다.
+    """
+    if named and name_prefix and not (resource.get('name') or '').startswith(name_prefix):
+        return False
+    if min_age_seconds:
+        age = _age_seconds(resource)
+        if age is None or age < min_age_seconds:
+            return False
+    return True
+
+def find_orphans(token, tenant_id: str, region_code: str = "kr1", name_prefix: str = None, min_age_seconds: float = DEFAULT_MIN_AGE_SECONDS, kinds=RESOURCE_KINDS):
+    """
+    테넌트의 리소스 목록을 병렬로 조회해 정리 대상(고아 리소스)을 찾습니다. API로 삭제하지는 않습니다.
+
+    - instances: name_prefix를 지정한 경우에만, 이름이 접두사로 시작하는 인스턴스
+    - floating_ips: 포트에 연결되지 않았거나, 정리 대상 인스턴스에 연결된 Floating IP
+                    (이름이 없으므로 name_prefix를 지정하면 정리 대상 인스턴스에 연결된 것만)
+    - security_groups: 정리 대상 인스턴스 외에 사용하는 포트가 없는 보안 그룹
+    - vpcs: 정리 대상 인스턴스의 포트와 VPC 자신의 라우터/DHCP 포트(network:*) 외에 포트가 없는 VPC (외부 네트워크 제외)
+    - internet_gateways: 라우팅 테이블에 연결되지 않았거나, 정리 대상 VPC의 라우팅 테이블에만 연결된 게이트웨이
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param tenant_id: 테넌트 ID
+    :param region_code: 리전 코드
+    :param name_prefix: 이 접두사로 시작하는 이름의 리소스만 대상 (None이면 이름 제한 없음)
+    :param min_age_seconds: 생성 후 이 시간(초)이 지난 리소스만 대상 (0이면 제한 없음, 기본 1시간)
+    :param kinds: 찾을 리소스 종류 (RESOURCE_KINDS의 부분 집합)
+    :return: 성공 시 {종류: [{"id", "name", "reason", ...}, ...]} dict, 목록 조회 실패 시 None
+    """
+    ctx = as_context(token)
+    listings = {
+        "instances": lambda: list_instances(ctx, tenant_id, region_code),
+        "ports": lambda: list_ports(ctx, region_code),
+        "floating_ips": lambda: list_floating_ips(ctx, region_code),
+        "security_groups": lambda: list_security_groups(ctx, region_code),
+        "vpcs": lambda: list_vpcs(ctx, region_code),
+        "subnets": lambda: list_vpc_subnets(ctx, region_code),
+        "routing_tables": lambda: list_routing_tables(ctx, region_code),
+        "internet_gateways": lambda: list_internet_gateways(ctx, region_code),
+    }
+    with ThreadPoolExecutor(max_workers=len(listings)) as executor:
+        futures = {name: executor.submit(fetch) for name, fetch in listings.items()}
+        data = {name: future.result() for name, future in futures.items()}
+    failed = [name for name, items in data.items() if items is None]
+    if failed:
+        print(f"❗ 리소스 목록 조회에 실패해 정리 대상을 찾지 못했습니다: {', '.join(failed)}")
+        return None
+
+    plan = {kind: [] for kind in RESOURCE_KINDS}
+
+    # 1) 인스턴스: 접두사를 명시한 경우에만 대상으로 삼습니다.
+    if "instances" in kinds and name_prefix:
+        for server in data["instances"]:
+            if _matches_policy(server, name_prefix, min_age_seconds):
+                plan["instances"].append({"id": server['id'], "name": server.get('name'), "reason": f"이름 접두사 '{name_prefix}'", "status": server.get('status')})
+    doomed_devices = {item["id"] for item in plan["instances"]}
+
+    # 정리 대상 인스턴스의 포트는 곧 사라지므로 '사용 중'으로 보지 않습니다.
+    live_ports = [port for port in data["ports"] if port.get('device_id') not in doomed_devices]
+    live_port_ids = {port['id'] for port in live_ports}
+
+    # 2) Floating IP
+    if "floating_ips" in kinds:
+        doomed_port_ids = {port['id'] for port in data["ports"] if port.get('device_id') in doomed_devices}
+        for fip in data["floating_ips"]:
+            if fip.get('port_id') in live_port_ids or not _matches_policy(fip, None, min_age_seconds, named=False):
+                continue
+            # Floating IP는 이름이 없으므로, 접두사를 지정하면 정리 대상 인스턴스에 연결된 것만 정리합니다.
+            if name_prefix and fip.get('port_id') not in doomed_port_ids:
+                continue
+            reason = "포트 미연결" if not fip.get('port_id') else "정리 대상 인스턴스에 연결됨"
+            plan["floating_ips"].append({"id": fip['id'], "name": fip.get('floating_ip_address'), "reason": reason})
+
+    # 3) 보안 그룹
+    if "security_groups" in kinds:
+        used_groups = {sg_id for port in live_ports for sg_id in port.get('security_groups', [])}
+        for sg in data["security_groups"]:
+            if sg['id'] in used_groups or sg.get('name') in PROTECTED_NAMES or not _matches_policy(sg, name_prefix, min_age_seconds):
+                continue
+            plan["security_groups"].append({"id": sg['id'], "name": sg.get('name'), "reason": "사용하는 포트 없음"})
+
+    # 4) VPC (서브넷, 라우팅 테이블의 게이트웨이 연결을 함께 정리)
+    doomed_gateways = set()
+    if "vpcs" in kinds:
+        # VPC 자신의 라우터/DHCP 포트(network:*)를 제외한 포트가 하나라도 있으면 사용 중 (인스턴스, 로드 밸런서 VIP 등)
+        busy_vpcs = {port.get('network_id') for port in live_ports if not (port.get('device_owner') or '').startswith('network:')}
+        for vpc in data["vpcs"]:
+            if vpc.get('router:external') or vpc['id'] in busy_vpcs or vpc.get('name') in PROTECTED_NAMES:
+                continue
+            if not _matches_policy(vpc, name_prefix, min_age_seconds):
+                continue
+            tables = [t for t in data["routing_tables"] if vpc['id'] in _routing_table_vpc_ids(t)]
+            gateways = sorted({t['gateway_id'] for t in tables if t.get('gateway_id')})
+            doomed_gateways.update(gateways)
+            plan["vpcs"].append({
+                "id": vpc['id'],
+                "name": vpc.get('name'),
+                "reason": "사용하는 포트 없음",
+                "subnet_ids": [s['id'] for s in data["subnets"] if s.get('vpc_id') == vpc['id']],
+                "routing_table_ids": [t['id'] for t in tables if t.get('gateway_id')],
+                "gateway_ids": gateways,
+            })
+
+    # 5) 인터넷 게이트웨이
+    if "internet_gateways" in kinds:
+        doomed_vpcs = {item["id"] for item in plan["vpcs"]}
+        for igw in data["internet_gateways"]:
+            users = [t for t in data["routing_tables"] if t.get('gateway_id') == igw['id']]
+            if any(not _routing_table_vpc_ids(t) <= doomed_vpcs or not _routing_table_vpc_ids(t) for t in users):
+                continue
+            if not _matches_policy(igw, name_prefix, min_age_seconds):
+                continue
+            reason = "라우팅 테이블 미연결" if not users else "정리 대상 VPC에만 연결됨"
+            plan["internet_gateways"].append({"id": igw['id'], "name": igw.get('name'), "reason": reason})
+        # VPC 정리 과정에서 연결이 해제될 게이트웨이도 정책에 맞는 경우에만 삭제합니다.
+        planned = {item["id"] for item in plan["internet_gateways"]}
+        for vpc in plan["vpcs"]:
+            vpc["gateway_ids"] = [g for g in vpc["gateway_ids"] if g in planned]
+
+    return plan
+
+def _routing_table_vpc_ids(table: dict):
+    """(내부 함수) 라우팅 테이블이 속한 VPC ID 집합을 반환합니다."""
+    vpc_ids = {v.get('id') for v in table.get('vpcs', []) if isinstance(v, dict)}
+    if table.get('vpc_id'):
+        vpc_ids.add(table['vpc_id'])
+    return vpc_ids
+
+def print_cleanup_plan(plan: dict, region_code: str = "kr1"):
+    """정리 대상 목록(드라이런 보고서)을 출력합니다."""
+    total = sum(len(items) for items in plan.values())
+    print(f"--- 정리 대상 리소스 {total}개 (Region: {region_code}) ---")
+    for kind in RESOURCE_KINDS:
+        for item in plan.get(kind, []):
+            print(f" - [{kind}] {item.get('name') or '-'} ({item['id']}): {item['reason']}")
+
+def collect_orphans(token, tenant_id: str, region_code: str = "kr1", name_prefix: str = None, min_age_seconds: float = DEFAULT_MIN_AGE_SECONDS, kinds=RESOURCE_KINDS, dry_run: bool = True, max_workers: int = 8):
+    """
+    고아 리소스를 찾아 정리합니다. dry_run이 True(기본값)이면 대상만 보고하고 삭제하지 않습니다.
+
+    삭제는 의존 관계 순서대로 단계별로 진행하며, 각 단계 안에서는 병렬로 요청합니다.
+    1. 인스턴스 삭제 후 완전히 사라질 때까지 대기
+    2. Floating IP, 보안 그룹, VPC(게이트웨이 연결 해제 -> 서브넷 삭제 -> VPC 삭제)
+    3. 인터넷 게이트웨이
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param tenant_id: 테넌트 ID
+    :param region_code: 리전 코드
+    :param name_prefix: 이 접두사로 시작하는 이름의 리소스만 대상
+    :param min_age_seconds: 생성 후 이 시간(초)이 지난 리소스만 대상 (기본 1시간, 진행 중인 프로비저닝 보호)
+    :param kinds: 정리할 리소스 종류
+    :param dry_run: True이면 삭제하지 않고 보고만 함
+    :param max_workers: 동시에 보낼 최대 삭제 요청 수
+    :return: 성공 시 {"plan": 정리 대상, "deleted": {종류: [ID, ...]}, "failed": {종류: [ID, ...]}, "dry_run": bool},
+             목록 조회 실패 시 None
+    """
+    ctx = as_context(token)
+    plan = find_orphans(ctx, tenant_id, region_code, name_prefix, min_age_seconds, kinds)
+    if plan is None:
+        return None
+    print_cleanup_plan(plan, region_code)
+
+    result = {"plan": plan, "deleted": {kind: [] for kind in RESOURCE_KINDS}, "failed": {kind: [] for kind in RESOURCE_KINDS}, "dry_run": dry_run}
+    if dry_run:
+        print("(드라이런: 삭제하지 않았습니다. 실제로 삭제하려면 dry_run=False로 실행하세요.)")
+        return result
+
+    def run_stage(tasks):
+        # tasks: [(종류, ID, 삭제 함수)]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            outcomes = list(executor.map(lambda task: task[2](), tasks))
+        for (kind, resource_id, _), ok in zip(tasks, outcomes):
+            result["deleted" if ok else "failed"][kind].append(resource_id)
+
+    def delete_and_wait(instance_id):
+        return delete_instance(ctx, tenant_id, instance_id, region_code) and wait_for_instance_deleted(ctx, tenant_id, instance_id, region_code)
+
+    def teardown_vpc(vpc):
+        for table_id in vpc["routing_table_ids"]:
+            if not detach_gateway_from_routing_table(ctx, table_id, region_code):
+                return False
+        for subnet_id in vpc["subnet_ids"]:
+            if not delete_vpc_subnet(ctx, subnet_id, region_code):
+                return False
+        return delete_vpc(ctx, vpc["id"], region_code)
+
+    run_stage([("instances", item["id"], lambda i=item["id"]: delete_and_wait(i)) for item in plan["instances"]])
+    run_stage(
+        [("floating_ips", item["id"], lambda i=item["id"]: delete_floating_ip(ctx, i, region_code)) for item in plan["floating_ips"]]
+        + [("security_groups", item["id"], lambda i=item["id"]: delete_security_group(ctx, i, region_code)) for item in plan["security_groups"]]
+        + [("vpcs", item["id"], lambda v=item: teardown_vpc(v)) for item in plan["vpcs"]]
+    )
+    # VPC 정리에 실패했다면 그 VPC의 게이트웨이는 아직 연결되어 있으므로 건너뜁니다.
+    kept_gateways = {g for item in plan["vpcs"] if item["id"] in result["failed"]["vpcs"] for g in item["gateway_ids"]}
+    run_stage([
+        ("internet_gateways", item["id"], lambda i=item["id"]: delete_internet_gateway(ctx, i, region_code))
+        for item in plan["internet_gateways"] if item["id"] not in kept_gateways
+    ])
+
+    deleted = sum(len(ids) for ids in result["deleted"].values())
+    failed = sum(len(ids) for ids in result["failed"].values())
+    print(f"--- 정리 완료: 삭제 {deleted}개, 실패 {failed}개 (Region: {region_code}) ---")
+    return result
+
+def cleanup_sweep(ctx, tenant: dict, regions: list = None, name_prefix: str = None, min_age_seconds: float = DEFAULT_MIN_AGE_SECONDS, dry_run: bool = True):
+    """
+    멀티 테넌트 실행기(tenants.run_across_tenants)용 작업 함수입니다. 리전별로 collect_orphans를 실행합니다.
+
+    :return: {리전 코드: {"planned": {종류: 개수}, "deleted": {종류: [ID, ...]}, "failed": {종류: [ID, ...]}}}
+    """
+    summary = {}
+    for region_code in regions or tenant.get("regions") or ["kr1"]:
+        result = collect_orphans(ctx, ctx.tenant_id, region_code, name_prefix, min_age_seconds, dry_run=dry_run)
+        if result is None:
+            raise RuntimeError(f"리전 {region_code}의 리소스 목록 조회에 실패했습니다.")
+        summary[region_code] = {
+            "planned": {kind: len(items) for kind, items in result["plan"].items()},
+            "deleted": result["deleted"],
+            "failed": result["failed"],
+        }
+    return summary
+
+if __name__ == "__main__":
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(description="고아 리소스(Floating IP, 보안 그룹, VPC, 인터넷 게이트웨이 등)를 찾아 정리합니다.")
+    parser.add_argument("--region", default="kr1", help="리전 코드")
+    parser.add_argument("--prefix", default=None, help="이 접두사로 시작하는 이름의 리소스만 정리 (인스턴스는 접두사를 지정해야 정리)")
+    parser.add_argument("--min-age-hours", type=float, default=DEFAULT_MIN_AGE_SECONDS / 3600, help="생성 후 이 시간이 지난 리소스만 정리 (0이면 제한 없음)")
+    parser.add_argument("--kinds", default=",".join(RESOURCE_KINDS), help="정리할 리소스 종류 (쉼표로 구분)")
+    parser.add_argument("--apply", action="store_true", help="실제로 삭제 (생략 시 드라이런)")
+    parser.add_argument("--output", default=None, help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    token_data = get_token()
+    if token_data:
+        result = collect_orphans(
+            create_client_context(token_data), os.getenv("TENANT_ID"), args.region, args.prefix,
+            args.min_age_hours * 3600, tuple(args.kinds.split(",")), dry_run=not args.apply
+        )
+        if result and args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(result, f, indent=4, ensure_ascii=False)
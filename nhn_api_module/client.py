@@ -0,0 +1,176 @@
+# nhn_api_module/client.py
+
+"""
+NHN Cloud API 호출에 공통으로 필요한 정보를 한 번만 구성해 재사용하는 모듈입니다.
+- 서비스 카탈로그 기반 엔드포인트 해석 (서비스/리전별)
+- 공통 헤더와 토큰
+- 연결 풀을 공유하는 HTTP 세션 (동일한 조회 요청 합치기, HTTP/1.1 또는 HTTP/2 전송)
+
+모든 API 함수는 `token` 자리에 문자열 토큰 대신 ClientContext를 받을 수 있습니다.
+"""
+
+import os
+import threading
+from urllib.parse import urlsplit
+
+from .coalesce import CoalescingSession
+from .transport import create_transport
+
+# 서비스 카탈로그에 없거나 카탈로그 없이 토큰만 받은 경우 사용하는 기본 엔드포인트입니다.
+DEFAULT_ENDPOINTS = {
+    "identity": "https://api-identity-infrastructure.nhncloudservice.com",
+    "compute": "https://{region}-api-instance-infrastructure.nhncloudservice.com",
+    "network": "https://{region}-api-network-infrastructure.nhncloudservice.com",
+    "image": "https://{region}-api-image-infrastructure.nhncloudservice.com",
+    "object-store": "https://{region}-api-object-storage.nhncloudservice.com",
+}
+
+# 서비스 카탈로그의 type 값 -> 이 패키지에서 사용하는 서비스 이름
+CATALOG_SERVICE_TYPES = {
+    "identity": "identity",
+    "compute": "compute",
+    "network": "network",
+    "image": "image",
+    "object-store": "object-store",
+}
+
+# 엔드포인트를 환경 변수로 덮어쓸 때 사용하는 접두사 (예: NHN_API_ENDPOINT_NETWORK=http://127.0.0.1:8080)
+ENDPOINT_ENV_PREFIX = "NHN_API_ENDPOINT_"
+
+# 한 컨텍스트에서 호스트별로 유지할 최대 연결 수
+DEFAULT_POOL_MAXSIZE = 32
+
+# 기본 전송 방식 ("http1" 또는 "http2", transport.py 참고)
+DEFAULT_TRANSPORT = os.getenv("NHN_API_TRANSPORT", "http1")
+
+class ClientContext:
+    """
+    토큰, 테넌트 ID, 서비스별 엔드포인트, 공통 헤더, HTTP 세션을 묶어 둔 컨텍스트입니다.
+    create_client_context()로 만들고, 모든 API 함수의 `token` 인자로 전달합니다.
+    """
+
+    def __init__(self, token: str, tenant_id: str = None, endpoints: dict = None, endpoint_overrides: dict = None, session=None, read_cache_ttl: float = 0.0, transport: str = None):
+        """
+        :param token: 인증 토큰 ID
+        :param tenant_id: 테넌트 ID
+        :param endpoints: {(서비스, 리전 코드): 기본 URL} 형태의 해석된 엔드포인트
+        :param endpoint_overrides: 엔드포인트 강제 지정 dict.
+                                   {서비스: URL} 또는 {(서비스, 리전 코드): URL}, URL에는 {region}을 쓸 수 있음
+        :param session: 공유할 HTTP 세션 (기본값: new_session()으로 만든 세션)
+        :param read_cache_ttl: session을 새로 만들 때, 성공한 GET 응답을 재사용할 시간 (초)
+        :param transport: session을 새로 만들 때 사용할 전송 방식 ("http1" 또는 "http2")
+        """
+        self.token = token
+        self.tenant_id = tenant_id
+        self.endpoints = dict(endpoints or {})
+        self.endpoint_overrides = dict(endpoint_overrides or {})
+        self.headers = {
+            "X-Auth-Token": token,
+            "Content-Type": "application/json"
+        }
+        self.session = session if session is not None else new_session(read_cache_ttl=read_cache_ttl, transport=transport)
+
+    def endpoint(self, service: str, region_code: str = "kr1"):
+        """
+        서비스/리전의 기본 URL을 반환합니다.
+        우선순위: endpoint_overrides -> 환경 변수 -> 서비스 카탈로그 -> 기본값
+        """
+        region_code = region_code.lower()
+        base = (
+            self.endpoint_overrides.get((service, region_code))
+            or self.endpoint_overrides.get(service)
+            or os.getenv(ENDPOINT_ENV_PREFIX + service.upper().replace('-', '_'))
+            or self.endpoints.get((service, region_code))
+            or DEFAULT_ENDPOINTS.get(service)
+        )
+        if not base:
+            raise KeyError(f"알 수 없는 서비스입니다: {service}")
+        return base.format(region=region_code).rstrip('/')
+
+    def url(self, service: str, path: str, region_code: str = "kr1"):
+        """서비스/리전의 기본 URL 뒤에 path를 붙인 전체 URL을 반환합니다."""
+        return self.endpoint(service, region_code) + path
+
+def new_session(pool_maxsize: int = DEFAULT_POOL_MAXSIZE, coalesce_reads: bool = True, read_cache_ttl: float = 0.0, transport: str = None):
+    """
+    API 호출에 사용할 세션을 만듭니다.
+    coalesce_reads가 True이면 동시에 들어온 동일한 GET 요청을 하나로 합치는 CoalescingSession으로 감쌉니다.
+
+    :param pool_maxsize: 최대 연결 수 (http1은 호스트별, http2는 전체)
+    :param coalesce_reads: 동일한 GET 요청 합치기 여부
+    :param read_cache_ttl: 성공한 GET 응답을 재사용할 시간 (초, 0이면 진행 중인 요청만 공유)
+    :param transport: 전송 방식 ("http1" 또는 "http2", 기본값: 환경 변수 NHN_API_TRANSPORT 또는 "http1")
+    :return: 전송 계층 세션 또는 이를 감싼 CoalescingSession
+    """
+    session = create_transport(transport or DEFAULT_TRANSPORT, pool_maxsize)
+    if coalesce_reads:
+        return CoalescingSession(session, read_cache_ttl)
+    return session
+
+def parse_service_catalog(service_catalog: list):
+    """
+    토큰 응답의 serviceCatalog를 {(서비스, 리전 코드): 기본 URL} dict로 변환합니다.
+    publicURL의 경로(/v2/{tenantId} 등)는 각 API 함수가 붙이므로 scheme과 host만 사용합니다.
+
+    :param service_catalog: access.serviceCatalog 리스트
+    :return: 해석된 엔드포인트 dict
+    """
+    endpoints = {}
+    for service in service_catalog or []:
+        service_name = CATALOG_SERVICE_TYPES.get(service.get('type'))
+        if not service_name:
+            continue
+        for ep in service.get('endpoints', []):
+            public_url = ep.get('publicURL')
+            region = ep.get('region')
+            if not public_url or not region:
+                continue
+            parts = urlsplit(public_url)
+            endpoints[(service_name, region.lower())] = f"{parts.scheme}://{parts.netloc}"
+    return endpoints
+
+def create_client_context(token_data: dict, tenant_id: str = None, endpoint_overrides: dict = None, session=None, read_cache_ttl: float = 0.0, transport: str = None):
+    """
+    get_token()의 반환값으로 ClientContext를 만듭니다.
+
+    :param token_data: get_token()이 반환한 토큰 정보 dict (service_catalog 포함 시 엔드포인트를 해석)
+    :param tenant_id: 테넌트 ID (생략 시 환경 변수 TENANT_ID)
+    :param endpoint_overrides: 엔드포인트 강제 지정 dict (로컬 대체 서버 등)
+    :param session: 공유할 HTTP 세션
+    :param read_cache_ttl: 성공한 GET 응답을 재사용할 시간 (초, 0이면 진행 중인 요청만 공유)
+    :param transport: 전송 방식 ("http1" 또는 "http2")
+    :return: ClientContext
+    """
+    return ClientContext(
+        token_data["token_id"],
+        tenant_id or os.getenv("TENANT_ID"),
+        parse_service_catalog(token_data.get("service_catalog")),
+        endpoint_overrides,
+        session,
+        read_cache_ttl,
+        transport,
+    )
+
+_MAX_TOKEN_CONTEXTS = 16
+_token_contexts = {}
+_token_contexts_lock = threading.Lock()
+
+def as_context(token):
+    """
+    ClientContext는 그대로, 문자열 토큰은 토큰별로 한 번 만든 기본 컨텍스트로 변환합니다.
+    문자열 토큰을 넘기던 기존 호출도 세션과 헤더를 재사용하게 됩니다.
+
+    :param token: 문자열 토큰 또는 ClientContext
+    :return: ClientContext
+    """
+    if isinstance(token, ClientContext):
+        return token
+    with _token_contexts_lock:
+        ctx = _token_contexts.get(token)
+        if ctx is None:
+            ctx = ClientContext(token)
+            _token_contexts[token] = ctx
+            # 만료된 옛 토큰의 컨텍스트가 쌓이지 않도록 오래된 것부터 버립니다.
+            while len(_token_contexts) > _MAX_TOKEN_CONTEXTS:
+                _token_contexts.pop(next(iter(_token_contexts)))
+        return ctx
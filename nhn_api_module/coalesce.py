@@ -0,0 +1,119 @@
+# nhn_api_module/coalesce.py
+
+"""
+동시에 들어온 동일한 조회(GET) 요청을 하나의 HTTP 요청으로 합치는 세션 래퍼입니다.
+- 진행 중인(in-flight) 동일 요청 공유
+- 선택적인 짧은 결과 재사용 (TTL)
+- 쓰기(POST/PUT/PATCH/DELETE) 전후로 세대(generation)를 올려, 쓰기가 끝난 뒤 시작한 GET은 그 전에 시작한 GET과 합치지 않음
+"""
+
+import threading
+import time
+from concurrent.futures import Future
+
+class CoalescingSession:
+    """
+    requests.Session과 같은 인터페이스를 가진 세션을 감싸, 동일한 GET 요청을 합칩니다.
+
+    같은 URL/토큰/쿼리의 GET 요청이 이미 진행 중이면 새로 보내지 않고 그 결과를 함께 받습니다.
+    result_ttl이 0보다 크면 성공한 응답을 그 시간(초) 동안 재사용하며,
+    POST/PUT/PATCH/DELETE 요청을 보내기 전과 끝난 뒤에 세대를 올리며, 세대가 다른 GET은 공유하지 않으므로
+    쓰기가 끝난 뒤 보낸 GET은 항상 쓰기 이후의 상태를 받습니다. (read-after-write 보장)
+    """
+
+    def __init__(self, session, result_ttl: float = 0.0):
+        """
+        :param session: 실제 요청을 보낼 세션 (requests.Session 등)
+        :param result_ttl: 성공한 GET 응답을 재사용할 시간 (초, 0이면 진행 중인 요청만 공유)
+        """
+        self.session = session
+        self.result_ttl = result_ttl
+        self.stats = {"sent": 0, "coalesced": 0, "reused": 0}
+        self._lock = threading.Lock()
+        self._inflight = {}
+        self._results = {}
+        self._generation = 0
+
+    def get(self, url, headers=None, **kwargs):
+        """동일한 GET 요청을 합쳐서 보냅니다. 응답 객체는 기다린 호출자 모두가 공유합니다."""
+        # 스트리밍 등 응답 본문을 공유할 수 없는 요청은 그대로 보냅니다.
+        if kwargs.get('stream') or set(kwargs) - {'params', 'timeout'}:
+            return self.session.get(url, headers=headers, **kwargs)
+
+        with self._lock:
+            key = (self._generation, url, (headers or {}).get("X-Auth-Token"), _freeze(kwargs.get('params')))
+            cached = self._results.get(key)
+            if cached and cached[0] > time.monotonic():
+                self.stats["reused"] += 1
+                return cached[1]
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+                self.stats["sent"] += 1
+            else:
+                self.stats["coalesced"] += 1
+
+        if not owner:
+            return future.result()
+
+        try:
+            response = self.session.get(url, headers=headers, **kwargs)
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._inflight.pop(key, None)
+            if self.result_ttl > 0 and response.status_code < 400 and key[0] == self._generation:
+                self._results[key] = (time.monotonic() + self.result_ttl, response)
+        future.set_result(response)
+        return response
+
+    def _write(self, method, url, **kwargs):
+        # 쓰기 도중에 시작한 GET도 쓰기 이전 상태일 수 있으므로 쓰기가 끝난 뒤에도 세대를 올립니다.
+        self.invalidate()
+        try:
+            return getattr(self.session, method)(url, **kwargs)
+        finally:
+            self.invalidate()
+
+    def post(self, url, **kwargs):
+        return self._write("post", url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self._write("put", url, **kwargs)
+
+    def patch(self, url, **kwargs):
+        return self._write("patch", url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self._write("delete", url, **kwargs)
+
+    def read_post(self, url, **kwargs):
+        """상태를 바꾸지 않는 조회용 POST(예: os-getConsoleOutput)를 보냅니다. 재사용 중인 GET 결과와 세대를 그대로 둡니다."""
+        return self.session.post(url, **kwargs)
+
+    def head(self, url, **kwargs):
+        return self.session.head(url, **kwargs)
+
+    def invalidate(self):
+        """재사용 중인 GET 결과를 모두 버리고 세대를 올립니다. 이후의 GET은 진행 중인 이전 세대의 요청과 합쳐지지 않습니다."""
+        with self._lock:
+            self._generation += 1
+            self._results.clear()
+
+    def __getattr__(self, name):
+        # mount(), close() 등 나머지 속성은 감싼 세션으로 넘깁니다.
+        return getattr(self.session, name)
+
+def _freeze(params):
+    """(내부 함수) 쿼리 파라미터를 dict 키로 쓸 수 있는 형태로 바꿉니다."""
+    if not params:
+        return None
+    if isinstance(params, dict):
+        return tuple(sorted((str(k), str(v)) for k, v in params.items()))
+    return tuple(params) if isinstance(params, (list, tuple)) else str(params)
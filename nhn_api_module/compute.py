@@ -11,6 +11,13 @@ import requests
 import json
 import base64
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .client import as_context
+from .networking import create_floating_ip, associate_floating_ip, delete_floating_ip
+from .quota import instance_demand
+from .userdata import MAX_USER_DATA_BYTES
 
 # --- Instance ---
 
@@ -30,7 +37,7 @@ def create_instance(
     """
     인스턴스를 생성합니다.
 
-    :param token: 인증 토큰
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
     :param tenant_id: 테넌트 ID
     :param instance_name: 생성할 인스턴스의 이름
     :param key_name: 사용할 키페어의 이름
@@ -38,20 +45,208 @@ def create_instance(
     :param flavor_ref: 사용할 플레이버의 ID
     :param subnet_id: 연결할 서브넷의 ID
     :param security_group_names: 적용할 보안 그룹 이름의 리스트
-    :param user_data: 인스턴스 시작 시 실행할 스크립트
+    :param user_data: 인스턴스 시작 시 실행할 스크립트(str) 또는 build_user_data로 만든 bytes
     :param volume_size: 부트 볼륨의 크기 (GB)
     :param region_code: 리전 코드
     :return: 성공 시 (인스턴스 ID, 포트 ID) 튜플, 실패 시 (None, None)
     """
-    COMPUTE_API_URL = f"https://{region_code}-api-instance-infrastructure.nhncloudservice.com"
-    url = f"{COMPUTE_API_URL}/v2/{tenant_id}/servers"
+    instance_id = _submit_instance_create(
+        token, tenant_id, instance_name, key_name, image_ref, flavor_ref,
+        subnet_id, security_group_names, user_data, volume_size, region_code
+    )
+    if not instance_id:
+        return None, None
 
-    headers = {
-        "X-Auth-Token": token,
-        "Content-Type": "application/json"
-    }
-    
-    encoded_user_data = base64.b64encode(user_data.encode('utf-8')).decode('utf-8')
+    active_server_info = _wait_for_instance_active(token, tenant_id, instance_id, region_code)
+
+    if active_server_info:
+        port_id = _get_port_id_by_instance(token, instance_id, region_code)
+        if port_id:
+            return instance_id, port_id
+        else:
+            print("🚨 인스턴스 생성 후 포트 ID를 조회하는 데 실패했습니다.")
+            return instance_id, None
+    else:
+        print("🚨 인스턴스가 ACTIVE 상태가 되는 것을 기다리다 타임아웃되었습니다.")
+        return None, None
+
+def launch_instance_with_floating_ip(
+    token: str,
+    tenant_id: str,
+    instance_name: str,
+    key_name: str,
+    image_ref: str,
+    flavor_ref: str,
+    subnet_id: str,
+    security_group_names: list,
+    user_data: str,
+    floating_network_id: str,
+    volume_size: int = 30,
+    region_code: str = "kr1",
+    quota=None
+):
+    """
+    인스턴스를 생성하면서 Floating IP 할당과 연결을 병렬로 진행합니다.
+
+    인스턴스 생성 요청 직후 Floating IP를 할당하고, 인스턴스 빌드 중 포트가 생기는 즉시
+    Floating IP를 연결합니다. 인스턴스가 ACTIVE가 되고 연결까지 끝나면 반환하므로,
+    create_instance 이후 Floating IP를 생성/연결하는 직렬 구간이 사라집니다.
+
+    :param floating_network_id: Floating IP를 할당할 외부 네트워크의 ID
+    :param quota: quota.QuotaTracker (지정하면 생성 요청 전에 인스턴스와 Floating IP 1개분의 쿼터를 예약하고, 여유가 없으면 생성하지 않음)
+    (나머지 매개변수는 create_instance와 동일)
+    :return: 성공 시 (인스턴스 ID, 포트 ID, Floating IP 정보 dict) 튜플,
+             쿼터 부족, 인스턴스 생성 실패 또는 ACTIVE가 되지 못한 경우 (None, None, None) (생성된 인스턴스와 Floating IP는 삭제),
+             포트 조회 또는 Floating IP 연결 실패 시 (인스턴스 ID, 포트 ID 또는 None, None)
+    """
+    reservation = None
+    if quota is not None:
+        flavor = get_flavor(token, tenant_id, flavor_ref, region_code)
+        reservation = quota.reserve(instance_demand(flavor, with_floating_ip=True)) if flavor else None
+        if reservation is None:
+            print(f"🚨 쿼터가 부족하거나 확인하지 못해 인스턴스 '{instance_name}'를 생성하지 않습니다.")
+            return None, None, None
+
+    try:
+        instance_id = _submit_instance_create(
+            token, tenant_id, instance_name, key_name, image_ref, flavor_ref,
+            subnet_id, security_group_names, user_data, volume_size, region_code
+        )
+        if not instance_id:
+            return None, None, None
+
+        # 인스턴스가 ERROR로 끝나면 포트 폴링도 함께 멈춥니다.
+        stop_event = threading.Event()
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            active_future = executor.submit(_wait_for_instance_active, token, tenant_id, instance_id, region_code)
+            active_future.add_done_callback(lambda f: f.result() or stop_event.set())
+            fip_future = executor.submit(create_floating_ip, token, floating_network_id, region_code)
+            port_future = executor.submit(_wait_for_instance_port, token, instance_id, region_code, stop_event=stop_event)
+
+            fip_data = fip_future.result()
+            port = port_future.result()
+            port_id = port.get('id') if port else None
+
+            associated = False
+            if fip_data and port_id:
+                associated = associate_floating_ip(token, fip_data['id'], port_id, region_code)
+
+            active_server_info = active_future.result()
+
+        if not active_server_info:
+            print("🚨 인스턴스가 ACTIVE 상태가 되지 못해 인스턴스를 삭제하고 할당한 Floating IP를 반납합니다.")
+            if fip_data:
+                delete_floating_ip(token, fip_data['id'], region_code)
+            # ERROR 인스턴스의 포트가 남아 있으면 이후 서브넷/VPC 삭제가 실패하므로 완전히 삭제될 때까지 기다립니다.
+            if delete_instance(token, tenant_id, instance_id, region_code):
+                wait_for_instance_deleted(token, tenant_id, instance_id, region_code)
+            return None, None, None
+
+        if not associated:
+            print("🚨 인스턴스는 ACTIVE 상태지만 Floating IP를 연결하지 못했습니다.")
+            if fip_data:
+                delete_floating_ip(token, fip_data['id'], region_code)
+            return instance_id, port_id, None
+
+        return instance_id, port_id, fip_data
+    finally:
+        if reservation:
+            reservation.release()
+
+def launch_fleet(
+    token: str,
+    tenant_id: str,
+    instance_names: list,
+    key_name: str,
+    image_ref: str,
+    flavor_ref: str,
+    subnet_id: str,
+    security_group_names: list,
+    user_data: str,
+    volume_size: int = 30,
+    region_code: str = "kr1",
+    max_workers: int = 16,
+    quota=None,
+    min_count: int = None
+):
+    """
+    같은 설정의 인스턴스 여러 개를 병렬로 생성하고, ACTIVE가 된 인스턴스의 사설 IP를 함께 반환합니다.
+    (Floating IP 없이 로드 밸런서 뒤에 두는 웹 서버 등에 사용)
+
+    :param instance_names: 생성할 인스턴스 이름의 리스트
+    :param max_workers: 동시에 생성할 최대 인스턴스 수
+    :param quota: quota.QuotaTracker (지정하면 생성 요청 전에 쿼터를 확인해 들어가는 개수만 생성하고, 생성하는 동안 예약)
+    :param min_count: quota 사용 시 받아들일 최소 개수 (None이면 1, len(instance_names)이면 전부 또는 전혀 생성하지 않음)
+    (나머지 매개변수는 create_instance와 동일)
+    :return: {"active": [{"name", "instance_id", "port_id", "address"}, ...], "failed": [인스턴스 이름, ...],
+              "rejected": [쿼터 부족으로 생성하지 않은 인스턴스 이름, ...]}
+             (생성 요청은 성공했지만 ACTIVE가 되지 못했거나 포트를 찾지 못한 인스턴스는 삭제하고 failed에 포함합니다.)
+    """
+    def launch(instance_name):
+        instance_id = _submit_instance_create(
+            token, tenant_id, instance_name, key_name, image_ref, flavor_ref,
+            subnet_id, security_group_names, user_data, volume_size, region_code
+        )
+        if not instance_id:
+            return None
+        port = None
+        if _wait_for_instance_active(token, tenant_id, instance_id, region_code):
+            port = _wait_for_instance_port(token, instance_id, region_code, timeout_seconds=60)
+        if not port or not port.get('fixed_ips'):
+            # 쿼터를 계속 차지하지 않도록 쓸 수 없는 인스턴스는 바로 삭제합니다.
+            print(f"❗ 인스턴스 '{instance_name}'({instance_id})를 사용할 수 없어 삭제합니다.")
+            delete_instance(token, tenant_id, instance_id, region_code)
+            return None
+        return {"name": instance_name, "instance_id": instance_id, "port_id": port['id'], "address": port['fixed_ips'][0]['ip_address']}
+
+    result = {"active": [], "failed": [], "rejected": []}
+    reservation = None
+    if quota is not None:
+        flavor = get_flavor(token, tenant_id, flavor_ref, region_code)
+        allowed, reservation = quota.admit(len(instance_names), instance_demand(flavor), min_count or 1) if flavor else (0, None)
+        result["rejected"] = list(instance_names[allowed:])
+        instance_names = list(instance_names[:allowed])
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for instance_name, server in zip(instance_names, executor.map(launch, instance_names)):
+                if server:
+                    result["active"].append(server)
+                else:
+                    result["failed"].append(instance_name)
+    finally:
+        if reservation:
+            reservation.release()
+
+    print(f"--- 인스턴스 {len(instance_names)}개 중 ACTIVE {len(result['active'])}개, 실패 {len(result['failed'])}개 ---")
+    return result
+
+def _submit_instance_create(
+    token: str,
+    tenant_id: str,
+    instance_name: str,
+    key_name: str,
+    image_ref: str,
+    flavor_ref: str,
+    subnet_id: str,
+    security_group_names: list,
+    user_data: str,
+    volume_size: int,
+    region_code: str
+):
+    """
+    (내부 함수) 인스턴스 생성 요청만 보내고 ACTIVE 상태를 기다리지 않습니다.
+    성공 시 인스턴스 ID, 실패 시 None을 반환합니다.
+    """
+    ctx = as_context(token)
+    url = ctx.url("compute", f"/v2/{tenant_id}/servers", region_code)
+
+    # build_user_data로 만든 (gzip 압축된) bytes는 그대로, 문자열 스크립트는 UTF-8로 인코딩합니다.
+    raw_user_data = user_data if isinstance(user_data, bytes) else user_data.encode('utf-8')
+    encoded_user_data = base64.b64encode(raw_user_data).decode('utf-8')
+    if len(encoded_user_data) > MAX_USER_DATA_BYTES:
+        print(f"🚨 User Data 크기가 제한을 초과하여 인스턴스 생성 요청을 보내지 않습니다. ({len(encoded_user_data)} > {MAX_USER_DATA_BYTES} bytes, Base64 기준)")
+        return None
 
     payload = {
         "server": {
@@ -75,54 +270,48 @@ def create_instance(
     }
 
     try:
-        response = requests.post(url, headers=headers, data=json.dumps(payload))
+        response = ctx.session.post(url, headers=ctx.headers, data=json.dumps(payload))
         response.raise_for_status()
 
         server_info = response.json().get('server', {})
         instance_id = server_info.get('id')
         print(f"✅ 인스턴스 생성 요청 성공 (ID: {instance_id})")
         print(" - 상태: BUILDING (ACTIVE 상태가 될 때까지 대기합니다...)")
-        
-        active_server_info = _wait_for_instance_active(token, tenant_id, instance_id, region_code)
-        
-        if active_server_info:
-            port_id = _get_port_id_by_instance(token, instance_id, region_code)
-            if port_id:
-                return instance_id, port_id
-            else:
-                print("🚨 인스턴스 생성 후 포트 ID를 조회하는 데 실패했습니다.")
-                return instance_id, None
-        else:
-            print("🚨 인스턴스가 ACTIVE 상태가 되는 것을 기다리다 타임아웃되었습니다.")
-            return None, None
+        return instance_id
 
     except requests.exceptions.HTTPError as http_err:
         print(f"❗ 인스턴스 생성 중 HTTP 오류 발생: {http_err}")
         print(f"    응답 내용: {http_err.response.text}")
-        return None, None
+        return None
     except Exception as e:
         print(f"❗ 인스턴스 생성 중 예상치 못한 오류 발생: {e}")
-        return None, None
+        return None
 
 def _wait_for_instance_active(token: str, tenant_id: str, instance_id: str, region_code: str, timeout_seconds: int = 600, poll_interval: int = 10):
     """
     (내부 함수) 인스턴스가 ACTIVE 상태가 될 때까지 폴링합니다.
     성공 시 전체 서버 정보 객체를 반환합니다.
     """
-    COMPUTE_API_URL = f"https://{region_code}-api-instance-infrastructure.nhncloudservice.com"
-    url = f"{COMPUTE_API_URL}/v2/{tenant_id}/servers/{instance_id}"
-    headers = {"X-Auth-Token": token}
+    return _wait_for_instance_status(token, tenant_id, instance_id, region_code, "ACTIVE", timeout_seconds, poll_interval)
+
+def _wait_for_instance_status(token: str, tenant_id: str, instance_id: str, region_code: str, target_status: str, timeout_seconds: int = 600, poll_interval: int = 10):
+    """
+    (내부 함수) 인스턴스가 target_status 상태가 될 때까지 폴링합니다.
+    성공 시 전체 서버 정보 객체를, ERROR 상태가 되거나 타임아웃되면 None을 반환합니다.
+    """
+    ctx = as_context(token)
+    url = ctx.url("compute", f"/v2/{tenant_id}/servers/{instance_id}", region_code)
     
     start_time = time.time()
     while time.time() - start_time < timeout_seconds:
         try:
-            response = requests.get(url, headers=headers)
+            response = ctx.session.get(url, headers=ctx.headers)
             response.raise_for_status()
             server_info = response.json().get('server', {})
             server_status = server_info.get('status')
             
-            if server_status == 'ACTIVE':
-                print("✅ 인스턴스가 ACTIVE 상태가 되었습니다.")
+            if server_status == target_status:
+                print(f"✅ 인스턴스가 {target_status} 상태가 되었습니다.")
                 return server_info
             elif server_status == 'ERROR':
                 print(f"❌ 인스턴스 생성 중 오류 발생. 상태: {server_status}")
@@ -139,19 +328,141 @@ def _wait_for_instance_active(token: str, tenant_id: str, instance_id: str, regi
             print(f"❗ 인스턴스 상태 조회 중 오류 발생: {e}")
             return None
             
-    print(f"❌ 인스턴스가 {timeout_seconds}초 안에 ACTIVE 상태가 되지 않아 타임아웃되었습니다.")
+    print(f"❌ 인스턴스가 {timeout_seconds}초 안에 {target_status} 상태가 되지 않아 타임아웃되었습니다.")
     return None
 
+def delete_instance(token: str, tenant_id: str, instance_id: str, region_code: str = "kr1"):
+    """
+    인스턴스를 삭제합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param tenant_id: 테넌트 ID
+    :param instance_id: 삭제할 인스턴스의 ID
+    :param region_code: 리전 코드
+    :return: 성공 시 True, 실패 시 False
+    """
+    ctx = as_context(token)
+    url = ctx.url("compute", f"/v2/{tenant_id}/servers/{instance_id}", region_code)
+
+    try:
+        response = ctx.session.delete(url, headers=ctx.headers)
+        response.raise_for_status()
+
+        print(f"✅ 인스턴스 '{instance_id}' 삭제 요청 성공")
+        return True
+
+    except requests.exceptions.HTTPError as http_err:
+        print(f"❗ 인스턴스 삭제 중 HTTP 오류 발생: {http_err}")
+        print(f"    응답 내용: {http_err.response.text}")
+        return False
+    except Exception as e:
+        print(f"❗ 인스턴스 삭제 중 예상치 못한 오류 발생: {e}")
+        return False
+
+def wait_for_instance_deleted(token: str, tenant_id: str, instance_id: str, region_code: str = "kr1", timeout_seconds: int = 300, poll_interval: int = 5):
+    """
+    삭제 요청한 인스턴스가 완전히 사라질 때까지(조회 시 404) 폴링합니다.
+    인스턴스의 포트가 정리된 뒤에야 보안 그룹/서브넷/VPC를 삭제할 수 있으므로 정리 작업에서 사용합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param tenant_id: 테넌트 ID
+    :param instance_id: 삭제를 기다릴 인스턴스의 ID
+    :param region_code: 리전 코드
+    :param timeout_seconds: 최대 대기 시간 (초)
+    :param poll_interval: 상태 확인 간격 (초)
+    :return: 삭제가 확인되면 True, 타임아웃 또는 오류 시 False
+    """
+    ctx = as_context(token)
+    url = ctx.url("compute", f"/v2/{tenant_id}/servers/{instance_id}", region_code)
+
+    start_time = time.time()
+    while time.time() - start_time < timeout_seconds:
+        try:
+            response = ctx.session.get(url, headers=ctx.headers)
+            if response.status_code == 404:
+                print(f"✅ 인스턴스 '{instance_id}' 삭제 완료")
+                return True
+            response.raise_for_status()
+            if response.json().get('server', {}).get('status') == 'ERROR':
+                print(f"❌ 인스턴스 '{instance_id}' 삭제 중 오류 상태가 되었습니다.")
+                return False
+        except requests.exceptions.HTTPError as http_err:
+            print(f"❗ 인스턴스 상태 조회 중 HTTP 오류 발생: {http_err}")
+        except Exception as e:
+            print(f"❗ 인스턴스 상태 조회 중 오류 발생: {e}")
+            return False
+        time.sleep(poll_interval)
+
+    print(f"❌ 인스턴스 '{instance_id}'가 {timeout_seconds}초 안에 삭제되지 않았습니다.")
+    return False
+
+def list_instances(token: str, tenant_id: str, region_code: str = "kr1"):
+    """
+    인스턴스 목록을 상세 정보와 함께 조회합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param tenant_id: 테넌트 ID
+    :param region_code: 리전 코드
+    :return: 성공 시 서버 정보 dict의 리스트, 실패 시 None
+    """
+    ctx = as_context(token)
+    url = ctx.url("compute", f"/v2/{tenant_id}/servers/detail", region_code)
+
+    try:
+        response = ctx.session.get(url, headers=ctx.headers)
+        response.raise_for_status()
+
+        servers = response.json().get('servers', [])
+        print(f"✅ 인스턴스 목록 조회 성공: {len(servers)}개 (Region: {region_code})")
+        return servers
+
+    except requests.exceptions.HTTPError as http_err:
+        print(f"❗ 인스턴스 목록 조회 중 HTTP 오류 발생: {http_err}")
+        print(f"    응답 내용: {http_err.response.text}")
+        return None
+    except Exception as e:
+        print(f"❗ 인스턴스 목록 조회 중 예상치 못한 오류 발생: {e}")
+        return None
+
+def get_console_output(token: str, tenant_id: str, instance_id: str, length: int = None, region_code: str = "kr1"):
+    """
+    인스턴스의 콘솔 로그(부팅 로그)를 조회합니다. (os-getConsoleOutput)
+    반복 호출(폴링)에 사용되므로 성공 시에는 메시지를 출력하지 않습니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param tenant_id: 테넌트 ID
+    :param instance_id: 인스턴스 ID
+    :param length: 마지막 몇 줄만 조회할지 (생략 시 전체)
+    :param region_code: 리전 코드
+    :return: 성공 시 콘솔 로그 문자열, 실패 시 None
+    """
+    ctx = as_context(token)
+    url = ctx.url("compute", f"/v2/{tenant_id}/servers/{instance_id}/action", region_code)
+    payload = {"os-getConsoleOutput": {"length": length} if length else {}}
+
+    try:
+        # 조회용 action이므로, 합치기 세션이면 GET 결과 캐시를 비우지 않는 read_post로 보냅니다.
+        post = getattr(ctx.session, "read_post", ctx.session.post)
+        response = post(url, headers=ctx.headers, data=json.dumps(payload))
+        response.raise_for_status()
+        return response.json().get('output') or ""
+
+    except requests.exceptions.HTTPError as http_err:
+        print(f"❗ 콘솔 로그 조회 중 HTTP 오류 발생: {http_err}")
+        return None
+    except Exception as e:
+        print(f"❗ 콘솔 로그 조회 중 예상치 못한 오류 발생: {e}")
+        return None
+
 def _get_port_id_by_instance(token, instance_id, region_code="kr1"):
     """
     (내부 함수) 인스턴스 ID를 사용하여 네트워크 포트 ID를 조회합니다.
     """
-    NETWORK_API_URL = f"https://{region_code}-api-network-infrastructure.nhncloudservice.com"
-    url = f"{NETWORK_API_URL}/v2.0/ports?device_id={instance_id}"
-    headers = {"X-Auth-Token": token}
+    ctx = as_context(token)
+    url = ctx.url("network", f"/v2.0/ports?device_id={instance_id}", region_code)
 
     try:
-        response = requests.get(url, headers=headers)
+        response = ctx.session.get(url, headers=ctx.headers)
         response.raise_for_status()
         ports = response.json().get('ports', [])
         
@@ -166,23 +477,56 @@ def _get_port_id_by_instance(token, instance_id, region_code="kr1"):
         print(f"🚨 포트 ID 조회 중 오류 발생: {e}")
         return None
 
+def _wait_for_instance_port(token: str, instance_id: str, region_code: str = "kr1", timeout_seconds: int = 600, poll_interval: int = 2, stop_event: threading.Event = None):
+    """
+    (내부 함수) 인스턴스 빌드 중 네트워크 포트가 생성될 때까지 폴링합니다.
+    포트는 ACTIVE 상태보다 먼저 생기므로, Floating IP 연결을 앞당기는 데 사용합니다.
+    stop_event가 설정되면 즉시 폴링을 중단합니다.
+    성공 시 포트 정보 dict, 실패 시 None을 반환합니다.
+    """
+    ctx = as_context(token)
+    url = ctx.url("network", f"/v2.0/ports?device_id={instance_id}", region_code)
+
+    start_time = time.time()
+    while time.time() - start_time < timeout_seconds:
+        if stop_event is not None and stop_event.is_set():
+            return None
+        try:
+            response = ctx.session.get(url, headers=ctx.headers)
+            response.raise_for_status()
+            ports = response.json().get('ports', [])
+            if ports:
+                print(f"✅ 인스턴스 포트 생성 확인: {ports[0].get('id')}")
+                return ports[0]
+        except requests.exceptions.HTTPError as http_err:
+            print(f"❗ 인스턴스 포트 조회 중 HTTP 오류 발생: {http_err}")
+        except Exception as e:
+            print(f"❗ 인스턴스 포트 조회 중 오류 발생: {e}")
+            return None
+        if stop_event is not None:
+            stop_event.wait(poll_interval)
+        else:
+            time.sleep(poll_interval)
+
+    print(f"❌ 인스턴스 '{instance_id}'의 포트가 {timeout_seconds}초 안에 생성되지 않았습니다.")
+    return None
+
 # --- Flavor ---
 
 def list_flavors(token: str, tenant_id: str, region_code: str = "kr1"):
     """
     인스턴스 타입(플레이버) 목록을 조회합니다.
 
-    :param token: 인증 토큰
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
     :param tenant_id: 테넌트 ID
     :param region_code: 리전 코드
     :return: 성공 시 플레이버 정보(id, name)가 담긴 dict의 리스트, 실패 시 None
     """
-    COMPUTE_API_URL = f"https://{region_code}-api-instance-infrastructure.nhncloudservice.com"
-    url = f"{COMPUTE_API_URL}/v2/{tenant_id}/flavors"
-    headers = {"X-Auth-Token": token}
+    ctx = as_context(token)
+    url = ctx.url("compute", f"/v2/{tenant_id}/flavors", region_code)
 
     try:
-        response = requests.get(url, headers=headers)
+        response = ctx.session.get(url, headers=ctx.headers)
         response.raise_for_status()
 
         flavors_data = response.json().get('flavors', [])
@@ -198,23 +542,50 @@ def list_flavors(token: str, tenant_id: str, region_code: str = "kr1"):
         print(f"❗ 플레이버 목록 조회 중 예상치 못한 오류 발생: {e}")
         return None
 
+def get_flavor(token: str, tenant_id: str, flavor_id: str, region_code: str = "kr1"):
+    """
+    플레이버의 상세 정보(vCPU 수, 메모리 크기)를 조회합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param tenant_id: 테넌트 ID
+    :param flavor_id: 플레이버 ID
+    :param region_code: 리전 코드
+    :return: 성공 시 {"id", "name", "vcpus", "ram"(MB)} dict, 실패 시 None
+    """
+    ctx = as_context(token)
+    url = ctx.url("compute", f"/v2/{tenant_id}/flavors/{flavor_id}", region_code)
+
+    try:
+        response = ctx.session.get(url, headers=ctx.headers)
+        response.raise_for_status()
+
+        flavor = response.json().get('flavor', {})
+        return {"id": flavor.get('id'), "name": flavor.get('name'), "vcpus": flavor.get('vcpus', 0), "ram": flavor.get('ram', 0)}
+
+    except requests.exceptions.HTTPError as http_err:
+        print(f"❗ 플레이버 조회 중 HTTP 오류 발생: {http_err}")
+        print(f"    응답 내용: {http_err.response.text}")
+        return None
+    except Exception as e:
+        print(f"❗ 플레이버 조회 중 예상치 못한 오류 발생: {e}")
+        return None
+
 # --- Key Pair ---
 
 def list_key_pairs(token: str, tenant_id: str, region_code: str = "kr1"):
     """
     키페어 목록을 조회합니다.
 
-    :param token: 인증 토큰
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
     :param tenant_id: 테넌트 ID
     :param region_code: 리전 코드
     :return: 성공 시 키페어 정보(name, fingerprint)가 담긴 dict의 리스트, 실패 시 None
     """
-    COMPUTE_API_URL = f"https://{region_code}-api-compute-infrastructure.nhncloudservice.com"
-    url = f"{COMPUTE_API_URL}/v2/{tenant_id}/os-keypairs"
-    headers = {"X-Auth-Token": token}
+    ctx = as_context(token)
+    url = ctx.url("compute", f"/v2/{tenant_id}/os-keypairs", region_code)
 
     try:
-        response = requests.get(url, headers=headers)
+        response = ctx.session.get(url, headers=ctx.headers)
         response.raise_for_status()
 
         keypairs_data = response.json().get('keypairs', [])
@@ -0,0 +1,239 @@
+# nhn_api_module/export.py
+
+"""
+인스턴스, 포트, Floating IP, 보안 그룹 규칙, VPC 목록을 여러 리전에서 조회해 JSONL 또는 CSV 파일로 내보내는 모듈입니다.
+- 목록을 페이지 단위(limit/marker)로 조회하고, 페이지가 도착하는 대로 파일에 기록 (메모리 사용량이 전체 개수와 무관)
+- 선택적으로 gzip 압축 (페이지마다 gzip 멤버를 이어 붙이므로 중간에 끊겨도 앞부분은 온전함)
+- 페이지를 기록할 때마다 커서(마지막 marker와 파일 크기)를 저장해, 중단된 내보내기를 이어서 실행
+  (이어서 실행할 때 커서 이후에 기록된 불완전한 내용은 잘라내므로 중복/손상 없이 이어짐)
+
+사용 예시 (명령행):
+    python -m nhn_api_module.export --output-dir exports/2026-10-19 --regions kr1,kr2 --format csv --gzip
+    (같은 명령을 다시 실행하면 중단된 곳부터 이어서 내보냄)
+"""
+
+import argparse
+import csv
+import gzip
+import io
+import json
+import os
+
+from .auth import get_token
+from .client import as_context, create_client_context
+
+# 내보낼 수 있는 리소스: (서비스, 목록 경로, 응답 키)
+EXPORT_RESOURCES = {
+    "servers": ("compute", "/v2/{tenant_id}/servers/detail", "servers"),
+    "ports": ("network", "/v2.0/ports", "ports"),
+    "floating_ips": ("network", "/v2.0/floatingips", "floatingips"),
+    "security_group_rules": ("network", "/v2.0/security-group-rules", "security_group_rules"),
+    "vpcs": ("network", "/v2.0/vpcs", "vpcs"),
+}
+
+# CSV로 내보낼 때의 열 (앞에 region 열이 추가되며, dict/list 값은 JSON 문자열로 기록)
+CSV_COLUMNS = {
+    "servers": ["id", "name", "status", "created", "updated", "flavor", "image", "key_name", "addresses", "metadata"],
+    "ports": ["id", "name", "status", "network_id", "device_id", "device_owner", "mac_address", "fixed_ips", "security_groups"],
+    "floating_ips": ["id", "floating_ip_address", "fixed_ip_address", "port_id", "floating_network_id", "status"],
+    "security_group_rules": [
+        "id", "security_group_id", "direction", "ethertype", "protocol",
+        "port_range_min", "port_range_max", "remote_ip_prefix", "remote_group_id",
+    ],
+    "vpcs": ["id", "name", "cidrv4", "state", "shared", "create_time", "subnets", "routingtables"],
+}
+
+# 한 페이지에 요청할 항목 수
+DEFAULT_PAGE_SIZE = 1000
+
+# 출력 디렉터리에 저장하는 커서 파일 이름
+CURSOR_FILE_NAME = "export_cursor.json"
+
+def iter_pages(token, tenant_id: str, resource: str, region_code: str = "kr1", page_size: int = DEFAULT_PAGE_SIZE, marker: str = None):
+    """
+    리소스 목록을 limit/marker 방식으로 한 페이지씩 조회합니다. (조회 실패 시 requests 예외를 그대로 발생)
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param tenant_id: 테넌트 ID
+    :param resource: EXPORT_RESOURCES의 키
+    :param region_code: 리전 코드
+    :param page_size: 한 페이지에 요청할 항목 수
+    :param marker: 이 ID 다음 항목부터 조회 (이어서 조회할 때 사용)
+    :return: (항목 리스트, 마지막 항목 ID) 튜플을 차례로 돌려주는 generator
+    """
+    ctx = as_context(token)
+    service, path, key = EXPORT_RESOURCES[resource]
+    url = ctx.url(service, path.format(tenant_id=tenant_id), region_code)
+
+    previous_last = None
+    while True:
+        params = {"limit": page_size}
+        if marker:
+            params["marker"] = marker
+        response = ctx.session.get(url, headers=ctx.headers, params=params)
+        response.raise_for_status()
+        body = response.json()
+        items = body.get(key, [])
+        if not items:
+            return
+        last = items[-1].get("id")
+        # limit/marker를 무시하는 API는 이미 받은 항목(marker 포함)을 다시 돌려주므로, 기록하기 전에 확인하고 끝냅니다.
+        if marker and (last == previous_last or any(item.get("id") == marker for item in items)):
+            return
+        yield items, last
+        # API가 페이지 크기를 요청보다 작게 제한할 수 있으므로(예: osapi_max_limit) 개수로 끝을 판단하지 않고,
+        # 빈 페이지가 올 때까지 계속 조회합니다. *_links에 next가 없다고 명시된 경우에만 바로 끝냅니다.
+        links = body.get(f"{key}_links")
+        if links is not None and not any(link.get("rel") == "next" for link in links):
+            return
+        if not last or last == marker:
+            return
+        previous_last, marker = last, last
+
+def _csv_value(value):
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return "" if value is None else value
+
+def _encode_page(items, resource: str, region_code: str, fmt: str, write_header: bool):
+    """(내부 함수) 한 페이지의 항목을 JSONL 또는 CSV 바이트열로 변환합니다."""
+    buffer = io.StringIO()
+    if fmt == "csv":
+        writer = csv.writer(buffer)
+        if write_header:
+            writer.writerow(["region"] + CSV_COLUMNS[resource])
+        for item in items:
+            writer.writerow([region_code] + [_csv_value(item.get(column)) for column in CSV_COLUMNS[resource]])
+    else:
+        for item in items:
+            buffer.write(json.dumps({"region": region_code, **item}, ensure_ascii=False))
+            buffer.write("\n")
+    return buffer.getvalue().encode("utf-8")
+
+def _append(path: str, data: bytes, compress: bool):
+    """(내부 함수) 파일 끝에 데이터를 붙이고 디스크에 반영한 뒤 새 파일 크기를 반환합니다."""
+    if compress:
+        data = gzip.compress(data)
+    with open(path, "ab") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+        return f.tell()
+
+def _save_cursor(path: str, cursor: dict):
+    """(내부 함수) 커서를 임시 파일에 쓴 뒤 교체해, 중단되더라도 이전 커서나 새 커서 중 하나가 온전히 남게 합니다."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(cursor, f, indent=2)
+    os.replace(tmp_path, path)
+
+def export_inventory(
+    token,
+    tenant_id: str,
+    output_dir: str,
+    resources=tuple(EXPORT_RESOURCES),
+    regions=("kr1",),
+    fmt: str = "jsonl",
+    compress: bool = False,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    resume: bool = True
+):
+    """
+    리소스 목록을 리전별로 페이지 단위로 조회하면서 리소스별 파일(예: servers.jsonl, ports.csv.gz)에 바로 기록합니다.
+    모든 리전의 항목이 같은 파일에 region 필드/열과 함께 기록됩니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param tenant_id: 테넌트 ID
+    :param output_dir: 결과 파일과 커서 파일을 저장할 디렉터리 (없으면 생성)
+    :param resources: 내보낼 리소스 (EXPORT_RESOURCES의 키)
+    :param regions: 리전 코드 리스트
+    :param fmt: "jsonl" 또는 "csv"
+    :param compress: True이면 gzip 압축 (.gz)
+    :param page_size: 한 페이지에 요청할 항목 수
+    :param resume: True이면 같은 설정으로 중단된 내보내기의 커서부터 이어서 실행, False이면 처음부터 다시 실행
+    :return: {"complete": 모두 끝났는지 여부, "counts": {리소스: {리전: 기록한 항목 수}}, "files": {리소스: 파일 경로}}
+    """
+    if fmt not in ("jsonl", "csv"):
+        raise ValueError("fmt는 'jsonl' 또는 'csv'여야 합니다.")
+    unknown = set(resources) - set(EXPORT_RESOURCES)
+    if unknown:
+        raise ValueError(f"알 수 없는 리소스: {', '.join(sorted(unknown))}")
+
+    ctx = as_context(token)
+    os.makedirs(output_dir, exist_ok=True)
+    cursor_path = os.path.join(output_dir, CURSOR_FILE_NAME)
+    settings = {"format": fmt, "compress": compress, "resources": list(resources), "regions": list(regions)}
+
+    cursor = None
+    if resume and os.path.exists(cursor_path):
+        with open(cursor_path, encoding="utf-8") as f:
+            cursor = json.load(f)
+        if cursor.get("settings") != settings:
+            print("❗ 커서의 설정이 현재 설정과 달라 처음부터 다시 내보냅니다.")
+            cursor = None
+        else:
+            print(f"✅ 커서를 찾았습니다. 중단된 곳부터 이어서 내보냅니다: {cursor_path}")
+
+    extension = f".{fmt}" + (".gz" if compress else "")
+    files = {resource: os.path.join(output_dir, resource + extension) for resource in resources}
+    if cursor is None:
+        cursor = {"settings": settings, "files": {resource: 0 for resource in resources}, "tasks": {}}
+        for path in files.values():
+            open(path, "wb").close()
+        _save_cursor(cursor_path, cursor)
+
+    # 마지막으로 저장한 커서 이후에 기록된 내용(중단 직전의 불완전한 페이지)은 잘라냄
+    for resource, path in files.items():
+        with open(path, "ab") as f:
+            f.truncate(cursor["files"][resource])
+
+    complete = True
+    for resource in resources:
+        for region_code in regions:
+            task_key = f"{resource}/{region_code}"
+            task = cursor["tasks"].setdefault(task_key, {"marker": None, "count": 0, "done": False})
+            if task["done"]:
+                continue
+            try:
+                for items, last in iter_pages(ctx, tenant_id, resource, region_code, page_size, task["marker"]):
+                    data = _encode_page(items, resource, region_code, fmt, write_header=cursor["files"][resource] == 0)
+                    cursor["files"][resource] = _append(files[resource], data, compress)
+                    task["marker"] = last
+                    task["count"] += len(items)
+                    _save_cursor(cursor_path, cursor)
+                task["done"] = True
+                _save_cursor(cursor_path, cursor)
+                print(f"✅ {task_key}: {task['count']}개 내보내기 완료")
+            except Exception as e:
+                complete = False
+                print(f"🚨 {task_key} 내보내기 중 오류 발생 ({task['count']}개까지 기록됨, 다시 실행하면 이어서 진행): {e}")
+
+    counts = {}
+    for task_key, task in cursor["tasks"].items():
+        resource, region_code = task_key.split("/", 1)
+        counts.setdefault(resource, {})[region_code] = task["count"]
+    print(f"--- 내보내기 {'완료' if complete else '중단'}: {output_dir} ---")
+    return {"complete": complete, "counts": counts, "files": files}
+
+if __name__ == "__main__":
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(description="인스턴스/포트/Floating IP/보안 그룹 규칙/VPC 목록을 JSONL 또는 CSV로 내보냅니다.")
+    parser.add_argument("--output-dir", required=True, help="결과 파일과 커서 파일을 저장할 디렉터리")
+    parser.add_argument("--regions", default="kr1", help="리전 코드 (쉼표로 구분)")
+    parser.add_argument("--resources", default=",".join(EXPORT_RESOURCES), help="내보낼 리소스 (쉼표로 구분)")
+    parser.add_argument("--format", choices=("jsonl", "csv"), default="jsonl", help="출력 형식")
+    parser.add_argument("--gzip", action="store_true", help="gzip으로 압축")
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE, help="한 페이지에 요청할 항목 수")
+    parser.add_argument("--restart", action="store_true", help="커서를 무시하고 처음부터 다시 내보내기")
+    args = parser.parse_args()
+
+    token_data = get_token()
+    if token_data:
+        result = export_inventory(
+            create_client_context(token_data), os.getenv("TENANT_ID"), args.output_dir,
+            tuple(args.resources.split(",")), tuple(args.regions.split(",")), args.format,
+            args.gzip, args.page_size, resume=not args.restart
+        )
+        raise SystemExit(0 if result["complete"] else 1)
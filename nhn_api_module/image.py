@@ -0,0 +1,313 @@
+# nhn_api_module/image.py
+
+"""
+NHN Cloud 이미지 관련 API를 호출하는 함수들을 모아놓은 모듈입니다.
+- 이미지 조회
+- 인스턴스로부터 이미지 생성 (createImage)
+- 골든 이미지 베이킹 (User Data 해시 기반 캐시)
+"""
+
+import requests
+import json
+import hashlib
+import os
+import threading
+import time
+from datetime import datetime, timezone
+
+from .auth import project_root
+from .client import as_context
+from .compute import _submit_instance_create, _wait_for_instance_status, delete_instance
+from .userdata import build_user_data
+
+# 베이킹된 이미지 ID를 token.json과 같은 위치에 캐시합니다.
+BAKED_IMAGE_FILE = os.path.join(project_root, "baked_images.json")
+
+# 베이크 키를 이미지 메타데이터에도 남겨, 캐시 파일이 없어도 기존 이미지를 찾을 수 있게 합니다.
+BAKE_KEY_PROPERTY = "nhn_bake_key"
+
+# 템플릿 인스턴스에 베이킹 스크립트를 기록할 경로입니다.
+BAKE_SCRIPT_PATH = "/var/lib/nhn-bake/bake.sh"
+
+# 템플릿 인스턴스에서 실행되는 스크립트입니다. 베이킹 스크립트가 성공했을 때만(set -e)
+# cloud-init 상태를 초기화한 뒤 종료(SHUTOFF)하여 스냅숏 시점을 알립니다.
+# 베이킹 스크립트가 실패하면 인스턴스가 종료되지 않으므로 실패한 상태가 이미지로 만들어지지 않습니다.
+BAKE_FINALIZE_SCRIPT = f"""#!/bin/bash
+set -e
+{BAKE_SCRIPT_PATH}
+rm -f {BAKE_SCRIPT_PATH}
+cloud-init clean --logs || true
+sync
+poweroff
+"""
+
+_cache_lock = threading.Lock()
+
+# --- Image ---
+
+def get_image(token: str, image_id: str, region_code: str = "kr1"):
+    """
+    특정 이미지의 상세 정보를 조회합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param image_id: 조회할 이미지의 ID
+    :param region_code: 리전 코드
+    :return: 성공 시 이미지 정보 dict, 실패 시 None
+    """
+    ctx = as_context(token)
+    url = ctx.url("image", f"/v2/images/{image_id}", region_code)
+
+    try:
+        response = ctx.session.get(url, headers=ctx.headers)
+        response.raise_for_status()
+        return response.json()
+
+    except requests.exceptions.HTTPError as http_err:
+        print(f"❗ 이미지 조회 중 HTTP 오류 발생: {http_err}")
+        print(f"    응답 내용: {http_err.response.text}")
+        return None
+    except Exception as e:
+        print(f"❗ 이미지 조회 중 예상치 못한 오류 발생: {e}")
+        return None
+
+def create_image_from_instance(token: str, tenant_id: str, instance_id: str, image_name: str, metadata: dict = None, region_code: str = "kr1"):
+    """
+    인스턴스로부터 이미지를 생성(createImage)합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param tenant_id: 테넌트 ID
+    :param instance_id: 이미지를 생성할 인스턴스의 ID
+    :param image_name: 생성할 이미지의 이름
+    :param metadata: 이미지에 기록할 메타데이터 dict
+    :param region_code: 리전 코드
+    :return: 성공 시 이미지 ID, 실패 시 None
+    """
+    ctx = as_context(token)
+    url = ctx.url("compute", f"/v2/{tenant_id}/servers/{instance_id}/action", region_code)
+
+
+    payload = {
+        "createImage": {
+            "name": image_name,
+            "metadata": metadata or {}
+        }
+    }
+
+    try:
+        response = ctx.session.post(url, headers=ctx.headers, data=json.dumps(payload))
+        response.raise_for_status()
+
+        # 최신 API는 본문에 image_id를, 이전 버전은 Location 헤더에 이미지 URL을 돌려줍니다.
+        image_id = None
+        if response.content:
+            image_id = response.json().get('image_id')
+        if not image_id:
+            location = response.headers.get('Location', '')
+            image_id = location.rstrip('/').rsplit('/', 1)[-1] or None
+
+        print(f"✅ 이미지 '{image_name}' 생성 요청 성공 (ID: {image_id})")
+        return image_id
+
+    except requests.exceptions.HTTPError as http_err:
+        print(f"❗ 이미지 생성 중 HTTP 오류 발생: {http_err}")
+        print(f"    응답 내용: {http_err.response.text}")
+        return None
+    except Exception as e:
+        print(f"❗ 이미지 생성 중 예상치 못한 오류 발생: {e}")
+        return None
+
+def wait_for_image_active(token: str, image_id: str, region_code: str = "kr1", timeout_seconds: int = 1800, poll_interval: int = 15):
+    """
+    이미지가 active 상태가 될 때까지 폴링합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param image_id: 기다릴 이미지의 ID
+    :param region_code: 리전 코드
+    :param timeout_seconds: 최대 대기 시간 (초)
+    :param poll_interval: 폴링 간격 (초)
+    :return: 성공 시 이미지 정보 dict, 실패 시 None
+    """
+    start_time = time.time()
+    while time.time() - start_time < timeout_seconds:
+        image_info = get_image(token, image_id, region_code)
+        status = image_info.get('status') if image_info else None
+
+        if status == 'active':
+            print(f"✅ 이미지 '{image_id}'가 active 상태가 되었습니다.")
+            return image_info
+        elif status in ('killed', 'deleted', 'deactivated'):
+            print(f"❌ 이미지 생성 중 오류 발생. 상태: {status}")
+            return None
+        else:
+            print(f" - 이미지 상태: {status}... ({int(time.time() - start_time)}초 경과)")
+
+        time.sleep(poll_interval)
+
+    print(f"❌ 이미지가 {timeout_seconds}초 안에 active 상태가 되지 않아 타임아웃되었습니다.")
+    return None
+
+def _find_image_by_bake_key(token: str, bake_key: str, region_code: str = "kr1"):
+    """
+    (내부 함수) 베이크 키 메타데이터로 active 상태의 이미지를 찾습니다.
+    성공 시 이미지 ID, 없으면 None을 반환합니다.
+    """
+    ctx = as_context(token)
+    url = ctx.url("image", f"/v2/images?{BAKE_KEY_PROPERTY}={bake_key}&status=active", region_code)
+
+    try:
+        response = ctx.session.get(url, headers=ctx.headers)
+        response.raise_for_status()
+        images = response.json().get('images', [])
+        return images[0].get('id') if images else None
+    except Exception as e:
+        print(f"❗ 베이크 이미지 검색 중 오류 발생: {e}")
+        return None
+
+# --- Golden Image Baking ---
+
+def compute_bake_key(base_image_ref: str, user_data, region_code: str = "kr1"):
+    """
+    베이스 이미지와 User Data로부터 베이크 캐시 키(SHA-256)를 계산합니다.
+    이미지는 리전 단위 리소스이므로 리전 코드도 키에 포함합니다.
+
+    :param base_image_ref: 베이스 이미지의 ID
+    :param user_data: 베이킹 시 실행할 User Data (str 또는 bytes)
+    :param region_code: 리전 코드
+    :return: 16진수 문자열 키
+    """
+    if isinstance(user_data, str):
+        user_data = user_data.encode('utf-8')
+    digest = hashlib.sha256()
+    digest.update(region_code.encode('utf-8') + b"\0")
+    digest.update(base_image_ref.encode('utf-8') + b"\0")
+    digest.update(user_data)
+    return digest.hexdigest()
+
+def load_baked_images():
+    """
+    베이크 캐시 파일을 로드합니다.
+    파일이 없거나 손상된 경우 빈 dict를 반환합니다.
+    """
+    try:
+        with open(BAKED_IMAGE_FILE, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def _save_baked_image(bake_key: str, entry: dict):
+    """(내부 함수) 베이크 캐시 파일에 항목을 추가하거나 갱신합니다."""
+    with _cache_lock:
+        cache = load_baked_images()
+        cache[bake_key] = entry
+        with open(BAKED_IMAGE_FILE, 'w') as f:
+            json.dump(cache, f, indent=4)
+
+def _forget_baked_image(bake_key: str):
+    """(내부 함수) 더 이상 유효하지 않은 베이크 캐시 항목을 제거합니다."""
+    with _cache_lock:
+        cache = load_baked_images()
+        if cache.pop(bake_key, None) is not None:
+            with open(BAKED_IMAGE_FILE, 'w') as f:
+                json.dump(cache, f, indent=4)
+
+def bake_image(
+    token: str,
+    tenant_id: str,
+    base_image_ref: str,
+    user_data: str,
+    flavor_ref: str,
+    subnet_id: str,
+    security_group_names: list,
+    key_name: str,
+    image_name_prefix: str = "baked",
+    volume_size: int = 30,
+    region_code: str = "kr1",
+    timeout_seconds: int = 1800
+):
+    """
+    User Data를 미리 실행해 둔 골든 이미지를 만들고, 그 이미지 ID를 반환합니다.
+
+    베이스 이미지 + User Data 해시로 캐시를 조회하여, 이미 베이킹된 active 이미지가 있으면
+    즉시 반환합니다. 없으면 템플릿 인스턴스를 한 번 부팅해 User Data(셸 스크립트)를 실행하고, 스크립트가
+    성공해 스스로 종료(SHUTOFF)하면 이미지를 생성합니다. 스크립트가 실패하면 인스턴스가 종료되지 않으므로
+    timeout_seconds 후 이미지를 만들지 않고(캐시도 남기지 않고) None을 반환합니다. 템플릿 인스턴스는 항상 삭제합니다.
+    이후 인스턴스는 베이킹된 이미지와 간단한 User Data만으로 시작할 수 있습니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param tenant_id: 테넌트 ID
+    :param base_image_ref: 베이스 이미지의 ID
+    :param user_data: 베이킹할 셸 스크립트 (예: 패키지 설치)
+    :param flavor_ref: 템플릿 인스턴스의 플레이버 ID
+    :param subnet_id: 템플릿 인스턴스를 연결할 서브넷 ID (패키지 설치를 위해 외부 통신이 가능해야 함)
+    :param security_group_names: 템플릿 인스턴스에 적용할 보안 그룹 이름의 리스트
+    :param key_name: 템플릿 인스턴스의 키페어 이름
+    :param image_name_prefix: 생성할 이미지 이름의 접두사
+    :param volume_size: 템플릿 인스턴스의 부트 볼륨 크기 (GB)
+    :param region_code: 리전 코드
+    :param timeout_seconds: 템플릿 인스턴스 종료 및 이미지 생성 각각의 최대 대기 시간 (초)
+    :return: 성공 시 베이킹된 이미지 ID, 실패 시 None
+    """
+    bake_key = compute_bake_key(base_image_ref, user_data, region_code)
+
+    # 1. 캐시 조회 (로컬 캐시 -> 이미지 메타데이터 순)
+    cached = load_baked_images().get(bake_key)
+    if cached:
+        image_info = get_image(token, cached['image_id'], region_code)
+        if image_info and image_info.get('status') == 'active':
+            print(f"✅ 베이킹된 이미지를 재사용합니다. (ID: {cached['image_id']})")
+            return cached['image_id']
+        print("캐시된 베이크 이미지가 더 이상 유효하지 않습니다. 다시 베이킹합니다.")
+        _forget_baked_image(bake_key)
+
+    image_id = _find_image_by_bake_key(token, bake_key, region_code)
+    if image_id:
+        print(f"✅ 메타데이터로 베이킹된 이미지를 찾았습니다. (ID: {image_id})")
+        _save_baked_image(bake_key, {
+            "image_id": image_id,
+            "base_image_ref": base_image_ref,
+            "region_code": region_code,
+            "baked_at": datetime.now(timezone.utc).isoformat()
+        })
+        return image_id
+
+    # 2. 템플릿 인스턴스 부팅 (User Data 실행 후 스스로 종료)
+    image_name = f"{image_name_prefix}-{bake_key[:12]}"
+    print(f"이미지 '{image_name}' 베이킹을 시작합니다. (템플릿 인스턴스 부팅)")
+    template_user_data = build_user_data(
+        scripts=[BAKE_FINALIZE_SCRIPT],
+        files=[{"path": BAKE_SCRIPT_PATH, "content": user_data, "permissions": "0755"}]
+    )
+    if not template_user_data:
+        return None
+    instance_id = _submit_instance_create(
+        token, tenant_id, f"{image_name}-template", key_name, base_image_ref, flavor_ref,
+        subnet_id, security_group_names, template_user_data, volume_size, region_code
+    )
+    if not instance_id:
+        return None
+
+    try:
+        if not _wait_for_instance_status(token, tenant_id, instance_id, region_code, "SHUTOFF", timeout_seconds, poll_interval=15):
+            print("🚨 템플릿 인스턴스가 User Data를 성공적으로 실행하지 못해(스크립트 실패 또는 타임아웃) 베이킹을 중단합니다.")
+            return None
+
+        # 3. 스냅숏 생성 및 완료 대기
+        image_id = create_image_from_instance(
+            token, tenant_id, instance_id, image_name,
+            {BAKE_KEY_PROPERTY: bake_key, "base_image_ref": base_image_ref}, region_code
+        )
+        if not image_id or not wait_for_image_active(token, image_id, region_code, timeout_seconds):
+            print("🚨 베이크 이미지 생성에 실패했습니다.")
+            return None
+    finally:
+        # 4. 템플릿 인스턴스 정리
+        delete_instance(token, tenant_id, instance_id, region_code)
+
+    _save_baked_image(bake_key, {
+        "image_id": image_id,
+        "base_image_ref": base_image_ref,
+        "region_code": region_code,
+        "baked_at": datetime.now(timezone.utc).isoformat()
+    })
+    print(f"✅ 이미지 베이킹 완료 (ID: {image_id})")
+    return image_id
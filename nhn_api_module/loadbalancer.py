@@ -0,0 +1,630 @@
+# nhn_api_module/loadbalancer.py
+
+"""
+NHN Cloud 로드 밸런서 관련 API를 호출하는 함수들을 모아놓은 모듈입니다.
+- 로드 밸런서
+- 리스너
+- 풀과 멤버 (여러 멤버를 일괄 변경 요청 하나로 등록/제거)
+- 헬스 모니터
+- 웹 서버 플릿 생성과 멤버 등록을 묶은 함수
+
+로드 밸런서는 변경 작업이 진행되는 동안(PENDING_*) 다른 변경 요청을 409로 거절하므로,
+이 모듈의 변경 함수들은 로드 밸런서가 다시 ACTIVE가 될 때까지 기다린 뒤 반환합니다.
+"""
+
+import requests
+import json
+import threading
+import time
+import weakref
+
+from .client import as_context
+from .compute import launch_fleet, delete_instance
+
+# 같은 로드 밸런서의 멤버 목록 조회~변경을 한 번에 하나씩 실행하기 위한 잠금 (로드 밸런서 ID별)
+# 사용 중인 잠금만 남도록 약한 참조로 보관합니다. (로드 밸런서가 늘어나도 잠금이 계속 쌓이지 않음)
+_member_locks = weakref.WeakValueDictionary()
+_member_locks_guard = threading.Lock()
+
+# 멤버 일괄 변경(PUT .../members)을 지원하지 않는 네트워크 엔드포인트 (한 번 확인하면 멤버를 하나씩 변경)
+_batch_unsupported = set()
+
+# 일괄 변경 요청에 기존 멤버를 그대로 남기기 위해 옮겨 담는 멤버 속성
+MEMBER_BATCH_FIELDS = ("name", "address", "protocol_port", "subnet_id", "weight", "admin_state_up", "backup", "monitor_address", "monitor_port")
+
+def _member_lock(lb_id: str):
+    with _member_locks_guard:
+        lock = _member_locks.get(lb_id)
+        if lock is None:
+            lock = _member_locks[lb_id] = threading.Lock()
+        return lock
+
+# --- Load Balancer ---
+
+def create_load_balancer(token: str, lb_name: str, vip_subnet_id: str, description: str = "", region_code: str = "kr1"):
+    """
+    로드 밸런서를 생성하고 ACTIVE 상태가 될 때까지 기다립니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param lb_name: 로드 밸런서 이름
+    :param vip_subnet_id: VIP(가상 IP)를 할당할 서브넷의 ID
+    :param description: 설명
+    :param region_code: 리전 코드
+    :return: 성공 시 로드 밸런서 정보 dict (id, vip_address, vip_port_id 등), 실패 시 None
+    """
+    ctx = as_context(token)
+    url = ctx.url("network", "/v2.0/lbaas/loadbalancers", region_code)
+
+    payload = {
+        "loadbalancer": {
+            "name": lb_name,
+            "vip_subnet_id": vip_subnet_id,
+            "description": description,
+        }
+    }
+
+    try:
+        response = ctx.session.post(url, headers=ctx.headers, data=json.dumps(payload))
+        response.raise_for_status()
+
+        lb_id = response.json().get('loadbalancer', {}).get('id')
+        print(f"✅ 로드 밸런서 생성 요청 성공 (ID: {lb_id})")
+        return wait_for_load_balancer_active(ctx, lb_id, region_code)
+
+    except requests.exceptions.HTTPError as http_err:
+        print(f"❗ 로드 밸런서 생성 중 HTTP 오류 발생: {http_err}")
+        print(f"    응답 내용: {http_err.response.text}")
+        return None
+    except Exception as e:
+        print(f"❗ 로드 밸런서 생성 중 예상치 못한 오류 발생: {e}")
+        return None
+
+def get_load_balancer(token: str, lb_id: str, region_code: str = "kr1"):
+    """
+    로드 밸런서 정보를 조회합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param lb_id: 로드 밸런서 ID
+    :param region_code: 리전 코드
+    :return: 성공 시 로드 밸런서 정보 dict, 없거나 실패 시 None
+    """
+    ctx = as_context(token)
+    url = ctx.url("network", f"/v2.0/lbaas/loadbalancers/{lb_id}", region_code)
+
+    try:
+        response = ctx.session.get(url, headers=ctx.headers)
+        response.raise_for_status()
+        return response.json().get('loadbalancer')
+
+    except requests.exceptions.HTTPError as http_err:
+        print(f"❗ 로드 밸런서 조회 중 HTTP 오류 발생: {http_err}")
+        return None
+    except Exception as e:
+        print(f"❗ 로드 밸런서 조회 중 예상치 못한 오류 발생: {e}")
+        return None
+
+def wait_for_load_balancer_active(token: str, lb_id: str, region_code: str = "kr1", timeout_seconds: int = 600, poll_interval: int = 3):
+    """
+    로드 밸런서의 provisioning_status가 ACTIVE가 될 때까지 폴링합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param lb_id: 로드 밸런서 ID
+    :param region_code: 리전 코드
+    :param timeout_seconds: 최대 대기 시간 (초)
+    :param poll_interval: 상태 확인 간격 (초)
+    :return: ACTIVE가 되면 로드 밸런서 정보 dict, ERROR/타임아웃/조회 실패 시 None
+    """
+    start_time = time.time()
+    while time.time() - start_time < timeout_seconds:
+        lb = get_load_balancer(token, lb_id, region_code)
+        if lb is None:
+            return None
+        status = lb.get('provisioning_status')
+        if status == 'ACTIVE':
+            return lb
+        if status == 'ERROR':
+            print(f"❌ 로드 밸런서 '{lb_id}'가 ERROR 상태입니다.")
+            return None
+        time.sleep(poll_interval)
+
+    print(f"❌ 로드 밸런서 '{lb_id}'가 {timeout_seconds}초 안에 ACTIVE 상태가 되지 않았습니다.")
+    return None
+
+def list_load_balancers(token: str, region_code: str = "kr1"):
+    """
+    로드 밸런서 목록을 조회합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param region_code: 리전 코드
+    :return: 성공 시 로드 밸런서 정보 dict의 리스트, 실패 시 None
+    """
+    ctx = as_context(token)
+    url = ctx.url("network", "/v2.0/lbaas/loadbalancers", region_code)
+
+    try:
+        response = ctx.session.get(url, headers=ctx.headers)
+        response.raise_for_status()
+
+        load_balancers = response.json().get('loadbalancers', [])
+        print(f"✅ 로드 밸런서 목록 조회 성공: {len(load_balancers)}개 (Region: {region_code})")
+        return load_balancers
+
+    except requests.exceptions.HTTPError as http_err:
+        print(f"❗ 로드 밸런서 목록 조회 중 HTTP 오류 발생: {http_err}")
+        print(f"    응답 내용: {http_err.response.text}")
+        return None
+    except Exception as e:
+        print(f"❗ 로드 밸런서 목록 조회 중 예상치 못한 오류 발생: {e}")
+        return None
+
+def _lb_request(ctx, method: str, lb_id: str, url: str, payload: dict = None, region_code: str = "kr1", retries: int = 5):
+    """
+    (내부 함수) 로드 밸런서 하위 리소스를 변경하는 요청을 보내고, 로드 밸런서가 다시 ACTIVE가 될 때까지 기다립니다.
+    다른 변경이 진행 중이라 409(PENDING_*)로 거절되면 ACTIVE를 기다렸다가 다시 보냅니다.
+    성공 시 응답 JSON(dict, 본문이 없으면 {}), 그 외 오류는 requests.exceptions.HTTPError를 발생시킵니다.
+    """
+    for _ in range(retries):
+        send = getattr(ctx.session, method.lower())
+        response = send(url, headers=ctx.headers, data=json.dumps(payload) if payload is not None else None)
+        if response.status_code == 409:
+            if not wait_for_load_balancer_active(ctx, lb_id, region_code):
+                break
+            continue
+        response.raise_for_status()
+        body = response.json() if response.content else {}
+        if not wait_for_load_balancer_active(ctx, lb_id, region_code):
+            raise RuntimeError(f"로드 밸런서 '{lb_id}'가 변경 후 ACTIVE 상태가 되지 않았습니다.")
+        return body
+    response.raise_for_status()
+    raise RuntimeError(f"로드 밸런서 '{lb_id}'가 계속 변경 중이라 요청을 보내지 못했습니다.")
+
+def delete_load_balancer(token: str, lb_id: str, region_code: str = "kr1"):
+    """
+    로드 밸런서를 삭제합니다. 하위 리소스(헬스 모니터, 풀, 리스너)를 먼저 삭제해야 합니다. (delete_web_load_balancer 참고)
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param lb_id: 삭제할 로드 밸런서 ID
+    :param region_code: 리전 코드
+    :return: 성공 시 True, 실패 시 False
+    """
+    ctx = as_context(token)
+    url = ctx.url("network", f"/v2.0/lbaas/loadbalancers/{lb_id}", region_code)
+
+    try:
+        response = ctx.session.delete(url, headers=ctx.headers)
+        response.raise_for_status()
+
+        print(f"✅ 로드 밸런서 '{lb_id}' 삭제 성공")
+        return True
+
+    except requests.exceptions.HTTPError as http_err:
+        print(f"❗ 로드 밸런서 삭제 중 HTTP 오류 발생: {http_err}")
+        print(f"    응답 내용: {http_err.response.text}")
+        return False
+    except Exception as e:
+        print(f"❗ 로드 밸런서 삭제 중 예상치 못한 오류 발생: {e}")
+        return False
+
+# --- Listener / Pool / Health Monitor ---
+
+def create_listener(token: str, lb_id: str, listener_name: str, protocol: str = "HTTP", protocol_port: int = 80, connection_limit: int = 2000, region_code: str = "kr1"):
+    """
+    로드 밸런서에 리스너를 생성합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param lb_id: 로드 밸런서 ID
+    :param listener_name: 리스너 이름
+    :param protocol: 프로토콜 (HTTP, HTTPS, TCP, TERMINATED_HTTPS)
+    :param protocol_port: 수신 포트
+    :param connection_limit: 최대 연결 수
+    :param region_code: 리전 코드
+    :return: 성공 시 리스너 ID, 실패 시 None
+    """
+    ctx = as_context(token)
+    url = ctx.url("network", "/v2.0/lbaas/listeners", region_code)
+    payload = {
+        "listener": {
+            "name": listener_name,
+            "loadbalancer_id": lb_id,
+            "protocol": protocol,
+            "protocol_port": protocol_port,
+            "connection_limit": connection_limit,
+        }
+    }
+
+    try:
+        listener_id = _lb_request(ctx, "POST", lb_id, url, payload, region_code).get('listener', {}).get('id')
+        print(f"✅ 리스너 '{listener_name}' 생성 성공 (ID: {listener_id})")
+        return listener_id
+
+    except requests.exceptions.HTTPError as http_err:
+        print(f"❗ 리스너 생성 중 HTTP 오류 발생: {http_err}")
+        print(f"    응답 내용: {http_err.response.text}")
+        return None
+    except Exception as e:
+        print(f"❗ 리스너 생성 중 예상치 못한 오류 발생: {e}")
+        return None
+
+def create_pool(token: str, lb_id: str, listener_id: str, pool_name: str, protocol: str = "HTTP", lb_algorithm: str = "ROUND_ROBIN", region_code: str = "kr1"):
+    """
+    리스너에 연결된 풀을 생성합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param lb_id: 로드 밸런서 ID
+    :param listener_id: 리스너 ID
+    :param pool_name: 풀 이름
+    :param protocol: 멤버와 통신할 프로토콜
+    :param lb_algorithm: 분산 방식 (ROUND_ROBIN, LEAST_CONNECTIONS, SOURCE_IP)
+    :param region_code: 리전 코드
+    :return: 성공 시 풀 ID, 실패 시 None
+    """
+    ctx = as_context(token)
+    url = ctx.url("network", "/v2.0/lbaas/pools", region_code)
+    payload = {
+        "pool": {
+            "name": pool_name,
+            "listener_id": listener_id,
+            "protocol": protocol,
+            "lb_algorithm": lb_algorithm,
+        }
+    }
+
+    try:
+        pool_id = _lb_request(ctx, "POST", lb_id, url, payload, region_code).get('pool', {}).get('id')
+        print(f"✅ 풀 '{pool_name}' 생성 성공 (ID: {pool_id})")
+        return pool_id
+
+    except requests.exceptions.HTTPError as http_err:
+        print(f"❗ 풀 생성 중 HTTP 오류 발생: {http_err}")
+        print(f"    응답 내용: {http_err.response.text}")
+        return None
+    except Exception as e:
+        print(f"❗ 풀 생성 중 예상치 못한 오류 발생: {e}")
+        return None
+
+def create_health_monitor(token: str, lb_id: str, pool_id: str, monitor_type: str = "HTTP", url_path: str = "/", expected_codes: str = "200", delay: int = 10, timeout: int = 5, max_retries: int = 3, region_code: str = "kr1"):
+    """
+    풀에 헬스 모니터를 생성합니다. 응답하지 않는 멤버에는 트래픽이 전달되지 않습니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param lb_id: 로드 밸런서 ID
+    :param pool_id: 풀 ID
+    :param monitor_type: 점검 방식 (HTTP, HTTPS, TCP, PING)
+    :param url_path: HTTP 점검 경로
+    :param expected_codes: 정상으로 볼 HTTP 상태 코드 (예: "200", "200-299")
+    :param delay: 점검 간격 (초)
+    :param timeout: 응답 대기 시간 (초)
+    :param max_retries: 비정상으로 판단하기까지의 연속 실패 횟수
+    :param region_code: 리전 코드
+    :return: 성공 시 헬스 모니터 ID, 실패 시 None
+    """
+    ctx = as_context(token)
+    url = ctx.url("network", "/v2.0/lbaas/healthmonitors", region_code)
+    monitor = {
+        "pool_id": pool_id,
+        "type": monitor_type,
+        "delay": delay,
+        "timeout": timeout,
+        "max_retries": max_retries,
+    }
+    if monitor_type in ("HTTP", "HTTPS"):
+        monitor.update({"url_path": url_path, "expected_codes": expected_codes, "http_method": "GET"})
+
+    try:
+        monitor_id = _lb_request(ctx, "POST", lb_id, url, {"healthmonitor": monitor}, region_code).get('healthmonitor', {}).get('id')
+        print(f"✅ 헬스 모니터 생성 성공 (ID: {monitor_id})")
+        return monitor_id
+
+    except requests.exceptions.HTTPError as http_err:
+        print(f"❗ 헬스 모니터 생성 중 HTTP 오류 발생: {http_err}")
+        print(f"    응답 내용: {http_err.response.text}")
+        return None
+    except Exception as e:
+        print(f"❗ 헬스 모니터 생성 중 예상치 못한 오류 발생: {e}")
+        return None
+
+def _delete_lb_child(ctx, lb_id: str, path: str, label: str, region_code: str):
+    """(내부 함수) 리스너/풀/헬스 모니터를 삭제합니다. 이미 없으면 성공으로 봅니다."""
+    try:
+        _lb_request(ctx, "DELETE", lb_id, ctx.url("network", path, region_code), region_code=region_code)
+        print(f"✅ {label} 삭제 성공")
+        return True
+
+    except requests.exceptions.HTTPError as http_err:
+        if http_err.response is not None and http_err.response.status_code == 404:
+            return True
+        print(f"❗ {label} 삭제 중 HTTP 오류 발생: {http_err}")
+        return False
+    except Exception as e:
+        print(f"❗ {label} 삭제 중 예상치 못한 오류 발생: {e}")
+        return False
+
+# --- Member ---
+
+def list_pool_members(token: str, pool_id: str, region_code: str = "kr1"):
+    """
+    풀의 멤버 목록을 조회합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param pool_id: 풀 ID
+    :param region_code: 리전 코드
+    :return: 성공 시 멤버 정보 dict의 리스트 (id, address, protocol_port, operating_status 등), 실패 시 None
+    """
+    ctx = as_context(token)
+    url = ctx.url("network", f"/v2.0/lbaas/pools/{pool_id}/members", region_code)
+
+    try:
+        response = ctx.session.get(url, headers=ctx.headers)
+        response.raise_for_status()
+        return response.json().get('members', [])
+
+    except requests.exceptions.HTTPError as http_err:
+        print(f"❗ 풀 멤버 목록 조회 중 HTTP 오류 발생: {http_err}")
+        print(f"    응답 내용: {http_err.response.text}")
+        return None
+    except Exception as e:
+        print(f"❗ 풀 멤버 목록 조회 중 예상치 못한 오류 발생: {e}")
+        return None
+
+def _batch_update_members(ctx, lb_id, pool_id, members, region_code):
+    """
+    (내부 함수) 풀의 멤버 목록 전체를 한 번의 요청(PUT .../members)으로 교체합니다. 로드 밸런서 재구성이 한 번만 일어납니다.
+    목록에 없는 기존 멤버는 제거되므로, 남길 멤버도 모두 포함해야 합니다.
+    :return: 성공 시 True, API가 일괄 변경을 지원하지 않으면 False (그 외 오류는 예외를 발생)
+    """
+    endpoint = ctx.url("network", "/v2.0/lbaas", region_code)
+    if endpoint in _batch_unsupported:
+        return False
+    url = ctx.url("network", f"/v2.0/lbaas/pools/{pool_id}/members", region_code)
+    try:
+        _lb_request(ctx, "PUT", lb_id, url, {"members": members}, region_code)
+        return True
+    except requests.exceptions.HTTPError as http_err:
+        if http_err.response is None or http_err.response.status_code not in (404, 405, 501):
+            raise
+        print("❗ 멤버 일괄 변경을 지원하지 않아 멤버를 하나씩 변경합니다. (멤버마다 로드 밸런서 재구성)")
+        _batch_unsupported.add(endpoint)
+        return False
+
+def _member_spec(member: dict):
+    """(내부 함수) 조회한 멤버 정보를 일괄 변경 요청의 멤버 항목으로 변환합니다."""
+    return {key: member[key] for key in MEMBER_BATCH_FIELDS if member.get(key) is not None}
+
+def add_pool_members(token: str, lb_id: str, pool_id: str, subnet_id: str, addresses: list, protocol_port: int = 80, weight: int = 1, region_code: str = "kr1"):
+    """
+    여러 주소를 풀 멤버로 한 번에 등록합니다. 이미 등록된 주소/포트는 건너뜁니다.
+
+    기존 멤버와 새 멤버를 합친 목록을 멤버 일괄 변경(PUT .../members) 요청 하나로 보내므로, 멤버 수와 관계없이
+    로드 밸런서 재구성은 한 번만 일어납니다. (일괄 변경은 전부 성공하거나 전부 실패)
+    API가 일괄 변경을 지원하지 않으면 멤버를 하나씩 등록하며, 이때는 멤버마다 재구성이 일어납니다.
+    진행 중인 다른 변경과 부딪혀도(409) 기다렸다가 이어서 등록하고, 같은 프로세스에서 같은 로드 밸런서의 멤버를
+    동시에 변경하는 호출은 차례로 실행되어 중복 등록되지 않습니다.
+    (일괄 변경은 목록 조회 이후 다른 프로세스가 추가한 멤버를 제거하므로, 한 풀의 멤버는 한 프로세스에서만 관리하세요.)
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param lb_id: 로드 밸런서 ID
+    :param pool_id: 풀 ID
+    :param subnet_id: 멤버가 속한 서브넷 ID
+    :param addresses: 등록할 멤버의 사설 IP 주소 리스트
+    :param protocol_port: 멤버의 서비스 포트
+    :param weight: 가중치
+    :param region_code: 리전 코드
+    :return: {"added": {주소: 멤버 ID (등록 후 목록 재조회에 실패하면 None)}, "existing": [주소, ...], "failed": [주소, ...]},
+             멤버 목록 조회 실패 시 None
+    """
+    ctx = as_context(token)
+    with _member_lock(lb_id):
+        return _add_pool_members(ctx, lb_id, pool_id, subnet_id, addresses, protocol_port, weight, region_code)
+
+def _add_pool_members(ctx, lb_id, pool_id, subnet_id, addresses, protocol_port, weight, region_code):
+    members = list_pool_members(ctx, pool_id, region_code)
+    if members is None:
+        return None
+
+    registered = {(m.get('address'), m.get('protocol_port')) for m in members}
+    result = {"added": {}, "existing": [], "failed": []}
+    new = []
+    for address in addresses:
+        if (address, protocol_port) in registered:
+            result["existing"].append(address)
+        elif address not in new:
+            new.append(address)
+
+    specs = {address: {"subnet_id": subnet_id, "address": address, "protocol_port": protocol_port, "weight": weight} for address in new}
+    try:
+        batched = bool(new) and _batch_update_members(ctx, lb_id, pool_id, [_member_spec(m) for m in members] + list(specs.values()), region_code)
+    except Exception as e:
+        print(f"❗ 멤버 {len(new)}개 일괄 등록 실패: {e}")
+        result["failed"].extend(new)
+        new, batched = [], False
+
+    if batched:
+        listed = list_pool_members(ctx, pool_id, region_code) or []
+        ids = {m.get('address'): m.get('id') for m in listed if m.get('protocol_port') == protocol_port}
+        for address in new:
+            result["added"][address] = ids.get(address)
+    else:
+        url = ctx.url("network", f"/v2.0/lbaas/pools/{pool_id}/members", region_code)
+        for address in new:
+            try:
+                member = _lb_request(ctx, "POST", lb_id, url, {"member": specs[address]}, region_code).get('member', {})
+                result["added"][address] = member.get('id')
+            except Exception as e:
+                print(f"❗ 멤버 '{address}:{protocol_port}' 등록 실패: {e}")
+                result["failed"].append(address)
+
+    print(f"✅ 풀 멤버 등록: 추가 {len(result['added'])}개, 기존 {len(result['existing'])}개, 실패 {len(result['failed'])}개")
+    return result
+
+def remove_pool_members(token: str, lb_id: str, pool_id: str, addresses: list, region_code: str = "kr1"):
+    """
+    여러 주소의 풀 멤버를 한 번에 제거합니다. (포트와 관계없이 주소가 같은 멤버를 모두 제거, 없는 주소는 건너뜀)
+
+    남길 멤버만 담은 목록을 멤버 일괄 변경(PUT .../members) 요청 하나로 보내므로 로드 밸런서 재구성은 한 번만 일어납니다.
+    API가 일괄 변경을 지원하지 않으면 멤버를 하나씩 제거합니다. (add_pool_members 참고)
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param lb_id: 로드 밸런서 ID
+    :param pool_id: 풀 ID
+    :param addresses: 제거할 멤버의 사설 IP 주소 리스트
+    :param region_code: 리전 코드
+    :return: {"removed": [주소, ...], "failed": [주소, ...]}, 멤버 목록 조회 실패 시 None
+    """
+    ctx = as_context(token)
+    with _member_lock(lb_id):
+        return _remove_pool_members(ctx, lb_id, pool_id, addresses, region_code)
+
+def _remove_pool_members(ctx, lb_id, pool_id, addresses, region_code):
+    members = list_pool_members(ctx, pool_id, region_code)
+    if members is None:
+        return None
+
+    targets = set(addresses)
+    doomed = [m for m in members if m.get('address') in targets]
+    result = {"removed": [], "failed": []}
+    try:
+        batched = bool(doomed) and _batch_update_members(ctx, lb_id, pool_id, [_member_spec(m) for m in members if m not in doomed], region_code)
+    except Exception as e:
+        print(f"❗ 멤버 {len(doomed)}개 일괄 제거 실패: {e}")
+        result["failed"].extend(m.get('address') for m in doomed)
+        doomed, batched = [], False
+
+    if batched:
+        result["removed"].extend(m.get('address') for m in doomed)
+    else:
+        for member in doomed:
+            address = member.get('address')
+            url = ctx.url("network", f"/v2.0/lbaas/pools/{pool_id}/members/{member['id']}", region_code)
+            try:
+                _lb_request(ctx, "DELETE", lb_id, url, region_code=region_code)
+                result["removed"].append(address)
+            except Exception as e:
+                print(f"❗ 멤버 '{address}' 제거 실패: {e}")
+                result["failed"].append(address)
+
+    print(f"✅ 풀 멤버 제거: {len(result['removed'])}개, 실패 {len(result['failed'])}개")
+    return result
+
+# --- Web Load Balancer ---
+
+def create_web_load_balancer(token: str, name: str, subnet_id: str, protocol_port: int = 80, health_check_path: str = "/", region_code: str = "kr1"):
+    """
+    웹 서버용 로드 밸런서(로드 밸런서 + HTTP 리스너 + 라운드 로빈 풀 + HTTP 헬스 모니터)를 한 번에 만듭니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param name: 리소스 이름 접두사 (예: "web" -> "web-lb", "web-listener", "web-pool")
+    :param subnet_id: VIP와 멤버가 속한 서브넷 ID
+    :param protocol_port: 리스너와 멤버의 HTTP 포트
+    :param health_check_path: 헬스 체크 경로
+    :param region_code: 리전 코드
+    :return: 성공 시 {"loadbalancer_id", "listener_id", "pool_id", "healthmonitor_id", "vip_address", "vip_port_id", "subnet_id", "protocol_port"},
+             로드 밸런서 생성 실패 시 None, 이후 단계 실패 시 그때까지 만든 리소스 ID와 "error"를 담은 dict (delete_web_load_balancer로 정리)
+    """
+    ctx = as_context(token)
+    lb = create_load_balancer(ctx, f"{name}-lb", subnet_id, f"{name} 웹 로드 밸런서", region_code)
+    if not lb:
+        return None
+    web_lb = {
+        "loadbalancer_id": lb['id'],
+        "vip_address": lb.get('vip_address'),
+        "vip_port_id": lb.get('vip_port_id'),
+        "subnet_id": subnet_id,
+        "protocol_port": protocol_port,
+    }
+
+    web_lb["listener_id"] = create_listener(ctx, lb['id'], f"{name}-listener", "HTTP", protocol_port, region_code=region_code)
+    if web_lb["listener_id"]:
+        web_lb["pool_id"] = create_pool(ctx, lb['id'], web_lb["listener_id"], f"{name}-pool", "HTTP", region_code=region_code)
+    if web_lb.get("pool_id"):
+        web_lb["healthmonitor_id"] = create_health_monitor(ctx, lb['id'], web_lb["pool_id"], "HTTP", health_check_path, region_code=region_code)
+    if not web_lb.get("healthmonitor_id"):
+        web_lb["error"] = "리스너, 풀 또는 헬스 모니터 생성에 실패했습니다."
+        print(f"🚨 {web_lb['error']}")
+        return web_lb
+
+    print(f"✅ 웹 로드 밸런서 준비 완료: http://{web_lb['vip_address']}:{protocol_port}")
+    return web_lb
+
+def delete_web_load_balancer(token: str, web_lb: dict, region_code: str = "kr1"):
+    """
+    create_web_load_balancer로 만든 리소스를 헬스 모니터 → 멤버 → 풀 → 리스너 → 로드 밸런서 순으로 삭제합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param web_lb: create_web_load_balancer의 반환값
+    :param region_code: 리전 코드
+    :return: 모두 삭제되면 True, 하나라도 실패하면 False
+    """
+    ctx = as_context(token)
+    lb_id = web_lb["loadbalancer_id"]
+    ok = True
+    if web_lb.get("healthmonitor_id"):
+        ok &= _delete_lb_child(ctx, lb_id, f"/v2.0/lbaas/healthmonitors/{web_lb['healthmonitor_id']}", "헬스 모니터", region_code)
+    if web_lb.get("pool_id"):
+        members = list_pool_members(ctx, web_lb["pool_id"], region_code) or []
+        if members:
+            removed = remove_pool_members(ctx, lb_id, web_lb["pool_id"], [m['address'] for m in members], region_code)
+            ok &= removed is not None and not removed["failed"]
+        ok &= _delete_lb_child(ctx, lb_id, f"/v2.0/lbaas/pools/{web_lb['pool_id']}", "풀", region_code)
+    if web_lb.get("listener_id"):
+        ok &= _delete_lb_child(ctx, lb_id, f"/v2.0/lbaas/listeners/{web_lb['listener_id']}", "리스너", region_code)
+    return bool(ok) and delete_load_balancer(ctx, lb_id, region_code)
+
+# --- Fleet ---
+
+def launch_fleet_members(
+    token: str,
+    tenant_id: str,
+    web_lb: dict,
+    instance_names: list,
+    key_name: str,
+    image_ref: str,
+    flavor_ref: str,
+    security_group_names: list,
+    user_data: str,
+    volume_size: int = 30,
+    region_code: str = "kr1",
+    max_workers: int = 16,
+    quota=None,
+    min_count: int = None
+):
+    """
+    인스턴스 여러 개를 병렬로 생성하고(compute.launch_fleet), ACTIVE가 된 인스턴스를 웹 로드 밸런서 풀에 일괄 등록합니다.
+
+    :param web_lb: create_web_load_balancer의 반환값 (인스턴스도 같은 서브넷에 생성)
+    :param instance_names: 생성할 인스턴스 이름의 리스트
+    (나머지 매개변수는 compute.launch_fleet과 동일)
+    :return: {"active": [{"name", "instance_id", "port_id", "address"}, ...], "failed": [인스턴스 이름, ...],
+              "rejected": [쿼터 부족으로 생성하지 않은 인스턴스 이름, ...], "members": add_pool_members의 반환값}
+    """
+    ctx = as_context(token)
+    fleet = launch_fleet(
+        ctx, tenant_id, instance_names, key_name, image_ref, flavor_ref, web_lb["subnet_id"],
+        security_group_names, user_data, volume_size, region_code, max_workers, quota, min_count
+    )
+    fleet["members"] = add_pool_members(
+        ctx, web_lb["loadbalancer_id"], web_lb["pool_id"], web_lb["subnet_id"],
+        [server["address"] for server in fleet["active"]], web_lb["protocol_port"], region_code=region_code
+    )
+    return fleet
+
+def remove_fleet_members(token: str, tenant_id: str, web_lb: dict, servers: list, delete_instances: bool = True, region_code: str = "kr1"):
+    """
+    인스턴스들을 웹 로드 밸런서 풀에서 일괄 제거한 뒤(새 요청이 더 이상 전달되지 않음) 인스턴스를 삭제합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param tenant_id: 테넌트 ID
+    :param web_lb: create_web_load_balancer의 반환값
+    :param servers: launch_fleet_members가 반환한 "active" 항목의 리스트 ({"instance_id", "address"} 포함)
+    :param delete_instances: True이면 멤버 제거 후 인스턴스도 삭제
+    :param region_code: 리전 코드
+    :return: {"members": remove_pool_members의 반환값, "deleted": [인스턴스 ID, ...]}
+    """
+    ctx = as_context(token)
+    members = remove_pool_members(ctx, web_lb["loadbalancer_id"], web_lb["pool_id"], [s["address"] for s in servers], region_code)
+    deleted = []
+    if delete_instances and members is not None:
+        failed = set(members["failed"])
+        for server in servers:
+            if server["address"] not in failed and delete_instance(ctx, tenant_id, server["instance_id"], region_code):
+                deleted.append(server["instance_id"])
+    return {"members": members, "deleted": deleted}
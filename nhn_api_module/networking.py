@@ -7,30 +7,28 @@ NHN Cloud 네트워킹 관련 API를 호출하는 함수들을 모아놓은 모
 - 인터넷 게이트웨이
 - 라우팅 테이블
 - Floating IP (공인 IP)
+- 포트
 """
 
 import requests
 import json
 
+from .client import as_context
+
 # --- VPC ---
 
 def create_vpc(token: str, vpc_name: str, cidr: str, region_code: str = "kr1"):
     """
     VPC를 생성합니다.
 
-    :param token: 인증 토큰
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
     :param vpc_name: 생성할 VPC의 이름
     :param cidr: VPC의 CIDR (예: "10.0.0.0/16")
     :param region_code: 리전 코드 (예: "kr1")
     :return: 성공 시 VPC ID, 실패 시 None
     """
-    NETWORK_API_URL = f"https://{region_code}-api-network-infrastructure.nhncloudservice.com"
-    url = f"{NETWORK_API_URL}/v2.0/vpcs"
-    
-    headers = {
-        "X-Auth-Token": token,
-        "Content-Type": "application/json"
-    }
+    ctx = as_context(token)
+    url = ctx.url("network", "/v2.0/vpcs", region_code)
     
     payload = {
         "vpc": {
@@ -40,7 +38,7 @@ def create_vpc(token: str, vpc_name: str, cidr: str, region_code: str = "kr1"):
     }
     
     try:
-        response = requests.post(url, headers=headers, data=json.dumps(payload))
+        response = ctx.session.post(url, headers=ctx.headers, data=json.dumps(payload))
         response.raise_for_status()
         
         vpc_info = response.json().get('vpc', {})
@@ -60,21 +58,16 @@ def get_vpc_details(token: str, vpc_id: str, region_code: str = "kr1"):
     """
     특정 VPC의 상세 정보를 조회합니다.
 
-    :param token: 인증 토큰
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
     :param vpc_id: 조회할 VPC의 ID
     :param region_code: 리전 코드
     :return: 성공 시 VPC 상세 정보 dict, 실패 시 None
     """
-    NETWORK_API_URL = f"https://{region_code}-api-network-infrastructure.nhncloudservice.com"
-    url = f"{NETWORK_API_URL}/v2.0/vpcs/{vpc_id}"
-    
-    headers = {
-        "X-Auth-Token": token,
-        "Content-Type": "application/json"
-    }
+    ctx = as_context(token)
+    url = ctx.url("network", f"/v2.0/vpcs/{vpc_id}", region_code)
     
     try:
-        response = requests.get(url, headers=headers)
+        response = ctx.session.get(url, headers=ctx.headers)
         response.raise_for_status()
         
         vpc_details = response.json().get('vpc', {})
@@ -89,26 +82,76 @@ def get_vpc_details(token: str, vpc_id: str, region_code: str = "kr1"):
         print(f"❗ VPC 상세 정보 조회 중 예상치 못한 오류 발생: {e}")
         return None
 
+def list_vpcs(token: str, region_code: str = "kr1"):
+    """
+    VPC 목록을 조회합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param region_code: 리전 코드
+    :return: 성공 시 VPC 정보 dict의 리스트, 실패 시 None
+    """
+    ctx = as_context(token)
+    url = ctx.url("network", "/v2.0/vpcs", region_code)
+
+    try:
+        response = ctx.session.get(url, headers=ctx.headers)
+        response.raise_for_status()
+
+        items = response.json().get('vpcs', [])
+        print(f"✅ VPC 목록 조회 성공: {len(items)}개 (Region: {region_code})")
+        return items
+
+    except requests.exceptions.HTTPError as http_err:
+        print(f"❗ VPC 목록 조회 중 HTTP 오류 발생: {http_err}")
+        print(f"    응답 내용: {http_err.response.text}")
+        return None
+    except Exception as e:
+        print(f"❗ VPC 목록 조회 중 예상치 못한 오류 발생: {e}")
+        return None
+
+def delete_vpc(token: str, vpc_id: str, region_code: str = "kr1"):
+    """
+    VPC를 삭제합니다. VPC의 서브넷과 라우팅 테이블의 게이트웨이 연결을 먼저 정리해야 합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param vpc_id: 삭제할 VPC의 ID
+    :param region_code: 리전 코드
+    :return: 성공 시 True, 실패 시 False
+    """
+    ctx = as_context(token)
+    url = ctx.url("network", f"/v2.0/vpcs/{vpc_id}", region_code)
+
+    try:
+        response = ctx.session.delete(url, headers=ctx.headers)
+        response.raise_for_status()
+
+        print(f"✅ VPC '{vpc_id}' 삭제 성공")
+        return True
+
+    except requests.exceptions.HTTPError as http_err:
+        print(f"❗ VPC 삭제 중 HTTP 오류 발생: {http_err}")
+        print(f"    응답 내용: {http_err.response.text}")
+        return False
+    except Exception as e:
+        print(f"❗ VPC 삭제 중 예상치 못한 오류 발생: {e}")
+        return False
+
 # --- Subnet ---
 
 def create_vpc_subnet(token: str, vpc_id: str, subnet_name: str, cidr: str, region_code: str = "kr1"):
     """
     VPC 서브넷을 생성합니다.
 
-    :param token: 인증 토큰
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
     :param vpc_id: 서브넷이 속할 VPC의 ID
     :param subnet_name: 생성할 서브넷의 이름
     :param cidr: 서브넷의 CIDR (예: "10.0.1.0/24")
     :param region_code: 리전 코드
     :return: 성공 시 서브넷 ID, 실패 시 None
     """
-    NETWORK_API_URL = f"https://{region_code}-api-network-infrastructure.nhncloudservice.com"
-    url = f"{NETWORK_API_URL}/v2.0/vpcsubnets"
+    ctx = as_context(token)
+    url = ctx.url("network", "/v2.0/vpcsubnets", region_code)
 
-    headers = {
-        "X-Auth-Token": token,
-        "Content-Type": "application/json"
-    }
 
     payload = {
         "vpcsubnet": {
@@ -119,7 +162,7 @@ def create_vpc_subnet(token: str, vpc_id: str, subnet_name: str, cidr: str, regi
     }
 
     try:
-        response = requests.post(url, headers=headers, data=json.dumps(payload))
+        response = ctx.session.post(url, headers=ctx.headers, data=json.dumps(payload))
         response.raise_for_status()
 
         subnet_info = response.json().get('vpcsubnet', {})
@@ -135,6 +178,60 @@ def create_vpc_subnet(token: str, vpc_id: str, subnet_name: str, cidr: str, regi
         print(f"❗ 서브넷 생성 중 예상치 못한 오류 발생: {e}")
         return None
 
+def list_vpc_subnets(token: str, region_code: str = "kr1"):
+    """
+    VPC 서브넷 목록을 조회합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param region_code: 리전 코드
+    :return: 성공 시 서브넷 정보 dict의 리스트, 실패 시 None
+    """
+    ctx = as_context(token)
+    url = ctx.url("network", "/v2.0/vpcsubnets", region_code)
+
+    try:
+        response = ctx.session.get(url, headers=ctx.headers)
+        response.raise_for_status()
+
+        items = response.json().get('vpcsubnets', [])
+        print(f"✅ 서브넷 목록 조회 성공: {len(items)}개 (Region: {region_code})")
+        return items
+
+    except requests.exceptions.HTTPError as http_err:
+        print(f"❗ 서브넷 목록 조회 중 HTTP 오류 발생: {http_err}")
+        print(f"    응답 내용: {http_err.response.text}")
+        return None
+    except Exception as e:
+        print(f"❗ 서브넷 목록 조회 중 예상치 못한 오류 발생: {e}")
+        return None
+
+def delete_vpc_subnet(token: str, subnet_id: str, region_code: str = "kr1"):
+    """
+    VPC 서브넷을 삭제합니다. 서브넷에 연결된 포트(인스턴스)가 없어야 합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param subnet_id: 삭제할 서브넷의 ID
+    :param region_code: 리전 코드
+    :return: 성공 시 True, 실패 시 False
+    """
+    ctx = as_context(token)
+    url = ctx.url("network", f"/v2.0/vpcsubnets/{subnet_id}", region_code)
+
+    try:
+        response = ctx.session.delete(url, headers=ctx.headers)
+        response.raise_for_status()
+
+        print(f"✅ 서브넷 '{subnet_id}' 삭제 성공")
+        return True
+
+    except requests.exceptions.HTTPError as http_err:
+        print(f"❗ 서브넷 삭제 중 HTTP 오류 발생: {http_err}")
+        print(f"    응답 내용: {http_err.response.text}")
+        return False
+    except Exception as e:
+        print(f"❗ 서브넷 삭제 중 예상치 못한 오류 발생: {e}")
+        return False
+
 # --- Internet Gateway & Routing ---
 
 def get_external_network_id(token: str, region_code: str = "kr1"):
@@ -142,20 +239,16 @@ def get_external_network_id(token: str, region_code: str = "kr1"):
     외부 연결이 가능한 네트워크(VPC)의 ID를 조회합니다.
     이 ID는 인터넷 게이트웨이 생성 및 Floating IP 할당에 사용됩니다.
 
-    :param token: 인증 토큰
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
     :param region_code: 리전 코드
     :return: 성공 시 외부 네트워크 ID, 실패 시 None
     """
-    NETWORK_API_URL = f"https://{region_code}-api-network-infrastructure.nhncloudservice.com"
-    url = f"{NETWORK_API_URL}/v2.0/vpcs?router:external=true"
+    ctx = as_context(token)
+    url = ctx.url("network", "/v2.0/vpcs?router:external=true", region_code)
 
-    headers = {
-        "X-Auth-Token": token,
-        "Content-Type": "application/json"
-    }
 
     try:
-        response = requests.get(url, headers=headers)
+        response = ctx.session.get(url, headers=ctx.headers)
         response.raise_for_status()
 
         vpcs_data = response.json().get('vpcs', [])
@@ -181,19 +274,14 @@ def create_internet_gateway(token: str, ig_name: str, external_network_id: str,
     """
     인터넷 게이트웨이를 생성합니다.
 
-    :param token: 인증 토큰
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
     :param ig_name: 생성할 인터넷 게이트웨이의 이름
     :param external_network_id: 연결할 외부 네트워크의 ID
     :param region_code: 리전 코드
     :return: 성공 시 인터넷 게이트웨이 ID, 실패 시 None
     """
-    NETWORK_API_URL = f"https://{region_code}-api-network-infrastructure.nhncloudservice.com"
-    url = f"{NETWORK_API_URL}/v2.0/internetgateways"
-    
-    headers = {
-        "X-Auth-Token": token,
-        "Content-Type": "application/json"
-    }
+    ctx = as_context(token)
+    url = ctx.url("network", "/v2.0/internetgateways", region_code)
     
     payload = {
         "internetgateway": {
@@ -203,7 +291,7 @@ def create_internet_gateway(token: str, ig_name: str, external_network_id: str,
     }
     
     try:
-        response = requests.post(url, headers=headers, data=json.dumps(payload))
+        response = ctx.session.post(url, headers=ctx.headers, data=json.dumps(payload))
         response.raise_for_status()
         
         ig_info = response.json().get('internetgateway', {})
@@ -222,26 +310,21 @@ def attach_gateway_to_routing_table(token: str, routing_table_id: str, internet_
     """
     라우팅 테이블에 인터넷 게이트웨이를 연결합니다.
 
-    :param token: 인증 토큰
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
     :param routing_table_id: 인터넷 게이트웨이를 연결할 라우팅 테이블의 ID
     :param internet_gateway_id: 연결할 인터넷 게이트웨이의 ID
     :param region_code: 리전 코드
     :return: 성공 시 True, 실패 시 False
     """
-    NETWORK_API_URL = f"https://{region_code}-api-network-infrastructure.nhncloudservice.com"
-    url = f"{NETWORK_API_URL}/v2.0/routingtables/{routing_table_id}/attach_gateway"
-    
-    headers = {
-        "X-Auth-Token": token,
-        "Content-Type": "application/json"
-    }
+    ctx = as_context(token)
+    url = ctx.url("network", f"/v2.0/routingtables/{routing_table_id}/attach_gateway", region_code)
     
     payload = {
         "gateway_id": internet_gateway_id
     }
     
     try:
-        response = requests.put(url, headers=headers, data=json.dumps(payload))
+        response = ctx.session.put(url, headers=ctx.headers, data=json.dumps(payload))
         response.raise_for_status()
         
         print(f"✅ 라우팅 테이블 '{routing_table_id}'에 인터넷 게이트웨이 연결 성공")
@@ -255,24 +338,128 @@ def attach_gateway_to_routing_table(token: str, routing_table_id: str, internet_
         print(f"❗ 라우팅 테이블 게이트웨이 연결 중 예상치 못한 오류 발생: {e}")
         return False
 
+def detach_gateway_from_routing_table(token: str, routing_table_id: str, region_code: str = "kr1"):
+    """
+    라우팅 테이블에서 인터넷 게이트웨이 연결을 해제합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param routing_table_id: 게이트웨이 연결을 해제할 라우팅 테이블의 ID
+    :param region_code: 리전 코드
+    :return: 성공 시 True, 실패 시 False
+    """
+    ctx = as_context(token)
+    url = ctx.url("network", f"/v2.0/routingtables/{routing_table_id}/detach_gateway", region_code)
+
+    try:
+        response = ctx.session.put(url, headers=ctx.headers, data=json.dumps({}))
+        response.raise_for_status()
+
+        print(f"✅ 라우팅 테이블 '{routing_table_id}'의 인터넷 게이트웨이 연결 해제 성공")
+        return True
+
+    except requests.exceptions.HTTPError as http_err:
+        print(f"❗ 라우팅 테이블 게이트웨이 연결 해제 중 HTTP 오류 발생: {http_err}")
+        print(f"    응답 내용: {http_err.response.text}")
+        return False
+    except Exception as e:
+        print(f"❗ 라우팅 테이블 게이트웨이 연결 해제 중 예상치 못한 오류 발생: {e}")
+        return False
+
+def list_routing_tables(token: str, region_code: str = "kr1"):
+    """
+    라우팅 테이블 목록을 조회합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param region_code: 리전 코드
+    :return: 성공 시 라우팅 테이블 정보 dict의 리스트, 실패 시 None
+    """
+    ctx = as_context(token)
+    url = ctx.url("network", "/v2.0/routingtables", region_code)
+
+    try:
+        response = ctx.session.get(url, headers=ctx.headers)
+        response.raise_for_status()
+
+        items = response.json().get('routingtables', [])
+        print(f"✅ 라우팅 테이블 목록 조회 성공: {len(items)}개 (Region: {region_code})")
+        return items
+
+    except requests.exceptions.HTTPError as http_err:
+        print(f"❗ 라우팅 테이블 목록 조회 중 HTTP 오류 발생: {http_err}")
+        print(f"    응답 내용: {http_err.response.text}")
+        return None
+    except Exception as e:
+        print(f"❗ 라우팅 테이블 목록 조회 중 예상치 못한 오류 발생: {e}")
+        return None
+
+def list_internet_gateways(token: str, region_code: str = "kr1"):
+    """
+    인터넷 게이트웨이 목록을 조회합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param region_code: 리전 코드
+    :return: 성공 시 인터넷 게이트웨이 정보 dict의 리스트, 실패 시 None
+    """
+    ctx = as_context(token)
+    url = ctx.url("network", "/v2.0/internetgateways", region_code)
+
+    try:
+        response = ctx.session.get(url, headers=ctx.headers)
+        response.raise_for_status()
+
+        items = response.json().get('internetgateways', [])
+        print(f"✅ 인터넷 게이트웨이 목록 조회 성공: {len(items)}개 (Region: {region_code})")
+        return items
+
+    except requests.exceptions.HTTPError as http_err:
+        print(f"❗ 인터넷 게이트웨이 목록 조회 중 HTTP 오류 발생: {http_err}")
+        print(f"    응답 내용: {http_err.response.text}")
+        return None
+    except Exception as e:
+        print(f"❗ 인터넷 게이트웨이 목록 조회 중 예상치 못한 오류 발생: {e}")
+        return None
+
+def delete_internet_gateway(token: str, internet_gateway_id: str, region_code: str = "kr1"):
+    """
+    인터넷 게이트웨이를 삭제합니다. 라우팅 테이블과의 연결을 먼저 해제해야 합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param internet_gateway_id: 삭제할 인터넷 게이트웨이의 ID
+    :param region_code: 리전 코드
+    :return: 성공 시 True, 실패 시 False
+    """
+    ctx = as_context(token)
+    url = ctx.url("network", f"/v2.0/internetgateways/{internet_gateway_id}", region_code)
+
+    try:
+        response = ctx.session.delete(url, headers=ctx.headers)
+        response.raise_for_status()
+
+        print(f"✅ 인터넷 게이트웨이 '{internet_gateway_id}' 삭제 성공")
+        return True
+
+    except requests.exceptions.HTTPError as http_err:
+        print(f"❗ 인터넷 게이트웨이 삭제 중 HTTP 오류 발생: {http_err}")
+        print(f"    응답 내용: {http_err.response.text}")
+        return False
+    except Exception as e:
+        print(f"❗ 인터넷 게이트웨이 삭제 중 예상치 못한 오류 발생: {e}")
+        return False
+
 # --- Floating IP ---
 
 def create_floating_ip(token: str, floating_network_id: str, region_code: str = "kr1"):
     """
     Floating IP (공인 IP)를 생성(할당)합니다.
 
-    :param token: 인증 토큰
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
     :param floating_network_id: Floating IP를 할당할 외부 네트워크의 ID
     :param region_code: 리전 코드
     :return: 성공 시 Floating IP 정보(id, ip_address)가 담긴 dict, 실패 시 None
     """
-    NETWORK_API_URL = f"https://{region_code}-api-network-infrastructure.nhncloudservice.com"
-    url = f"{NETWORK_API_URL}/v2.0/floatingips"
+    ctx = as_context(token)
+    url = ctx.url("network", "/v2.0/floatingips", region_code)
 
-    headers = {
-        "X-Auth-Token": token,
-        "Content-Type": "application/json"
-    }
 
     payload = {
         "floatingip": {
@@ -281,7 +468,7 @@ def create_floating_ip(token: str, floating_network_id: str, region_code: str =
     }
 
     try:
-        response = requests.post(url, headers=headers, data=json.dumps(payload))
+        response = ctx.session.post(url, headers=ctx.headers, data=json.dumps(payload))
         response.raise_for_status()
 
         fip_info = response.json().get('floatingip', {})
@@ -303,19 +490,15 @@ def associate_floating_ip(token: str, floating_ip_id: str, port_id: str, region_
     """
     Floating IP를 인스턴스의 포트에 연결합니다.
 
-    :param token: 인증 토큰
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
     :param floating_ip_id: 연결할 Floating IP의 ID
     :param port_id: Floating IP를 연결할 인스턴스 포트의 ID
     :param region_code: 리전 코드
     :return: 성공 시 True, 실패 시 False
     """
-    NETWORK_API_URL = f"https://{region_code}-api-network-infrastructure.nhncloudservice.com"
-    url = f"{NETWORK_API_URL}/v2.0/floatingips/{floating_ip_id}"
+    ctx = as_context(token)
+    url = ctx.url("network", f"/v2.0/floatingips/{floating_ip_id}", region_code)
 
-    headers = {
-        "X-Auth-Token": token,
-        "Content-Type": "application/json"
-    }
 
     payload = {
         "floatingip": {
@@ -324,7 +507,7 @@ def associate_floating_ip(token: str, floating_ip_id: str, port_id: str, region_
     }
 
     try:
-        response = requests.put(url, headers=headers, data=json.dumps(payload))
+        response = ctx.session.put(url, headers=ctx.headers, data=json.dumps(payload))
         response.raise_for_status()
 
         print(f"✅ Floating IP '{floating_ip_id}'를 포트 '{port_id}'에 성공적으로 연결했습니다.")
@@ -337,3 +520,87 @@ def associate_floating_ip(token: str, floating_ip_id: str, port_id: str, region_
     except Exception as e:
         print(f"❗ Floating IP 연결 중 예상치 못한 오류 발생: {e}")
         return False
+
+def delete_floating_ip(token: str, floating_ip_id: str, region_code: str = "kr1"):
+    """
+    Floating IP를 삭제(반납)합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param floating_ip_id: 삭제할 Floating IP의 ID
+    :param region_code: 리전 코드
+    :return: 성공 시 True, 실패 시 False
+    """
+    ctx = as_context(token)
+    url = ctx.url("network", f"/v2.0/floatingips/{floating_ip_id}", region_code)
+
+
+    try:
+        response = ctx.session.delete(url, headers=ctx.headers)
+        response.raise_for_status()
+
+        print(f"✅ Floating IP '{floating_ip_id}' 삭제 성공")
+        return True
+
+    except requests.exceptions.HTTPError as http_err:
+        print(f"❗ Floating IP 삭제 중 HTTP 오류 발생: {http_err}")
+        print(f"    응답 내용: {http_err.response.text}")
+        return False
+    except Exception as e:
+        print(f"❗ Floating IP 삭제 중 예상치 못한 오류 발생: {e}")
+        return False
+
+def list_floating_ips(token: str, region_code: str = "kr1"):
+    """
+    Floating IP 목록을 조회합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param region_code: 리전 코드
+    :return: 성공 시 Floating IP 정보 dict의 리스트, 실패 시 None
+    """
+    ctx = as_context(token)
+    url = ctx.url("network", "/v2.0/floatingips", region_code)
+
+    try:
+        response = ctx.session.get(url, headers=ctx.headers)
+        response.raise_for_status()
+
+        items = response.json().get('floatingips', [])
+        print(f"✅ Floating IP 목록 조회 성공: {len(items)}개 (Region: {region_code})")
+        return items
+
+    except requests.exceptions.HTTPError as http_err:
+        print(f"❗ Floating IP 목록 조회 중 HTTP 오류 발생: {http_err}")
+        print(f"    응답 내용: {http_err.response.text}")
+        return None
+    except Exception as e:
+        print(f"❗ Floating IP 목록 조회 중 예상치 못한 오류 발생: {e}")
+        return None
+
+# --- Port ---
+
+def list_ports(token: str, region_code: str = "kr1"):
+    """
+    포트 목록을 조회합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param region_code: 리전 코드
+    :return: 성공 시 포트 정보 dict의 리스트, 실패 시 None
+    """
+    ctx = as_context(token)
+    url = ctx.url("network", "/v2.0/ports", region_code)
+
+    try:
+        response = ctx.session.get(url, headers=ctx.headers)
+        response.raise_for_status()
+
+        items = response.json().get('ports', [])
+        print(f"✅ 포트 목록 조회 성공: {len(items)}개 (Region: {region_code})")
+        return items
+
+    except requests.exceptions.HTTPError as http_err:
+        print(f"❗ 포트 목록 조회 중 HTTP 오류 발생: {http_err}")
+        print(f"    응답 내용: {http_err.response.text}")
+        return None
+    except Exception as e:
+        print(f"❗ 포트 목록 조회 중 예상치 못한 오류 발생: {e}")
+        return None
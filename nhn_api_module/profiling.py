@@ -0,0 +1,387 @@
+# nhn_api_module/profiling.py
+
+"""
+프로비저닝 실행을 단계(phase)와 API 호출 단위로 측정하는 모듈입니다.
+- 단계별 소요 시간 (컨텍스트 매니저 또는 begin_phase/end_phase)
+- 단계 안에서 나간 API 호출 기록 (ClientContext의 세션을 감싸서 측정)
+- 워터폴/크리티컬 패스 텍스트 보고서
+- Chrome Trace(JSON) 내보내기 (chrome://tracing 또는 https://ui.perfetto.dev 에서 열기)
+
+사용 예시:
+    profiler = Profiler()
+    ctx = profiler.instrument(create_client_context(get_token()))
+    with profiler.phase("VPC 생성"):
+        create_vpc(ctx, "my-vpc", "10.0.0.0/16")
+    print(profiler.report())
+    profiler.save_chrome_trace("trace.json")
+"""
+
+import json
+import os
+import re
+import threading
+import time
+import unicodedata
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+# 보고서에서 같은 종류의 호출을 묶기 위해 경로 안의 리소스 ID를 치환하는 패턴입니다.
+_ID_PATTERN = re.compile(r"/(?:[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}|[0-9a-fA-F]{32})(?=/|$)")
+
+class Span:
+    """측정된 한 구간(단계 또는 API 호출)입니다. 시간은 Profiler 시작 시점 기준 초 단위입니다."""
+
+    __slots__ = ("name", "kind", "start", "end", "thread_id", "thread_name", "parent", "args")
+
+    def __init__(self, name: str, kind: str, start: float, thread, parent=None, args: dict = None):
+        self.name = name
+        self.kind = kind  # "phase" 또는 "call"
+        self.start = start
+        self.end = None
+        self.thread_id = thread.ident
+        self.thread_name = thread.name
+        self.parent = parent
+        self.args = args or {}
+
+    @property
+    def duration(self):
+        return (self.end if self.end is not None else self.start) - self.start
+
+class Profiler:
+    """
+    단계와 API 호출 구간을 기록하는 프로파일러입니다. 여러 스레드에서 동시에 사용할 수 있습니다.
+
+    단계는 스레드별로 중첩되며, API 호출은 호출한 스레드의 현재 단계에 속합니다.
+    단계 밖(ThreadPoolExecutor 워커 등)에서 나간 호출은 보고서에서 시간이 겹치는 단계에 포함됩니다.
+    """
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.spans = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _now(self):
+        return time.perf_counter() - self.origin
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _add(self, span: Span):
+        with self._lock:
+            self.spans.append(span)
+        return span
+
+    # --- 단계 측정 ---
+
+    @contextmanager
+    def phase(self, name: str, **args):
+        """
+        with 블록을 하나의 단계로 측정합니다. 블록 안에서 다시 phase()를 쓰면 하위 단계가 됩니다.
+
+        :param name: 단계 이름
+        :param args: Chrome Trace에 함께 기록할 추가 정보
+        """
+        span = self._open_phase(name, args)
+        try:
+            yield span
+        finally:
+            self._close_phase(span)
+
+    def begin_phase(self, name: str, **args):
+        """
+        순차적으로 진행되는 스크립트에서 새 단계를 시작합니다.
+        같은 스레드에서 begin_phase()로 시작한 이전 단계가 열려 있으면 먼저 종료합니다.
+        """
+        self.end_phase()
+        span = self._open_phase(name, args)
+        self._local.sequential = span
+        return span
+
+    def end_phase(self):
+        """begin_phase()로 시작한 현재 단계를 종료합니다. (열린 단계가 없으면 아무것도 하지 않음)"""
+        span = getattr(self._local, "sequential", None)
+        if span is not None:
+            self._local.sequential = None
+            self._close_phase(span)
+
+    def _open_phase(self, name, args):
+        stack = self._stack()
+        span = self._add(Span(name, "phase", self._now(), threading.current_thread(), stack[-1] if stack else None, args))
+        stack.append(span)
+        return span
+
+    def _close_phase(self, span):
+        span.end = self._now()
+        stack = self._stack()
+        # 안쪽에서 닫히지 않은 단계가 있으면 함께 닫습니다.
+        while stack:
+            top = stack.pop()
+            if top is span:
+                break
+            if top.end is None:
+                top.end = span.end
+
+    # --- API 호출 측정 ---
+
+    def record_call(self, method: str, url: str, start: float, end: float, status=None, error: str = None):
+        """
+        API 호출 하나를 기록합니다. (ProfilingSession이 호출)
+
+        :param start: 호출 시작 시각 (time.perf_counter())
+        :param end: 호출 종료 시각 (time.perf_counter())
+        """
+        parts = urlsplit(url)
+        path = _ID_PATTERN.sub("/{id}", parts.path)
+        stack = self._stack()
+        args = {"method": method, "host": parts.netloc, "path": parts.path, "status": status}
+        if error:
+            args["error"] = error
+        span = Span(f"{method} {path}", "call", start - self.origin, threading.current_thread(), stack[-1] if stack else None, args)
+        span.end = end - self.origin
+        self._add(span)
+
+    def instrument(self, ctx):
+        """
+        ClientContext의 세션을 ProfilingSession으로 감싸, 이 컨텍스트로 나가는 모든 API 호출을 기록합니다.
+
+        :param ctx: ClientContext
+        :return: 같은 ClientContext (체이닝용)
+        """
+        if not isinstance(ctx.session, ProfilingSession):
+            ctx.session = ProfilingSession(ctx.session, self)
+        return ctx
+
+    # --- 보고서 ---
+
+    def _snapshot(self):
+        """(내부 함수) 종료된 구간만 복사하고, 단계가 없는 호출을 시간이 겹치는 가장 안쪽 단계에 배정합니다."""
+        with self._lock:
+            spans = [s for s in self.spans if s.end is not None]
+        phases = [s for s in spans if s.kind == "phase"]
+        owners = {}
+        for span in spans:
+            owner = span.parent
+            if span.kind == "call" and owner is None:
+                containing = [p for p in phases if p.start <= span.start and span.end <= p.end]
+                if containing:
+                    owner = max(containing, key=lambda p: p.start)
+            owners[id(span)] = owner
+        return spans, owners
+
+    def critical_path(self):
+        """
+        실행 종료 시각을 결정한 구간들의 체인(크리티컬 패스)을 반환합니다.
+
+        가장 늦게 끝난 최상위 단계에서 시작해, 그 단계가 시작되기 직전에 끝난 단계를 거꾸로 따라갑니다.
+        경로 위의 각 단계 안에서도 같은 방식으로 하위 단계/API 호출의 체인을 구합니다.
+
+        :return: [(깊이, Span), ...] 실행 순서
+        """
+        spans, owners = self._snapshot()
+        children = {}
+        for span in spans:
+            children.setdefault(id(owners[id(span)]), []).append(span)
+
+        def chain(candidates, depth):
+            path = []
+            remaining = sorted(candidates, key=lambda s: s.end)
+            limit = None
+            while remaining:
+                if limit is not None:
+                    remaining = [s for s in remaining if s.end <= limit + 1e-6]
+                    if not remaining:
+                        break
+                current = remaining.pop()
+                path.append((depth, current))
+                limit = current.start
+            result = []
+            for d, span in reversed(path):
+                result.append((d, span))
+                result.extend(chain(children.get(id(span), []), d + 1))
+            return result
+
+        return chain(children.get(id(None), []), 0)
+
+    def report(self, top_calls: int = 5, width: int = 40):
+        """
+        워터폴(단계별 시작 시각/소요 시간/API 호출 통계)과 크리티컬 패스를 텍스트로 반환합니다.
+
+        단계의 `API` 열은 그 단계 안의 API 호출이 실제로 진행 중이던 시간(겹치는 구간은 한 번만),
+        `대기` 열은 나머지 시간(폴링 sleep, 로컬 처리 등)입니다.
+
+        :param top_calls: 오래 걸린 호출 종류를 몇 개까지 보여줄지
+        :param width: 워터폴 막대 너비 (문자 수)
+        :return: 보고서 문자열
+        """
+        spans, owners = self._snapshot()
+        if not spans:
+            return "(측정된 구간이 없습니다)"
+        phases = sorted((s for s in spans if s.kind == "phase"), key=lambda s: s.start)
+        calls = [s for s in spans if s.kind == "call"]
+        total = max(s.end for s in spans) or 1e-9
+
+        depth = {}
+        def depth_of(span):
+            if id(span) not in depth:
+                depth[id(span)] = 0 if span.parent is None else depth_of(span.parent) + 1
+            return depth[id(span)]
+
+        def calls_under(phase):
+            result = []
+            for call in calls:
+                owner = owners[id(call)]
+                while owner is not None and owner is not phase:
+                    owner = owner.parent
+                if owner is phase:
+                    result.append(call)
+            return result
+
+        lines = [f"=== 프로파일 보고서 (전체 {total:.2f}초, API 호출 {len(calls)}회) ===", "", "[워터폴]"]
+        lines.append(f"{_pad('단계', 34)} {_pad('시작', 7, True)} {_pad('소요', 7, True)} {_pad('API', 7, True)} {_pad('대기', 7, True)} {_pad('호출', 4, True)}  타임라인")
+        for phase in phases:
+            phase_calls = calls_under(phase)
+            busy = _union_length((c.start, c.end) for c in phase_calls)
+            bar_start = int(phase.start / total * width)
+            bar_len = max(1, int(round(phase.duration / total * width)))
+            bar = " " * bar_start + "█" * min(bar_len, width - bar_start)
+            label = "  " * depth_of(phase) + phase.name
+            lines.append(
+                f"{_pad(label, 34)} {phase.start:>6.2f}s {phase.duration:>6.2f}s "
+                f"{busy:>6.2f}s {max(0.0, phase.duration - busy):>6.2f}s {len(phase_calls):>4}  |{bar:<{width}}|"
+            )
+
+        if calls:
+            by_name = {}
+            for call in calls:
+                stats = by_name.setdefault(call.name, [0, 0.0, 0.0])
+                stats[0] += 1
+                stats[1] += call.duration
+                stats[2] = max(stats[2], call.duration)
+            lines += ["", f"[API 호출 누적 시간 상위 {top_calls}개]"]
+            for name, (count, total_time, longest) in sorted(by_name.items(), key=lambda kv: -kv[1][1])[:top_calls]:
+                lines.append(f"  {total_time:>7.2f}s  {count:>4}회  최대 {longest:>6.2f}s  {name}")
+
+        lines += ["", "[크리티컬 패스]"]
+        # 상태 폴링처럼 연속된 같은 호출은 첫 호출 시작부터 마지막 호출 종료까지 한 줄로 묶습니다.
+        path = []
+        for d, span in self.critical_path():
+            last = path[-1] if path else None
+            if last and span.kind == "call" and last[0] == d and last[1].kind == "call" and last[1].name == span.name:
+                last[2] += 1
+                last[4] = span.end
+            else:
+                path.append([d, span, 1, span.start, span.end])
+        for d, span, count, start, end in path:
+            share = (end - start) / total * 100
+            repeat = f" ×{count}" if count > 1 else ""
+            lines.append(f"  {'  ' * d}{end - start:>7.2f}s {share:>5.1f}%  {span.name}{repeat}")
+        return "\n".join(lines)
+
+    def to_chrome_trace(self):
+        """
+        Chrome Trace Event 형식(dict)으로 변환합니다. 단계와 API 호출이 스레드별 트랙에 표시됩니다.
+
+        :return: {"traceEvents": [...], "displayTimeUnit": "ms"}
+        """
+        spans, _ = self._snapshot()
+        pid = os.getpid()
+        events = []
+        threads = {}
+        for span in spans:
+            threads.setdefault(span.thread_id, span.thread_name)
+            events.append({
+                "name": span.name,
+                "cat": span.kind,
+                "ph": "X",
+                "ts": round(span.start * 1e6, 3),
+                "dur": round(span.duration * 1e6, 3),
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": {k: v for k, v in span.args.items() if v is not None},
+            })
+        for tid, thread_name in threads.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": thread_name}})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save_chrome_trace(self, path: str):
+        """Chrome Trace JSON 파일로 저장합니다."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_chrome_trace(), f, ensure_ascii=False)
+        print(f"✅ Chrome Trace를 {path} 파일에 저장했습니다. (chrome://tracing 또는 ui.perfetto.dev에서 열기)")
+
+class ProfilingSession:
+    """
+    requests.Session과 같은 인터페이스를 가진 세션을 감싸, 모든 요청의 소요 시간을 Profiler에 기록합니다.
+    Profiler.instrument(ctx)로 컨텍스트에 설치합니다.
+    """
+
+    def __init__(self, session, profiler: Profiler):
+        self.session = session
+        self.profiler = profiler
+
+    def _timed(self, method: str, url: str, **kwargs):
+        started = time.perf_counter()
+        try:
+            response = getattr(self.session, method.lower())(url, **kwargs)
+        except Exception as e:
+            self.profiler.record_call(method, url, started, time.perf_counter(), error=type(e).__name__)
+            raise
+        self.profiler.record_call(method, url, started, time.perf_counter(), response.status_code)
+        return response
+
+    def get(self, url, **kwargs):
+        return self._timed("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self._timed("POST", url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self._timed("PUT", url, **kwargs)
+
+    def patch(self, url, **kwargs):
+        return self._timed("PATCH", url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self._timed("DELETE", url, **kwargs)
+
+    def head(self, url, **kwargs):
+        return self._timed("HEAD", url, **kwargs)
+
+    def __getattr__(self, name):
+        # stats, invalidate(), close() 등 나머지 속성은 감싼 세션으로 넘깁니다.
+        return getattr(self.session, name)
+
+def _union_length(intervals):
+    """(내부 함수) 겹치는 구간은 한 번만 세어 구간들의 전체 길이를 구합니다."""
+    total = 0.0
+    current_start = current_end = None
+    for start, end in sorted(intervals):
+        if current_end is None or start > current_end:
+            if current_end is not None:
+                total += current_end - current_start
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+    if current_end is not None:
+        total += current_end - current_start
+    return total
+
+def _pad(text: str, width: int, right: bool = False):
+    """(내부 함수) 한글처럼 두 칸을 차지하는 문자를 고려해 보고서 열 너비에 맞게 자르거나 채웁니다."""
+    def cell(ch):
+        return 2 if unicodedata.east_asian_width(ch) in ("W", "F") else 1
+    used = 0
+    clipped = ""
+    for ch in text:
+        if used + cell(ch) > width:
+            clipped = clipped[:-1] + "…" if clipped else ""
+            used = sum(cell(c) for c in clipped)
+            break
+        clipped += ch
+        used += cell(ch)
+    fill = " " * (width - used)
+    return fill + clipped if right else clipped + fill
@@ -0,0 +1,274 @@
+# nhn_api_module/quota.py
+
+"""
+컴퓨트/네트워크 쿼터(한도와 사용량)를 조회하고, 대량 생성 전에 남은 용량을 확인해 요청을 받아들이거나 줄이는 모듈입니다.
+- 한도와 사용량을 조회해 일정 시간 캐시
+- 진행 중인 작업이 쓸 용량을 로컬에서 예약 (같은 프로세스의 동시 작업이 같은 여유분을 중복으로 쓰지 않음)
+- 들어갈 수 없는 대량 요청은 API를 호출하기 전에 거절하거나 들어가는 만큼으로 줄임
+  (200대 생성이 140번째에서 쿼터 초과로 실패해 절반만 만들어진 상태와 그 정리 작업을 방지)
+
+사용 예시:
+    quota = QuotaTracker(ctx, tenant_id, "kr1")
+    result = launch_fleet(ctx, tenant_id, names, ..., quota=quota)   # 들어가는 만큼만 생성, 나머지는 result["rejected"]
+
+    reservation = quota.reserve({"vpc": 1, "floatingip": 1})       # 여유가 없거나 쿼터 조회에 실패하면 None
+    if reservation is None:
+        ...                                                         # 리소스를 만들지 않고 실패 처리
+    else:
+        with reservation:                                           # 블록이 끝나면 성공/실패와 관계없이 예약 해제
+            ...
+
+    (compute.launch_instance_with_floating_ip와 stack.provision_stack도 quota를 받아 생성 전에 예약합니다.)
+"""
+
+import requests
+import threading
+import time
+
+from .client import as_context
+
+# 컴퓨트 limits 응답(absolute)의 (한도 키, 사용량 키)
+COMPUTE_LIMIT_KEYS = {
+    "instances": ("maxTotalInstances", "totalInstancesUsed"),
+    "cores": ("maxTotalCores", "totalCoresUsed"),
+    "ram": ("maxTotalRAMSize", "totalRAMUsed"),
+    "keypairs": ("maxTotalKeypairs", "totalKeyPairsUsed"),
+}
+
+# 네트워크 쿼터 상세(사용량)를 제공하지 않을 때 사용량을 세기 위한 목록 API (경로, 응답 키)
+NETWORK_USAGE_LISTS = {
+    "vpc": ("/v2.0/vpcs", "vpcs"),
+    "floatingip": ("/v2.0/floatingips", "floatingips"),
+    "port": ("/v2.0/ports", "ports"),
+    "security_group": ("/v2.0/security-groups", "security_groups"),
+}
+
+# 쿼터 캐시 유지 시간 (초)
+DEFAULT_QUOTA_TTL = 60
+
+def _limit(value):
+    """(내부 함수) 음수(-1)는 무제한이므로 None으로 바꿉니다."""
+    return None if value is None or value < 0 else value
+
+def get_compute_limits(token: str, tenant_id: str, region_code: str = "kr1"):
+    """
+    컴퓨트 쿼터(인스턴스 수, vCPU, 메모리, 키페어)의 한도와 사용량을 조회합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param tenant_id: 테넌트 ID
+    :param region_code: 리전 코드
+    :return: 성공 시 {"instances": {"limit", "used"}, "cores": ..., "ram": ..., "keypairs": ...} (limit이 None이면 무제한), 실패 시 None
+    """
+    ctx = as_context(token)
+    url = ctx.url("compute", f"/v2/{tenant_id}/limits", region_code)
+
+    try:
+        response = ctx.session.get(url, headers=ctx.headers)
+        response.raise_for_status()
+
+        absolute = response.json().get('limits', {}).get('absolute', {})
+        return {
+            resource: {"limit": _limit(absolute.get(limit_key)), "used": absolute.get(used_key) or 0}
+            for resource, (limit_key, used_key) in COMPUTE_LIMIT_KEYS.items()
+            if limit_key in absolute
+        }
+
+    except requests.exceptions.HTTPError as http_err:
+        print(f"❗ 컴퓨트 쿼터 조회 중 HTTP 오류 발생: {http_err}")
+        print(f"    응답 내용: {http_err.response.text}")
+        return None
+    except Exception as e:
+        print(f"❗ 컴퓨트 쿼터 조회 중 예상치 못한 오류 발생: {e}")
+        return None
+
+def get_network_quota(token: str, tenant_id: str, region_code: str = "kr1"):
+    """
+    네트워크 쿼터(VPC, Floating IP, 포트, 보안 그룹 등)의 한도와 사용량을 조회합니다.
+    쿼터 상세 API(/v2.0/quotas/{tenant_id}/details.json)를 우선 사용하고, 지원하지 않으면
+    한도 API와 NETWORK_USAGE_LISTS의 목록 조회로 사용량을 셉니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param tenant_id: 테넌트 ID
+    :param region_code: 리전 코드
+    :return: 성공 시 {리소스: {"limit", "used"}} (limit이 None이면 무제한), 실패 시 None
+    """
+    ctx = as_context(token)
+
+    try:
+        response = ctx.session.get(ctx.url("network", f"/v2.0/quotas/{tenant_id}/details.json", region_code), headers=ctx.headers)
+        if response.ok:
+            details = response.json().get('quota', {})
+            return {
+                resource: {"limit": _limit(value.get('limit')), "used": value.get('used') or 0}
+                for resource, value in details.items() if isinstance(value, dict)
+            }
+
+        response = ctx.session.get(ctx.url("network", f"/v2.0/quotas/{tenant_id}", region_code), headers=ctx.headers)
+        response.raise_for_status()
+        limits = response.json().get('quota', {})
+
+        quota = {}
+        for resource, (path, key) in NETWORK_USAGE_LISTS.items():
+            if resource not in limits:
+                continue
+            listed = ctx.session.get(ctx.url("network", path, region_code), headers=ctx.headers)
+            listed.raise_for_status()
+            quota[resource] = {"limit": _limit(limits[resource]), "used": len(listed.json().get(key, []))}
+        return quota
+
+    except requests.exceptions.HTTPError as http_err:
+        print(f"❗ 네트워크 쿼터 조회 중 HTTP 오류 발생: {http_err}")
+        print(f"    응답 내용: {http_err.response.text}")
+        return None
+    except Exception as e:
+        print(f"❗ 네트워크 쿼터 조회 중 예상치 못한 오류 발생: {e}")
+        return None
+
+def instance_demand(flavor: dict, with_floating_ip: bool = False):
+    """
+    인스턴스 한 대가 사용하는 쿼터를 계산합니다.
+
+    :param flavor: compute.get_flavor의 반환값 ({"vcpus", "ram"})
+    :param with_floating_ip: True이면 Floating IP 1개 포함
+    :return: {"instances": 1, "cores", "ram", "port": 1[, "floatingip": 1]}
+    """
+    demand = {"instances": 1, "cores": flavor["vcpus"], "ram": flavor["ram"], "port": 1}
+    if with_floating_ip:
+        demand["floatingip"] = 1
+    return demand
+
+class Reservation:
+    """
+    QuotaTracker.reserve/admit가 돌려주는 로컬 예약입니다.
+    작업이 끝나면(성공/실패와 관계없이) release()를 호출하거나 with 문으로 사용합니다.
+    """
+
+    def __init__(self, tracker, demand: dict):
+        self.tracker = tracker
+        self.demand = demand
+        self.released = False
+
+    def release(self):
+        """예약을 해제하고 쿼터 캐시를 무효화합니다. (생성된 리소스는 다음 조회부터 사용량에 반영됨) 여러 번 호출해도 안전합니다."""
+        self.tracker._release(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+class QuotaTracker:
+    """
+    테넌트/리전 하나의 쿼터를 캐시하고, 진행 중인 작업의 예약량을 빼서 실제로 쓸 수 있는 여유분을 계산합니다.
+    여러 스레드에서 같은 객체를 공유해 사용할 수 있습니다.
+    """
+
+    def __init__(self, token, tenant_id: str, region_code: str = "kr1", ttl: float = DEFAULT_QUOTA_TTL):
+        """
+        :param token: 인증 토큰 (문자열 또는 ClientContext)
+        :param tenant_id: 테넌트 ID
+        :param region_code: 리전 코드
+        :param ttl: 조회한 쿼터를 캐시할 시간 (초)
+        """
+        self.ctx = as_context(token)
+        self.tenant_id = tenant_id
+        self.region_code = region_code
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._quota = None
+        self._fetched_at = 0.0
+        self._reserved = {}
+
+    def _refresh_locked(self, force: bool):
+        if not force and self._quota is not None and time.monotonic() - self._fetched_at < self.ttl:
+            return self._quota
+        compute = get_compute_limits(self.ctx, self.tenant_id, self.region_code)
+        network = get_network_quota(self.ctx, self.tenant_id, self.region_code)
+        if compute is None or network is None:
+            return None
+        self._quota = {**network, **compute}
+        self._fetched_at = time.monotonic()
+        return self._quota
+
+    def _available_locked(self, quota, resource: str):
+        entry = quota.get(resource)
+        if entry is None or entry["limit"] is None:
+            return None
+        return entry["limit"] - entry["used"] - self._reserved.get(resource, 0)
+
+    def usage(self, refresh: bool = False):
+        """
+        리소스별 한도, 사용량, 로컬 예약량, 여유분을 조회합니다.
+
+        :param refresh: True이면 캐시를 무시하고 다시 조회
+        :return: 성공 시 {리소스: {"limit", "used", "reserved", "available"}} (한도가 없으면 limit/available은 None), 실패 시 None
+        """
+        with self._lock:
+            quota = self._refresh_locked(refresh)
+            if quota is None:
+                return None
+            return {
+                resource: dict(entry, reserved=self._reserved.get(resource, 0), available=self._available_locked(quota, resource))
+                for resource, entry in quota.items()
+            }
+
+    def invalidate(self):
+        """캐시를 비워 다음 확인 때 다시 조회하게 합니다."""
+        with self._lock:
+            self._quota = None
+
+    def admit(self, count: int, unit_demand: dict, min_count: int = 1):
+        """
+        같은 리소스를 count개 만드는 요청 중 쿼터 안에 들어가는 개수를 정하고 그만큼 예약합니다.
+
+        :param count: 요청한 개수
+        :param unit_demand: 하나가 사용하는 쿼터 (예: instance_demand(flavor))
+        :param min_count: 받아들일 최소 개수 (count와 같으면 전부 또는 전혀 생성하지 않음)
+        :return: (허용 개수, Reservation) 튜플, 허용 개수가 min_count보다 작거나 쿼터 조회에 실패하면 (0, None)
+        """
+        with self._lock:
+            quota = self._refresh_locked(False)
+            if quota is None:
+                print("🚨 쿼터를 조회하지 못해 요청을 받아들이지 않습니다.")
+                return 0, None
+
+            allowed, bottleneck = count, None
+            for resource, amount in unit_demand.items():
+                available = self._available_locked(quota, resource)
+                if available is None or amount <= 0:
+                    continue
+                fits = max(0, available // amount)
+                if fits < allowed:
+                    allowed, bottleneck = fits, resource
+
+            if allowed < max(min_count, 1):
+                print(f"❗ 쿼터 부족으로 요청을 거절합니다: {count}개 요청, {allowed}개 가능 ('{bottleneck}' 여유 부족)")
+                return 0, None
+            if allowed < count:
+                print(f"❗ 쿼터 부족으로 요청을 {count}개에서 {allowed}개로 줄입니다. ('{bottleneck}' 여유 부족)")
+
+            demand = {resource: amount * allowed for resource, amount in unit_demand.items()}
+            for resource, amount in demand.items():
+                self._reserved[resource] = self._reserved.get(resource, 0) + amount
+            return allowed, Reservation(self, demand)
+
+    def reserve(self, demand: dict):
+        """
+        여러 리소스를 한꺼번에 예약합니다. 하나라도 여유가 부족하면 아무것도 예약하지 않습니다.
+
+        :param demand: {리소스: 개수} (예: {"vpc": 1, "floatingip": 1})
+        :return: 성공 시 Reservation, 여유 부족 또는 쿼터 조회 실패 시 None
+        """
+        allowed, reservation = self.admit(1, demand, min_count=1)
+        return reservation if allowed else None
+
+    def _release(self, reservation: Reservation):
+        with self._lock:
+            if reservation.released:
+                return
+            reservation.released = True
+            for resource, amount in reservation.demand.items():
+                self._reserved[resource] = self._reserved.get(resource, 0) - amount
+            self._quota = None
@@ -0,0 +1,171 @@
+# nhn_api_module/readiness.py
+
+"""
+프로비저닝한 서버가 실제로 서비스를 시작했는지(HTTP 응답, TCP 포트 열림) 확인하는 모듈입니다.
+- asyncio로 많은 Floating IP를 동시에 점검 (추가 의존성 없음)
+- 대상별 지수 백오프(지터 포함)와 마감 시간
+- 준비된 대상은 즉시 콜백으로 알리고, 끝까지 준비되지 않은 대상은 마지막 오류와 함께 보고
+
+사용 예시:
+    result = wait_for_ready(["133.186.0.10", "133.186.0.11"], checks=[{"type": "http", "port": 80}], deadline_seconds=300)
+    print(result["not_ready"])
+"""
+
+import asyncio
+import random
+import ssl
+import time
+
+# 대상에 checks를 지정하지 않았을 때 사용하는 점검 항목 (웹 서버의 HTTP 80 응답)
+DEFAULT_CHECKS = ({"type": "http", "port": 80, "path": "/"},)
+
+# 준비 완료로 보는 HTTP 상태 코드 범위
+READY_STATUS_CODES = range(200, 400)
+
+async def probe_tcp(host: str, port: int, timeout: float = 3.0):
+    """
+    TCP 포트가 연결을 받는지 확인합니다.
+
+    :param host: 대상 주소
+    :param port: 포트
+    :param timeout: 연결 제한 시간 (초)
+    :return: (성공 여부, 상세 메시지) 튜플
+    """
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    except (OSError, asyncio.TimeoutError) as e:
+        return False, f"tcp {port}: {type(e).__name__} {e}".rstrip()
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+    return True, f"tcp {port}: 연결됨"
+
+async def probe_http(host: str, port: int = 80, path: str = "/", timeout: float = 3.0, use_tls: bool = False, status_codes=READY_STATUS_CODES):
+    """
+    HTTP GET 요청을 보내 응답 상태 코드를 확인합니다. (응답 헤더의 첫 줄만 읽음)
+
+    :param host: 대상 주소
+    :param port: 포트
+    :param path: 요청 경로
+    :param timeout: 연결과 응답을 합친 제한 시간 (초)
+    :param use_tls: True이면 HTTPS (인증서 검증 없음, 부팅 직후 자체 서명 인증서 대비)
+    :param status_codes: 준비 완료로 볼 상태 코드 목록
+    :return: (성공 여부, 상세 메시지) 튜플
+    """
+    ssl_context = None
+    if use_tls:
+        ssl_context = ssl.create_default_context()
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+
+    async def request():
+        reader, writer = await asyncio.open_connection(host, port, ssl=ssl_context)
+        try:
+            writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\nUser-Agent: nhn-readiness\r\nConnection: close\r\n\r\n".encode())
+            await writer.drain()
+            return await reader.readline()
+        finally:
+            writer.close()
+
+    try:
+        status_line = await asyncio.wait_for(request(), timeout)
+    except (OSError, asyncio.TimeoutError, ssl.SSLError) as e:
+        return False, f"http {port}{path}: {type(e).__name__} {e}".rstrip()
+
+    parts = status_line.decode("latin-1").split()
+    if len(parts) < 2 or not parts[1].isdigit():
+        return False, f"http {port}{path}: 잘못된 응답 {status_line[:40]!r}"
+    status = int(parts[1])
+    return status in status_codes, f"http {port}{path}: {status}"
+
+async def _run_check(host: str, check: dict, timeout: float):
+    if check.get("type", "http") == "tcp":
+        return await probe_tcp(host, check["port"], timeout)
+    return await probe_http(
+        host, check.get("port", 80), check.get("path", "/"), timeout,
+        check.get("tls", False), check.get("status_codes", READY_STATUS_CODES)
+    )
+
+async def _wait_for_target(target: dict, semaphore, initial_delay: float, max_delay: float, probe_timeout: float, on_ready):
+    """
+    (내부 함수) 대상 하나의 모든 점검 항목이 성공하거나 마감 시간이 지날 때까지 백오프하며 재시도합니다.
+    한 번 성공한 점검 항목은 다시 확인하지 않습니다.
+    """
+    host = target["host"]
+    pending = list(target.get("checks") or DEFAULT_CHECKS)
+    started = time.monotonic()
+    deadline = started + target["deadline_seconds"]
+    delay, attempts, last_error = initial_delay, 0, None
+
+    while True:
+        attempts += 1
+        remaining = []
+        async with semaphore:
+            results = await asyncio.gather(*(_run_check(host, check, probe_timeout) for check in pending))
+        for check, (ok, detail) in zip(pending, results):
+            if not ok:
+                remaining.append(check)
+                last_error = detail
+        pending = remaining
+
+        now = time.monotonic()
+        if not pending:
+            result = {"host": host, "ready": True, "elapsed": round(now - started, 2), "attempts": attempts, "last_error": None}
+            print(f"✅ {host} 준비 완료 ({result['elapsed']}초, 시도 {attempts}회)")
+            if on_ready:
+                on_ready(result)
+            return result
+        if now >= deadline:
+            print(f"❗ {host} 마감 시간 안에 준비되지 않았습니다: {last_error}")
+            return {"host": host, "ready": False, "elapsed": round(now - started, 2), "attempts": attempts, "last_error": last_error}
+
+        # 마감 직전에도 한 번 더 확인할 수 있도록 대기 시간을 남은 시간으로 자릅니다.
+        await asyncio.sleep(min(delay * random.uniform(0.5, 1.0), deadline - now))
+        delay = min(delay * 2, max_delay)
+
+def _normalize_target(target, checks, deadline_seconds):
+    if isinstance(target, str):
+        target = {"host": target}
+    return {
+        "host": target["host"],
+        "checks": target.get("checks") or checks,
+        "deadline_seconds": target.get("deadline_seconds", deadline_seconds),
+    }
+
+async def wait_for_ready_async(targets, checks=DEFAULT_CHECKS, deadline_seconds: float = 300, initial_delay: float = 1.0, max_delay: float = 15.0, probe_timeout: float = 3.0, max_concurrency: int = 256, on_ready=None):
+    """
+    여러 대상이 준비될 때까지 동시에 점검합니다. (asyncio 코루틴)
+
+    :param targets: 대상 주소(문자열) 또는 {"host", "checks", "deadline_seconds"} dict의 리스트
+    :param checks: 대상에 checks가 없을 때 사용할 점검 항목 리스트
+                   예: [{"type": "http", "port": 80, "path": "/"}, {"type": "tcp", "port": 22}]
+                   http 항목은 "tls", "status_codes"를 추가로 받을 수 있음
+    :param deadline_seconds: 대상별 마감 시간 (초, 대상 dict의 deadline_seconds가 우선)
+    :param initial_delay: 첫 재시도 대기 시간 (초, 실패할 때마다 두 배)
+    :param max_delay: 재시도 대기 시간 상한 (초)
+    :param probe_timeout: 점검 한 번의 제한 시간 (초)
+    :param max_concurrency: 동시에 점검하는 최대 대상 수
+    :param on_ready: 대상이 준비되는 즉시 호출할 콜백 on_ready(결과 dict) (선택)
+    :return: {"ready": [주소, ...], "not_ready": [주소, ...], "results": {주소: {"ready", "elapsed", "attempts", "last_error"}}}
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    normalized = [_normalize_target(target, checks, deadline_seconds) for target in targets]
+    results = await asyncio.gather(*(
+        _wait_for_target(target, semaphore, initial_delay, max_delay, probe_timeout, on_ready)
+        for target in normalized
+    ))
+    summary = {"ready": [], "not_ready": [], "results": {}}
+    for result in results:
+        summary["ready" if result["ready"] else "not_ready"].append(result["host"])
+        summary["results"][result["host"]] = result
+    print(f"--- 대상 {len(results)}개 중 준비 완료 {len(summary['ready'])}개, 미준비 {len(summary['not_ready'])}개 ---")
+    return summary
+
+def wait_for_ready(targets, checks=DEFAULT_CHECKS, deadline_seconds: float = 300, **kwargs):
+    """
+    wait_for_ready_async를 동기 코드에서 실행합니다. (이미 이벤트 루프가 실행 중인 곳에서는 wait_for_ready_async를 사용)
+    매개변수와 반환값은 wait_for_ready_async와 같습니다.
+    """
+    return asyncio.run(wait_for_ready_async(targets, checks, deadline_seconds, **kwargs))
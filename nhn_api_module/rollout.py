@@ -0,0 +1,172 @@
+# nhn_api_module/rollout.py
+
+"""
+인스턴스 그룹을 새 설정(User Data, 이미지 등)의 인스턴스로 몇 대씩(wave) 차례로 교체하는 롤링 업데이트 모듈입니다.
+- 각 wave: 교체 인스턴스 생성 → 준비 확인(cloud-init 완료, 선택적으로 HTTP/TCP) → 트래픽 이동 → 기존 인스턴스 삭제
+- 트래픽 이동은 로드 밸런서 풀 멤버 교체 또는 Floating IP 재연결
+- 기존 인스턴스는 교체 인스턴스가 트래픽을 받기 시작한 뒤에만 삭제하므로 교체 중에도 용량이 줄지 않음
+- 누적 실패율이 기준을 넘으면 다음 wave를 시작하지 않고 멈춤 (남은 인스턴스를 반환하므로 원인을 고친 뒤 이어서 실행)
+
+사용 예시:
+    result = rolling_replace(ctx, tenant_id, servers, launch_spec, subnet_id, web_lb=web_lb, wave_size=5)
+    if result["status"] == "paused":
+        print(result["failed"], result["remaining"])
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .bootlog import wait_for_cloud_init
+from .client import as_context
+from .compute import launch_fleet, delete_instance
+from .loadbalancer import add_pool_members, remove_pool_members
+from .networking import associate_floating_ip
+from .readiness import wait_for_ready
+
+def _cut_over_floating_ips(ctx, pairs, region_code):
+    """
+    (내부 함수) 기존 인스턴스의 Floating IP를 교체 인스턴스의 포트로 다시 연결합니다.
+    Floating IP가 없는 기존 인스턴스는 옮길 것이 없으므로 성공으로 봅니다.
+    :return: 트래픽 이동에 성공한 (기존, 교체) 쌍의 리스트
+    """
+    moved = []
+    for old, new in pairs:
+        fip_id = old.get("floating_ip_id")
+        if fip_id and not associate_floating_ip(ctx, fip_id, new["port_id"], region_code):
+            continue
+        if fip_id:
+            new["floating_ip_id"] = fip_id
+            new["floating_ip_address"] = old.get("floating_ip_address")
+        moved.append((old, new))
+    return moved
+
+def _cut_over_pool_members(ctx, web_lb, pairs, region_code):
+    """
+    (내부 함수) 교체 인스턴스를 로드 밸런서 풀에 등록한 뒤, 등록된 교체 인스턴스에 대응하는 기존 인스턴스를 풀에서 제거합니다.
+    :return: 트래픽 이동에 성공한 (기존, 교체) 쌍의 리스트
+    """
+    lb_id, pool_id = web_lb["loadbalancer_id"], web_lb["pool_id"]
+    added = add_pool_members(ctx, lb_id, pool_id, web_lb["subnet_id"], [new["address"] for _, new in pairs], web_lb["protocol_port"], region_code=region_code)
+    if added is None:
+        return []
+    registered = set(added["added"]) | set(added["existing"])
+    pairs = [(old, new) for old, new in pairs if new["address"] in registered]
+    removed = remove_pool_members(ctx, lb_id, pool_id, [old["address"] for old, _ in pairs], region_code)
+    if removed is None:
+        return []
+    # 풀에서 빠지지 않은 기존 인스턴스는 아직 트래픽을 받을 수 있으므로 삭제 대상에서 제외
+    not_removed = set(removed["failed"])
+    return [(old, new) for old, new in pairs if old["address"] not in not_removed]
+
+def _run_wave(ctx, tenant_id, wave, launch_spec, subnet_id, web_lb, readiness_checks, readiness_deadline, wait_cloud_init, name_suffix, region_code, max_workers):
+    """
+    (내부 함수) wave 하나를 교체합니다.
+    :return: (트래픽 이동에 성공한 (기존, 교체) 쌍의 리스트, 교체에 실패한 기존 인스턴스의 리스트)
+    """
+    spec = launch_spec
+    by_name = {f"{old['name']}-{name_suffix}": old for old in wave}
+    fleet = launch_fleet(
+        ctx, tenant_id, list(by_name), spec["key_name"], spec["image_ref"], spec["flavor_ref"], subnet_id,
+        spec["security_group_names"], spec["user_data"], spec.get("volume_size", 30), region_code, max_workers
+    )
+    candidates = {server["instance_id"]: server for server in fleet["active"]}
+
+    if wait_cloud_init and candidates:
+        boot = wait_for_cloud_init(ctx, tenant_id, list(candidates), region_code, timeout_seconds=readiness_deadline)
+        candidates = {iid: s for iid, s in candidates.items() if boot[iid]["status"] == "finished"}
+    if readiness_checks and candidates:
+        ready = set(wait_for_ready([s["address"] for s in candidates.values()], readiness_checks, readiness_deadline)["ready"])
+        candidates = {iid: s for iid, s in candidates.items() if s["address"] in ready}
+
+    pairs = [(by_name[server["name"]], server) for server in candidates.values()]
+    if web_lb:
+        moved = _cut_over_pool_members(ctx, web_lb, pairs, region_code) if pairs else []
+    else:
+        moved = _cut_over_floating_ips(ctx, pairs, region_code)
+
+    # 트래픽을 받지 못한 교체 인스턴스는 삭제하고, 대응하는 기존 인스턴스는 그대로 둠
+    moved_new = {new["instance_id"] for _, new in moved}
+    for server in fleet["active"]:
+        if server["instance_id"] not in moved_new:
+            delete_instance(ctx, tenant_id, server["instance_id"], region_code)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(lambda pair: delete_instance(ctx, tenant_id, pair[0]["instance_id"], region_code), moved))
+
+    moved_old = {old["instance_id"] for old, _ in moved}
+    return moved, [old for old in wave if old["instance_id"] not in moved_old]
+
+def rolling_replace(
+    token: str,
+    tenant_id: str,
+    servers: list,
+    launch_spec: dict,
+    subnet_id: str,
+    web_lb: dict = None,
+    wave_size: int = 2,
+    max_failure_rate: float = 0.2,
+    readiness_checks=None,
+    readiness_deadline: int = 900,
+    wait_cloud_init: bool = True,
+    name_suffix: str = None,
+    region_code: str = "kr1",
+    max_workers: int = 16,
+    on_wave=None
+):
+    """
+    인스턴스 그룹을 launch_spec의 설정으로 wave_size개씩 차례로 교체합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param tenant_id: 테넌트 ID
+    :param servers: 교체할 인스턴스의 리스트 ({"name", "instance_id", "address"}, Floating IP 방식이면 "floating_ip_id"도 포함)
+    :param launch_spec: 교체 인스턴스 생성 설정
+                        {"key_name", "image_ref", "flavor_ref", "security_group_names", "user_data", "volume_size"(선택)}
+    :param subnet_id: 교체 인스턴스를 생성할 서브넷 ID
+    :param web_lb: loadbalancer.create_web_load_balancer의 반환값 (지정하면 풀 멤버를 교체, 없으면 Floating IP를 재연결)
+    :param wave_size: 한 번에 교체할 인스턴스 수 (동시에 추가로 실행되는 인스턴스 수의 상한)
+    :param max_failure_rate: 지금까지 시도한 인스턴스 중 실패 비율이 이 값을 넘으면 멈춤 (0~1)
+    :param readiness_checks: 교체 인스턴스의 사설 IP로 보낼 readiness 점검 항목 (예: [{"type": "http", "port": 80}])
+                             (컨트롤러가 VPC 안에서 실행될 때만 지정, None이면 생략)
+    :param readiness_deadline: cloud-init 완료와 readiness 점검 각각의 최대 대기 시간 (초)
+    :param wait_cloud_init: True이면 콘솔 로그로 cloud-init(User Data) 완료를 확인한 인스턴스만 트래픽을 받게 함
+    :param name_suffix: 교체 인스턴스 이름에 붙일 접미사 (기본: 실행 시각, 예: web-1 → web-1-r1760000000)
+    :param region_code: 리전 코드
+    :param max_workers: 동시에 생성/삭제할 최대 인스턴스 수
+    :param on_wave: wave가 끝날 때마다 {"wave", "replaced", "failed", "failure_rate"}로 호출되는 함수 (선택)
+    :return: {"status": "completed" | "paused",
+              "replaced": [(기존 인스턴스, 교체 인스턴스), ...],
+              "failed": [교체에 실패해 그대로 남은 기존 인스턴스, ...],
+              "remaining": [시도하지 않은 기존 인스턴스, ...],
+              "servers": 현재 그룹 (교체 인스턴스 + 교체되지 않은 기존 인스턴스)}
+    """
+    if wave_size < 1:
+        raise ValueError("wave_size는 1 이상이어야 합니다.")
+    ctx = as_context(token)
+    name_suffix = name_suffix or f"r{int(time.time())}"
+    pending = list(servers)
+    replaced, failed = [], []
+    waves = (len(pending) + wave_size - 1) // wave_size
+    status = "completed"
+
+    print(f"--- 인스턴스 {len(pending)}개를 {wave_size}개씩 {waves}번에 나누어 교체합니다. ---")
+    for number in range(1, waves + 1):
+        wave, pending = pending[:wave_size], pending[wave_size:]
+        print(f"🔄 [{number}/{waves}] {', '.join(old['name'] for old in wave)} 교체 중...")
+        moved, wave_failed = _run_wave(
+            ctx, tenant_id, wave, launch_spec, subnet_id, web_lb, readiness_checks,
+            readiness_deadline, wait_cloud_init, name_suffix, region_code, max_workers
+        )
+        replaced.extend(moved)
+        failed.extend(wave_failed)
+        failure_rate = len(failed) / (len(replaced) + len(failed))
+        print(f"✅ [{number}/{waves}] 교체 {len(moved)}개, 실패 {len(wave_failed)}개 (누적 실패율 {failure_rate:.0%})")
+        if on_wave:
+            on_wave({"wave": number, "replaced": moved, "failed": wave_failed, "failure_rate": failure_rate})
+        if pending and failure_rate > max_failure_rate:
+            print(f"❗ 누적 실패율 {failure_rate:.0%}가 기준 {max_failure_rate:.0%}를 넘어 롤링 업데이트를 멈춥니다. (남은 인스턴스 {len(pending)}개)")
+            status = "paused"
+            break
+
+    current = [new for _, new in replaced] + failed + pending
+    print(f"--- 롤링 업데이트 {'완료' if status == 'completed' else '중단'}: 교체 {len(replaced)}개, 실패 {len(failed)}개, 남음 {len(pending)}개 ---")
+    return {"status": status, "replaced": replaced, "failed": failed, "remaining": pending, "servers": current}
@@ -4,28 +4,29 @@
 NHN Cloud 보안 그룹 관련 API를 호출하는 함수들을 모아놓은 모듈입니다.
 - 보안 그룹
 - 보안 그룹 규칙
+- 보안 그룹 규칙 정리(병합/중복 제거) 및 일괄 적용
 """
 
 import requests
 import json
+import ipaddress
+from concurrent.futures import ThreadPoolExecutor
+
+from .client import as_context
 
 def create_security_group(token: str, sg_name: str, description: str = "", region_code: str = "kr1"):
     """
     보안 그룹을 생성합니다.
 
-    :param token: 인증 토큰
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
     :param sg_name: 생성할 보안 그룹의 이름
     :param description: 보안 그룹에 대한 설명
     :param region_code: 리전 코드
     :return: 성공 시 보안 그룹 ID, 실패 시 None
     """
-    NETWORK_API_URL = f"https://{region_code}-api-network-infrastructure.nhncloudservice.com"
-    url = f"{NETWORK_API_URL}/v2.0/security-groups"
+    ctx = as_context(token)
+    url = ctx.url("network", "/v2.0/security-groups", region_code)
 
-    headers = {
-        "X-Auth-Token": token,
-        "Content-Type": "application/json"
-    }
 
     payload = {
         "security_group": {
@@ -35,7 +36,7 @@ def create_security_group(token: str, sg_name: str, description: str = "", regio
     }
 
     try:
-        response = requests.post(url, headers=headers, data=json.dumps(payload))
+        response = ctx.session.post(url, headers=ctx.headers, data=json.dumps(payload))
         response.raise_for_status()
 
         sg_info = response.json().get('security_group', {})
@@ -59,12 +60,14 @@ def create_security_group_rule(
     port_range_max: int = None,
     remote_ip_prefix: str = None,
     description: str = None,
-    region_code: str = "kr1"
+    region_code: str = "kr1",
+    ethertype: str = None,
+    remote_group_id: str = None
 ):
     """
     보안 그룹 규칙을 생성합니다.
 
-    :param token: 인증 토큰
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
     :param security_group_id: 규칙을 추가할 보안 그룹의 ID
     :param direction: 규칙의 방향 ("ingress" 또는 "egress")
     :param protocol: 프로토콜 (예: "tcp", "udp", "icmp")
@@ -73,15 +76,13 @@ def create_security_group_rule(
     :param remote_ip_prefix: 원격 IP 주소 또는 CIDR (예: "0.0.0.0/0")
     :param description: 규칙에 대한 설명
     :param region_code: 리전 코드
+    :param ethertype: "IPv4" 또는 "IPv6" (생략 시 API 기본값 IPv4)
+    :param remote_group_id: 원격 보안 그룹 ID (remote_ip_prefix 대신 보안 그룹 단위로 허용할 때)
     :return: 성공 시 규칙 ID, 실패 시 None
     """
-    NETWORK_API_URL = f"https://{region_code}-api-network-infrastructure.nhncloudservice.com"
-    url = f"{NETWORK_API_URL}/v2.0/security-group-rules"
+    ctx = as_context(token)
+    url = ctx.url("network", "/v2.0/security-group-rules", region_code)
 
-    headers = {
-        "X-Auth-Token": token,
-        "Content-Type": "application/json"
-    }
 
     rule_payload = {
         "security_group_id": security_group_id,
@@ -98,13 +99,17 @@ def create_security_group_rule(
         rule_payload["remote_ip_prefix"] = remote_ip_prefix
     if description:
         rule_payload["description"] = description
+    if ethertype:
+        rule_payload["ethertype"] = ethertype
+    if remote_group_id:
+        rule_payload["remote_group_id"] = remote_group_id
     
     payload = {
         "security_group_rule": rule_payload
     }
 
     try:
-        response = requests.post(url, headers=headers, data=json.dumps(payload))
+        response = ctx.session.post(url, headers=ctx.headers, data=json.dumps(payload))
         response.raise_for_status()
 
         rule_info = response.json().get('security_group_rule', {})
@@ -118,3 +123,323 @@ def create_security_group_rule(
     except Exception as e:
         print(f"❗ 보안 그룹 규칙 생성 중 예상치 못한 오류 발생: {e}")
         return None
+
+def list_security_groups(token: str, region_code: str = "kr1"):
+    """
+    보안 그룹 목록을 조회합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param region_code: 리전 코드
+    :return: 성공 시 보안 그룹 정보 dict의 리스트, 실패 시 None
+    """
+    ctx = as_context(token)
+    url = ctx.url("network", "/v2.0/security-groups", region_code)
+
+    try:
+        response = ctx.session.get(url, headers=ctx.headers)
+        response.raise_for_status()
+
+        items = response.json().get('security_groups', [])
+        print(f"✅ 보안 그룹 목록 조회 성공: {len(items)}개 (Region: {region_code})")
+        return items
+
+    except requests.exceptions.HTTPError as http_err:
+        print(f"❗ 보안 그룹 목록 조회 중 HTTP 오류 발생: {http_err}")
+        print(f"    응답 내용: {http_err.response.text}")
+        return None
+    except Exception as e:
+        print(f"❗ 보안 그룹 목록 조회 중 예상치 못한 오류 발생: {e}")
+        return None
+
+def delete_security_group(token: str, security_group_id: str, region_code: str = "kr1"):
+    """
+    보안 그룹을 삭제합니다. 보안 그룹을 사용하는 포트가 없어야 합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param security_group_id: 삭제할 보안 그룹의 ID
+    :param region_code: 리전 코드
+    :return: 성공 시 True, 실패 시 False
+    """
+    ctx = as_context(token)
+    url = ctx.url("network", f"/v2.0/security-groups/{security_group_id}", region_code)
+
+    try:
+        response = ctx.session.delete(url, headers=ctx.headers)
+        response.raise_for_status()
+
+        print(f"✅ 보안 그룹 '{security_group_id}' 삭제 성공")
+        return True
+
+    except requests.exceptions.HTTPError as http_err:
+        print(f"❗ 보안 그룹 삭제 중 HTTP 오류 발생: {http_err}")
+        print(f"    응답 내용: {http_err.response.text}")
+        return False
+    except Exception as e:
+        print(f"❗ 보안 그룹 삭제 중 예상치 못한 오류 발생: {e}")
+        return False
+
+def get_security_group(token: str, security_group_id: str, region_code: str = "kr1"):
+    """
+    보안 그룹의 상세 정보(규칙 포함)를 조회합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param security_group_id: 조회할 보안 그룹의 ID
+    :param region_code: 리전 코드
+    :return: 성공 시 보안 그룹 정보 dict (security_group_rules 포함), 실패 시 None
+    """
+    ctx = as_context(token)
+    url = ctx.url("network", f"/v2.0/security-groups/{security_group_id}", region_code)
+
+    try:
+        response = ctx.session.get(url, headers=ctx.headers)
+        response.raise_for_status()
+        return response.json().get('security_group', {})
+
+    except requests.exceptions.HTTPError as http_err:
+        print(f"❗ 보안 그룹 조회 중 HTTP 오류 발생: {http_err}")
+        print(f"    응답 내용: {http_err.response.text}")
+        return None
+    except Exception as e:
+        print(f"❗ 보안 그룹 조회 중 예상치 못한 오류 발생: {e}")
+        return None
+
+# --- Rule Compiler ---
+# 보안 그룹 규칙은 허용(allow) 규칙만 있으므로, 규칙 집합의 의미는 "허용되는 트래픽의 합집합"입니다.
+# 합집합이 같다면 규칙 수를 줄여도 동작은 바뀌지 않습니다.
+
+# 숫자로 지정된 프로토콜 -> 이름
+_PROTOCOL_NAMES = {"1": "icmp", "6": "tcp", "17": "udp", "58": "ipv6-icmp"}
+# 포트 범위를 가지는 프로토콜 (ICMP 등은 port_range_min/max가 type/code이므로 병합하지 않음)
+_PORT_RANGE_PROTOCOLS = ("tcp", "udp")
+_ANY_NETWORK = {"IPv4": ipaddress.ip_network("0.0.0.0/0"), "IPv6": ipaddress.ip_network("::/0")}
+
+def _normalize_rule(rule: dict, index: int):
+    """(내부 함수) 규칙 dict를 비교 가능한 형태로 정규화합니다. 잘못된 규칙이면 ValueError를 발생시킵니다."""
+    direction = (rule.get("direction") or "ingress").lower()
+    if direction not in ("ingress", "egress"):
+        raise ValueError(f"규칙 #{index}: direction은 'ingress' 또는 'egress'여야 합니다: {direction}")
+
+    protocol = rule.get("protocol")
+    protocol = None if protocol in (None, "", "any") else str(protocol).lower()
+    protocol = _PROTOCOL_NAMES.get(protocol, protocol)
+
+    remote_group_id = rule.get("remote_group_id")
+    network = None
+    ethertype = rule.get("ethertype") or "IPv4"
+    if rule.get("remote_ip_prefix"):
+        network = ipaddress.ip_network(rule["remote_ip_prefix"], strict=False)
+        ethertype = "IPv6" if network.version == 6 else "IPv4"
+    elif not remote_group_id:
+        network = _ANY_NETWORK[ethertype]
+
+    low, high = rule.get("port_range_min"), rule.get("port_range_max")
+    if protocol in _PORT_RANGE_PROTOCOLS:
+        if low is None and high is None:
+            low, high = 1, 65535
+        low, high = int(low if low is not None else high), int(high if high is not None else low)
+        if not 1 <= low <= high <= 65535:
+            raise ValueError(f"규칙 #{index}: 포트 범위가 올바르지 않습니다: {low}-{high}")
+        ports = (low, high)
+    elif protocol is None:
+        ports = None
+    else:
+        ports = (low, high)
+
+    return {
+        "direction": direction,
+        "ethertype": ethertype,
+        "protocol": protocol,
+        "ports": ports,
+        "network": network,
+        "remote_group_id": remote_group_id,
+        "descriptions": [rule["description"]] if rule.get("description") else [],
+        "sources": {index},
+    }
+
+def _covers(outer: dict, inner: dict):
+    """(내부 함수) outer 규칙이 허용하는 트래픽이 inner 규칙을 모두 포함하는지 확인합니다."""
+    if (outer["direction"], outer["ethertype"], outer["remote_group_id"]) != (inner["direction"], inner["ethertype"], inner["remote_group_id"]):
+        return False
+    if outer["network"] is not None and not inner["network"].subnet_of(outer["network"]):
+        return False
+    if outer["protocol"] is None:
+        return True
+    if outer["protocol"] != inner["protocol"]:
+        return False
+    if outer["protocol"] in _PORT_RANGE_PROTOCOLS:
+        return outer["ports"][0] <= inner["ports"][0] and inner["ports"][1] <= outer["ports"][1]
+    # ICMP: type/code가 없으면 모든 type/code 허용
+    return outer["ports"] in ((None, None), inner["ports"])
+
+def _remove_shadowed(items: list):
+    """(내부 함수) 다른 규칙에 완전히 포함되는(가려진) 규칙을 제거합니다."""
+    # 넓은 규칙부터 보면 가려진 규칙을 한 번의 비교로 걸러낼 수 있습니다.
+    def breadth(item):
+        port_span = 65536 if item["ports"] is None else (item["ports"][1] - item["ports"][0] if item["protocol"] in _PORT_RANGE_PROTOCOLS else 0)
+        return (item["network"].num_addresses if item["network"] is not None else 0, port_span)
+    kept = []
+    for item in sorted(items, key=breadth, reverse=True):
+        if not any(_covers(other, item) for other in kept):
+            kept.append(item)
+    return kept
+
+def _merge_group(items: list):
+    """(내부 함수) 같은 방향/프로토콜 그룹 안에서 CIDR 합치기와 포트 범위 합치기를 더 줄어들지 않을 때까지 반복합니다."""
+    while True:
+        before = len(items)
+
+        # 1) 포트 범위가 같은 규칙끼리 CIDR을 상위 대역으로 합칩니다.
+        by_ports = {}
+        for item in items:
+            by_ports.setdefault(item["ports"], []).append(item)
+        items = []
+        for group in by_ports.values():
+            if group[0]["network"] is None:
+                items.extend(group)
+                continue
+            for network in ipaddress.collapse_addresses(item["network"] for item in group):
+                members = [item for item in group if item["network"].subnet_of(network)]
+                items.append(_merged(members, network=network))
+
+        # 2) CIDR이 같은 규칙끼리 겹치거나 이어지는 포트 범위를 합칩니다.
+        if items and items[0]["protocol"] in _PORT_RANGE_PROTOCOLS:
+            by_network = {}
+            for item in items:
+                by_network.setdefault(item["network"], []).append(item)
+            items = []
+            for group in by_network.values():
+                group.sort(key=lambda item: item["ports"])
+                run = [group[0]]
+                for item in group[1:]:
+                    if item["ports"][0] <= max(r["ports"][1] for r in run) + 1:
+                        run.append(item)
+                    else:
+                        items.append(_merged(run, ports=(run[0]["ports"][0], max(r["ports"][1] for r in run))))
+                        run = [item]
+                items.append(_merged(run, ports=(run[0]["ports"][0], max(r["ports"][1] for r in run))))
+
+        if len(items) == before:
+            return items
+
+def _merged(members: list, **changes):
+    """(내부 함수) 여러 규칙을 하나로 합친 규칙을 만듭니다. (설명과 원본 규칙 번호를 모음)"""
+    if len(members) == 1 and not changes:
+        return members[0]
+    merged = dict(members[0], **changes)
+    merged["descriptions"] = list(dict.fromkeys(d for m in members for d in m["descriptions"]))
+    merged["sources"] = set().union(*(m["sources"] for m in members))
+    return merged
+
+def _to_rule(item: dict):
+    """(내부 함수) 정규화된 규칙을 create_security_group_rule의 인자 형태 dict로 되돌립니다."""
+    rule = {"direction": item["direction"], "ethertype": item["ethertype"], "protocol": item["protocol"]}
+    if item["ports"] is not None:
+        rule["port_range_min"], rule["port_range_max"] = item["ports"]
+    if item["network"] is not None:
+        rule["remote_ip_prefix"] = str(item["network"])
+    if item["remote_group_id"]:
+        rule["remote_group_id"] = item["remote_group_id"]
+    if item["descriptions"]:
+        rule["description"] = ", ".join(item["descriptions"])[:255]
+    return rule
+
+def compile_security_group_rules(rules: list):
+    """
+    보안 그룹 규칙 목록을 같은 트래픽을 허용하는 더 작은 규칙 목록으로 정리합니다.
+
+    - 중복 규칙 제거
+    - 다른 규칙에 완전히 포함되는(가려진) 규칙 제거 (예: 0.0.0.0/0 tcp 1-65535가 있으면 tcp 22 규칙은 불필요)
+    - 포트 범위가 같은 규칙의 CIDR을 상위 대역으로 합치기 (ipaddress.collapse_addresses)
+    - CIDR이 같은 규칙의 겹치거나 이어지는 포트 범위 합치기 (예: 80-80 + 81-90 -> 80-90)
+
+    :param rules: 규칙 dict의 리스트. 키는 create_security_group_rule의 인자와 같습니다.
+                  (direction, protocol, port_range_min, port_range_max, remote_ip_prefix, description,
+                   선택적으로 ethertype, remote_group_id)
+    :return: (정리된 규칙 리스트, 보고서) 튜플.
+             보고서: {"input": 입력 규칙 수, "output": 결과 규칙 수,
+                      "removed": [{"rule": 원본 규칙, "reason": "duplicate"|"shadowed"|"merged", "into": [결과 규칙, ...]}]}
+    """
+    normalized = [_normalize_rule(rule, index) for index, rule in enumerate(rules)]
+
+    # 완전히 같은 규칙은 첫 번째 것만 남깁니다.
+    unique = {}
+    duplicates = {}
+    for item in normalized:
+        key = (item["direction"], item["ethertype"], item["protocol"], item["ports"], item["network"], item["remote_group_id"])
+        if key in unique:
+            duplicates[min(item["sources"])] = unique[key]
+            unique[key]["descriptions"] = list(dict.fromkeys(unique[key]["descriptions"] + item["descriptions"]))
+        else:
+            unique[key] = dict(item, sources=set(item["sources"]))
+
+    items = _remove_shadowed(list(unique.values()))
+    groups = {}
+    for item in items:
+        ports_key = None if item["protocol"] in _PORT_RANGE_PROTOCOLS else item["ports"]
+        groups.setdefault((item["direction"], item["ethertype"], item["protocol"], item["remote_group_id"], ports_key), []).append(item)
+    items = []
+    for group in groups.values():
+        items.extend(_merge_group(group))
+    items = _remove_shadowed(items)
+    items.sort(key=lambda item: (item["direction"], item["ethertype"], item["protocol"] or "", item["ports"] or (0, 0), str(item["network"]), item["remote_group_id"] or ""))
+
+    compiled = [_to_rule(item) for item in items]
+    removed = []
+    for index, rule in enumerate(rules):
+        if index in duplicates:
+            removed.append({"rule": rule, "reason": "duplicate", "into": [_to_rule(duplicates[index])]})
+            continue
+        holders = [compiled[i] for i, item in enumerate(items) if index in item["sources"]]
+        if holders:
+            if holders[0] != _to_rule(normalized[index]) or len(items[compiled.index(holders[0])]["sources"]) > 1:
+                removed.append({"rule": rule, "reason": "merged", "into": holders})
+        else:
+            covering = [compiled[i] for i, item in enumerate(items) if _covers(item, normalized[index])]
+            removed.append({"rule": rule, "reason": "shadowed", "into": covering})
+
+    report = {"input": len(rules), "output": len(compiled), "removed": removed}
+    return compiled, report
+
+def apply_security_group_rules(token: str, security_group_id: str, rules: list, region_code: str = "kr1", max_workers: int = 8):
+    """
+    규칙 목록을 compile_security_group_rules로 정리한 뒤, 보안 그룹에 이미 있는 규칙에 포함되지 않는 것만 생성합니다.
+    규칙 생성 요청은 병렬로 보냅니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param security_group_id: 규칙을 추가할 보안 그룹의 ID
+    :param rules: 규칙 dict의 리스트 (compile_security_group_rules 참고)
+    :param region_code: 리전 코드
+    :param max_workers: 동시에 보낼 최대 규칙 생성 요청 수
+    :return: 성공 시 {"created": [규칙 ID, ...], "existing": 이미 있어서 건너뛴 규칙 수, "report": 정리 보고서},
+             보안 그룹 조회 또는 규칙 생성에 실패하면 None
+    """
+    compiled, report = compile_security_group_rules(rules)
+    print(f"✅ 보안 그룹 규칙 정리: {report['input']}개 -> {report['output']}개")
+    for entry in report["removed"]:
+        rule = entry["rule"]
+        print(f" - [{entry['reason']}] {rule.get('protocol') or 'any'} {rule.get('port_range_min') or ''}-{rule.get('port_range_max') or ''} {rule.get('remote_ip_prefix') or rule.get('remote_group_id') or ''}")
+
+    security_group = get_security_group(token, security_group_id, region_code)
+    if security_group is None:
+        return None
+    existing = []
+    for rule in security_group.get('security_group_rules', []):
+        try:
+            existing.append(_normalize_rule(rule, -1))
+        except ValueError:
+            continue
+    pending = [rule for rule in compiled if not any(_covers(e, _normalize_rule(rule, -1)) for e in existing)]
+
+    def create(rule):
+        return create_security_group_rule(
+            token, security_group_id, rule["direction"], rule["protocol"],
+            rule.get("port_range_min"), rule.get("port_range_max"), rule.get("remote_ip_prefix"),
+            rule.get("description"), region_code, rule["ethertype"], rule.get("remote_group_id")
+        )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        created = list(executor.map(create, pending))
+    if None in created:
+        print(f"❗ 보안 그룹 규칙 {len(pending)}개 중 {created.count(None)}개 생성에 실패했습니다.")
+        return None
+    return {"created": created, "existing": len(compiled) - len(pending), "report": report}
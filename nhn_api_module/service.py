@@ -0,0 +1,440 @@
+# nhn_api_module/service.py
+
+"""
+프로비저닝/정리 작업을 로컬 HTTP(JSON) API로 받아 백그라운드에서 실행하는 데몬 모듈입니다.
+- 작업은 SQLite 파일(jobs.db)에 저장되어 데몬을 다시 시작해도 대기 중인 작업이 남아 있음
+- 정해진 수의 워커 스레드가 작업을 하나씩 가져와 실행
+- 워커들은 토큰, 서비스 카탈로그, 연결 풀(세션), VPC CIDR 할당기를 공유 (작업마다 인증/연결을 새로 하지 않음)
+- 선택적으로 리전별 쿼터 추적기를 공유해, 동시에 실행되는 작업이 남은 쿼터를 넘겨 생성을 시작하지 않게 함
+- 작업 상태와 진행 단계 조회
+
+HTTP API (기본 주소: http://127.0.0.1:8787):
+    POST /jobs          {"type": "provision", "params": {스택 명세}}             -> 202, 작업 정보
+                        {"type": "teardown", "params": {"job_id": 프로비저닝 작업 ID}} 또는 {"stack": 스택 정보}
+    GET  /jobs          작업 목록 (?status=queued|running|succeeded|failed)
+    GET  /jobs/{id}     작업 상태, 진행 단계, 결과
+    GET  /health        워커 수와 상태별 작업 수
+
+사용 예시 (명령행):
+    python -m nhn_api_module.service --port 8787 --workers 4 --check-quota
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import threading
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+from .auth import get_token, parse_datetime, project_root
+from .cidr import load_vpc_allocator
+from .client import create_client_context, new_session
+from .quota import QuotaTracker
+from .stack import DEFAULT_STACK_SPEC, REQUIRED_STACK_FIELDS, provision_stack, teardown_stack
+
+# 작업 상태
+JOB_STATUSES = ("queued", "running", "succeeded", "failed")
+
+# 작업 DB 기본 경로
+DEFAULT_DB_PATH = os.path.join(project_root, "jobs.db")
+
+# 토큰의 남은 유효 시간이 이보다 짧으면 작업을 시작하기 전에 새로 발급합니다. (초)
+TOKEN_REFRESH_SECONDS = 1800
+
+def _now():
+    return datetime.now(timezone.utc).isoformat()
+
+class JobStore:
+    """
+    작업 큐를 SQLite 파일에 저장합니다. 여러 워커 스레드에서 동시에 사용할 수 있습니다.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH):
+        """
+        :param db_path: SQLite 파일 경로 (":memory:"이면 메모리에만 저장)
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    type TEXT NOT NULL,
+                    params TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    progress TEXT,
+                    result TEXT,
+                    error TEXT,
+                    created_at TEXT NOT NULL,
+                    started_at TEXT,
+                    finished_at TEXT
+                )
+                """
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at)")
+
+    def _to_job(self, row):
+        if row is None:
+            return None
+        job = dict(row)
+        for key in ("params", "progress", "result"):
+            job[key] = json.loads(job[key]) if job[key] else None
+        return job
+
+    def submit(self, job_type: str, params: dict):
+        """
+        작업을 대기 상태로 추가합니다.
+
+        :return: 추가된 작업 dict
+        """
+        job_id = uuid.uuid4().hex
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO jobs (id, type, params, status, created_at) VALUES (?, ?, ?, 'queued', ?)",
+                (job_id, job_type, json.dumps(params, ensure_ascii=False), _now())
+            )
+        return self.get(job_id)
+
+    def claim(self):
+        """
+        가장 오래된 대기 작업 하나를 실행 중 상태로 바꾸고 반환합니다. 대기 작업이 없으면 None을 반환합니다.
+        같은 작업이 두 워커에게 동시에 전달되지 않습니다.
+        """
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT id FROM jobs WHERE status = 'queued' ORDER BY created_at, rowid LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE jobs SET status = 'running', started_at = ? WHERE id = ?", (_now(), row["id"])
+            )
+        return self.get(row["id"])
+
+    def update_progress(self, job_id: str, step: str, message: str):
+        """실행 중인 작업의 진행 단계를 기록합니다."""
+        progress = json.dumps({"step": step, "message": message, "updated_at": _now()}, ensure_ascii=False)
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE jobs SET progress = ? WHERE id = ?", (progress, job_id))
+
+    def finish(self, job_id: str, result=None, error: str = None):
+        """작업을 완료(error가 없으면 succeeded, 있으면 failed) 상태로 기록합니다."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ? WHERE id = ?",
+                ("failed" if error else "succeeded", json.dumps(result, ensure_ascii=False), error, _now(), job_id)
+            )
+
+    def get(self, job_id: str):
+        """작업 하나를 조회합니다. 없으면 None을 반환합니다."""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_job(row)
+
+    def list(self, status: str = None, limit: int = 100):
+        """작업 목록을 최근 순으로 조회합니다."""
+        query, args = "SELECT * FROM jobs", ()
+        if status:
+            query, args = query + " WHERE status = ?", (status,)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY created_at DESC, rowid DESC LIMIT ?", args + (limit,)).fetchall()
+        return [self._to_job(row) for row in rows]
+
+    def counts(self):
+        """상태별 작업 수를 반환합니다."""
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        counts = dict.fromkeys(JOB_STATUSES, 0)
+        counts.update({status: count for status, count in rows})
+        return counts
+
+    def recover(self):
+        """
+        이전 실행에서 실행 중이던 작업을 실패로 기록합니다. (데몬 시작 시 호출)
+        프로비저닝 도중 중단된 작업을 다시 실행하면 리소스가 중복 생성될 수 있으므로 자동으로 재시도하지 않습니다.
+
+        :return: 실패로 기록한 작업 수
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = 'failed', error = ?, finished_at = ? WHERE status = 'running'",
+                ("데몬이 다시 시작되어 작업이 중단되었습니다.", _now())
+            )
+        return cursor.rowcount
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+class ProvisioningService:
+    """
+    작업 큐와 워커 풀을 관리합니다. 워커들은 하나의 토큰/세션/카탈로그와 리전별 VPC CIDR 할당기(와 쿼터 추적기)를 공유합니다.
+    """
+
+    def __init__(self, store: JobStore, tenant_id: str = None, username: str = None, password: str = None, max_workers: int = 4, endpoint_overrides: dict = None, check_quota: bool = False):
+        """
+        :param store: 작업을 저장할 JobStore
+        :param tenant_id: 테넌트 ID (생략 시 환경 변수 TENANT_ID, get_token 참고)
+        :param username: API 사용자 이름 (tenant_id를 지정한 경우 필수)
+        :param password: API 비밀번호 (tenant_id를 지정한 경우 필수)
+        :param max_workers: 동시에 실행할 최대 작업 수
+        :param endpoint_overrides: 엔드포인트 강제 지정 dict (로컬 대체 서버 등, create_client_context 참고)
+        :param check_quota: True이면 프로비저닝 작업이 리소스를 만들기 전에 쿼터를 예약하고, 여유가 없으면 아무것도 만들지 않고 실패
+        """
+        self.store = store
+        self.tenant_id = tenant_id
+        self.max_workers = max_workers
+        self._credentials = (username, password)
+        self._endpoint_overrides = endpoint_overrides
+        self._session = new_session()
+        self._ctx = None
+        self._token_expires = None
+        self._ctx_lock = threading.Lock()
+        self._allocators = {}
+        self._allocators_lock = threading.Lock()
+        self.check_quota = check_quota
+        self._quotas = {}
+        self._wakeup = threading.Condition()
+        self._stopping = False
+        self._workers = []
+        self._handlers = {"provision": self._run_provision, "teardown": self._run_teardown}
+
+    # --- 공유 자원 ---
+
+    def context(self):
+        """
+        워커들이 공유하는 ClientContext를 반환합니다.
+        토큰이 곧 만료되면 새로 발급하되, 연결 풀(세션)은 그대로 재사용합니다.
+        """
+        with self._ctx_lock:
+            if self._ctx is None or (self._token_expires - datetime.now(timezone.utc)).total_seconds() < TOKEN_REFRESH_SECONDS:
+                token_data = get_token(self.tenant_id, *self._credentials, min_valid_seconds=TOKEN_REFRESH_SECONDS)
+                if not token_data:
+                    raise RuntimeError("토큰 발급에 실패했습니다.")
+                self.tenant_id = token_data.get("tenant_id") or self.tenant_id or os.getenv("TENANT_ID")
+                self._token_expires = parse_datetime(token_data["token_expires"])
+                self._ctx = create_client_context(token_data, self.tenant_id, self._endpoint_overrides, session=self._session)
+            return self._ctx
+
+    def vpc_allocator(self, ctx, region_code: str, pool: str):
+        """리전/대역별 VPC CIDR 할당기를 처음 한 번만 로드해 공유합니다. (동시에 실행되는 작업끼리 대역이 겹치지 않음)"""
+        with self._allocators_lock:
+            allocator = self._allocators.get((region_code, pool))
+            if allocator is None:
+                allocator = load_vpc_allocator(ctx, pool, region_code)
+                if allocator is None:
+                    raise RuntimeError(f"VPC 목록 조회에 실패했습니다. (Region: {region_code})")
+                self._allocators[(region_code, pool)] = allocator
+            return allocator
+
+    def quota_tracker(self, ctx, region_code: str):
+        """리전별 쿼터 추적기를 공유합니다. (동시에 실행되는 작업끼리 같은 여유분을 중복으로 쓰지 않음)"""
+        with self._allocators_lock:
+            tracker = self._quotas.get(region_code)
+            if tracker is None:
+                tracker = self._quotas[region_code] = QuotaTracker(ctx, self.tenant_id, region_code)
+            return tracker
+
+    # --- 작업 ---
+
+    def submit(self, job_type: str, params: dict):
+        """
+        작업을 큐에 추가하고 대기 중인 워커를 깨웁니다.
+
+        :param job_type: "provision" 또는 "teardown"
+        :param params: 작업 매개변수 dict (모듈 설명 참고)
+        :return: 추가된 작업 dict
+        """
+        if job_type not in self._handlers:
+            raise ValueError(f"알 수 없는 작업 종류입니다: {job_type} (사용 가능: {', '.join(self._handlers)})")
+        if not isinstance(params, dict):
+            raise ValueError("params는 JSON 객체여야 합니다.")
+        missing = [field for field in REQUIRED_STACK_FIELDS if not params.get(field)] if job_type == "provision" else []
+        if missing:
+            raise ValueError(f"스택 명세에 필수 항목이 없습니다: {', '.join(missing)}")
+        job = self.store.submit(job_type, params)
+        with self._wakeup:
+            self._wakeup.notify()
+        return job
+
+    def _run_provision(self, ctx, job, progress):
+        spec = dict(DEFAULT_STACK_SPEC, **job["params"])
+        allocator = self.vpc_allocator(ctx, spec["region_code"], spec["vpc_cidr_pool"])
+        quota = self.quota_tracker(ctx, spec["region_code"]) if self.check_quota else None
+        stack = provision_stack(ctx, self.tenant_id, spec, progress, allocator, quota)
+        return stack, stack.get("error")
+
+    def _run_teardown(self, ctx, job, progress):
+        params = job["params"]
+        stack = params.get("stack")
+        if params.get("job_id"):
+            source = self.store.get(params["job_id"])
+            if not source or source["type"] != "provision" or not source["result"]:
+                return None, f"정리할 프로비저닝 작업 결과가 없습니다: {params['job_id']}"
+            stack = source["result"]
+        if not stack:
+            return None, "params에 job_id 또는 stack이 필요합니다."
+        spec = dict(DEFAULT_STACK_SPEC, **stack)
+        allocator = self._allocators.get((spec["region_code"], spec["vpc_cidr_pool"]))
+        result = teardown_stack(ctx, self.tenant_id, stack, progress, allocator)
+        error = ("일부 리소스를 삭제하지 못했습니다: " + ", ".join(result["failed"])) if result["failed"] else None
+        return result, error
+
+    def _execute(self, job):
+        def progress(step, message):
+            self.store.update_progress(job["id"], step, message)
+
+        print(f"▶️ 작업 시작: {job['type']} {job['id']}")
+        try:
+            result, error = self._handlers[job["type"]](self.context(), job, progress)
+        except Exception as e:
+            result, error = None, f"{type(e).__name__}: {e}"
+        self.store.finish(job["id"], result, error)
+        if error:
+            print(f"❗ 작업 실패: {job['type']} {job['id']} ({error})")
+        else:
+            print(f"✅ 작업 완료: {job['type']} {job['id']}")
+
+    def _worker_loop(self):
+        while True:
+            with self._wakeup:
+                job = self.store.claim()
+                while job is None and not self._stopping:
+                    self._wakeup.wait()
+                    job = self.store.claim()
+                if job is None:
+                    return
+            self._execute(job)
+
+    def start(self):
+        """중단된 작업을 정리하고 워커 스레드를 시작합니다."""
+        interrupted = self.store.recover()
+        if interrupted:
+            print(f"❗ 이전 실행에서 중단된 작업 {interrupted}개를 실패로 기록했습니다.")
+        self._stopping = False
+        self._workers = [
+            threading.Thread(target=self._worker_loop, name=f"provisioning-worker-{i}", daemon=True)
+            for i in range(self.max_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+        print(f"✅ 프로비저닝 서비스 시작: 워커 {self.max_workers}개, 대기 작업 {self.store.counts()['queued']}개")
+
+    def stop(self, wait: bool = True):
+        """새 작업을 가져가지 않도록 워커를 멈춥니다. wait이 True이면 실행 중인 작업이 끝날 때까지 기다립니다."""
+        with self._wakeup:
+            self._stopping = True
+            self._wakeup.notify_all()
+        if wait:
+            for worker in self._workers:
+                worker.join()
+        self._session.close()
+
+    def health(self):
+        """워커 상태와 상태별 작업 수를 반환합니다."""
+        return {
+            "workers": self.max_workers,
+            "alive_workers": sum(worker.is_alive() for worker in self._workers),
+            "jobs": self.store.counts(),
+        }
+
+# --- HTTP API ---
+
+class _JobRequestHandler(BaseHTTPRequestHandler):
+    """(내부 클래스) 작업 API 요청을 처리합니다. self.server.service로 ProvisioningService에 접근합니다."""
+
+    def _send_json(self, status: int, body):
+        data = json.dumps(body, indent=2, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        service = self.server.service
+        url = urlsplit(self.path)
+        parts = [p for p in url.path.split("/") if p]
+        if parts == ["health"]:
+            self._send_json(200, service.health())
+        elif parts == ["jobs"]:
+            query = parse_qs(url.query)
+            status = query.get("status", [None])[0]
+            if status and status not in JOB_STATUSES:
+                self._send_json(400, {"error": f"알 수 없는 상태입니다: {status}"})
+                return
+            limit = query.get("limit", ["100"])[0]
+            if not limit.isdigit() or int(limit) < 1:
+                self._send_json(400, {"error": f"limit은 1 이상의 정수여야 합니다: {limit}"})
+                return
+            limit = int(limit)
+            self._send_json(200, {"jobs": service.store.list(status, limit)})
+        elif len(parts) == 2 and parts[0] == "jobs":
+            job = service.store.get(parts[1])
+            if job:
+                self._send_json(200, job)
+            else:
+                self._send_json(404, {"error": f"작업을 찾을 수 없습니다: {parts[1]}"})
+        else:
+            self._send_json(404, {"error": "지원하지 않는 경로입니다."})
+
+    def do_POST(self):
+        if urlsplit(self.path).path.rstrip("/") != "/jobs":
+            self._send_json(404, {"error": "지원하지 않는 경로입니다."})
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            body = json.loads(self.rfile.read(length) or b"{}")
+            job = self.server.service.submit(body.get("type"), body.get("params") or {})
+        except (ValueError, AttributeError) as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        self._send_json(202, job)
+
+    def log_message(self, format, *args):
+        pass
+
+def create_server(service: ProvisioningService, host: str = "127.0.0.1", port: int = 8787):
+    """
+    작업 API를 제공하는 HTTP 서버를 만듭니다. serve_forever()로 실행합니다.
+
+    :param service: 요청을 처리할 ProvisioningService
+    :param host: 바인드할 주소 (인증이 없으므로 기본값은 로컬 전용)
+    :param port: 포트 (0이면 임의의 빈 포트)
+    :return: ThreadingHTTPServer
+    """
+    server = ThreadingHTTPServer((host, port), _JobRequestHandler)
+    server.daemon_threads = True
+    server.service = service
+    return server
+
+if __name__ == "__main__":
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(description="프로비저닝/정리 작업을 HTTP API로 받아 실행하는 데몬을 시작합니다.")
+    parser.add_argument("--host", default="127.0.0.1", help="바인드할 주소")
+    parser.add_argument("--port", type=int, default=8787, help="포트")
+    parser.add_argument("--workers", type=int, default=4, help="동시에 실행할 최대 작업 수")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="작업을 저장할 SQLite 파일 경로")
+    parser.add_argument("--check-quota", action="store_true", help="프로비저닝 전에 쿼터를 확인하고 예약")
+    args = parser.parse_args()
+
+    service = ProvisioningService(JobStore(args.db), max_workers=args.workers, check_quota=args.check_quota)
+    service.start()
+    server = create_server(service, args.host, args.port)
+    print(f"✅ 작업 API 대기 중: http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n종료합니다. 실행 중인 작업이 끝날 때까지 기다립니다...")
+    finally:
+        server.server_close()
+        service.stop()
+        service.store.close()
@@ -0,0 +1,215 @@
+# nhn_api_module/stack.py
+
+"""
+웹 서버 스택(VPC, 서브넷, 인터넷 게이트웨이, 보안 그룹, 인스턴스, Floating IP)을
+한 번에 프로비저닝하고 정리하는 함수들을 모아놓은 모듈입니다.
+examples/provision_web_server.py의 과정을 재사용 가능한 함수로 묶은 것으로, 프로비저닝 서비스(service.py)가 사용합니다.
+
+스택 정보(dict)는 JSON으로 직렬화할 수 있으며, 생성된 리소스 ID를 모두 담고 있어 teardown_stack에 그대로 전달할 수 있습니다.
+"""
+
+import uuid
+
+from .cidr import CidrAllocator, load_vpc_allocator
+from .client import as_context
+from .compute import launch_instance_with_floating_ip, list_flavors, get_flavor, delete_instance, wait_for_instance_deleted
+from .networking import (
+    create_vpc,
+    create_vpc_subnet,
+    get_vpc_details,
+    get_external_network_id,
+    create_internet_gateway,
+    attach_gateway_to_routing_table,
+    detach_gateway_from_routing_table,
+    delete_internet_gateway,
+    delete_vpc_subnet,
+    delete_vpc,
+    delete_floating_ip,
+)
+from .quota import instance_demand
+from .security import create_security_group, apply_security_group_rules, delete_security_group
+from .userdata import build_user_data
+
+# 스택 명세(spec)의 기본값
+DEFAULT_STACK_SPEC = {
+    "region_code": "kr1",
+    "flavor_name": "m2.c1m2",
+    "volume_size": 30,
+    "vpc_cidr_pool": "10.0.0.0/8",
+    "vpc_prefixlen": 16,
+    "subnet_prefixlen": 24,
+    "ingress_ports": [22, 80],
+    "scripts": [],
+    "files": [],
+}
+
+# 스택 명세의 필수 항목
+REQUIRED_STACK_FIELDS = ("name", "image_ref", "key_name", "allowed_cidr")
+
+def _noop_progress(step, message):
+    pass
+
+def provision_stack(token, tenant_id: str, spec: dict, progress=None, vpc_allocator: CidrAllocator = None, quota=None):
+    """
+    명세에 따라 웹 서버 스택을 프로비저닝합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param tenant_id: 테넌트 ID
+    :param spec: 스택 명세 dict
+                 필수: name, image_ref, key_name, allowed_cidr (SSH/HTTP 허용 CIDR)
+                 선택: region_code, flavor_name (또는 flavor_ref), volume_size, vpc_cidr_pool, vpc_prefixlen,
+                       subnet_prefixlen, ingress_ports, scripts (User Data 셸 스크립트 리스트), files (build_user_data의 files)
+    :param progress: 진행 상황을 받을 콜백 progress(단계 이름, 메시지) (선택)
+    :param vpc_allocator: 여러 스택이 함께 사용할 VPC CIDR 할당기 (생략 시 기존 VPC를 조회해 새로 만듦)
+    :param quota: quota.QuotaTracker (지정하면 리소스를 만들기 전에 VPC, 보안 그룹, 인스턴스, Floating IP 1개분의 쿼터를
+                  예약하고, 여유가 없으면 아무것도 만들지 않음. 프로비저닝이 끝나면 예약을 해제)
+    :return: 스택 정보 dict (생성된 리소스 ID 포함). 실패한 경우에도 그때까지 생성된 리소스 ID와 "error" 메시지를 담아 반환합니다.
+    """
+    ctx = as_context(token)
+    progress = progress or _noop_progress
+    missing = [field for field in REQUIRED_STACK_FIELDS if not spec.get(field)]
+    if missing:
+        return {"name": spec.get("name"), "error": f"스택 명세에 필수 항목이 없습니다: {', '.join(missing)}"}
+
+    spec = dict(DEFAULT_STACK_SPEC, **spec)
+    name, region_code = spec["name"], spec["region_code"]
+    stack = {"name": name, "region_code": region_code, "vpc_cidr_pool": spec["vpc_cidr_pool"]}
+
+    def fail(message):
+        print(f"🚨 [{name}] {message}")
+        stack["error"] = message
+        return stack
+
+    # 플레이버는 인스턴스 생성에 필요하고 쿼터 예약량도 정하므로, 리소스를 만들기 전에 먼저 확인합니다.
+    flavor_ref = spec.get("flavor_ref")
+    if not flavor_ref:
+        flavors = list_flavors(ctx, tenant_id, region_code)
+        matched = [f for f in flavors or [] if f['name'] == spec["flavor_name"]]
+        flavor_ref = (matched or flavors or [{}])[0].get('id')
+    if not flavor_ref:
+        return fail("플레이버를 찾지 못했습니다.")
+
+    reservation = None
+    if quota is not None:
+        flavor = get_flavor(ctx, tenant_id, flavor_ref, region_code)
+        demand = {"vpc": 1, "security_group": 1, **instance_demand(flavor, with_floating_ip=True)} if flavor else None
+        reservation = quota.reserve(demand) if demand else None
+        if reservation is None:
+            return fail("쿼터가 부족하거나 확인하지 못해 스택을 만들지 않습니다.")
+
+    try:
+        # 1. VPC / 서브넷
+        progress("network", "VPC와 서브넷을 생성합니다.")
+        vpc_allocator = vpc_allocator or load_vpc_allocator(ctx, spec["vpc_cidr_pool"], region_code)
+        vpc_cidr = vpc_allocator.allocate(spec["vpc_prefixlen"]) if vpc_allocator else None
+        if not vpc_cidr:
+            return fail("VPC CIDR을 할당하지 못했습니다.")
+        stack["vpc_cidr"] = vpc_cidr
+        stack["vpc_id"] = create_vpc(ctx, f"{name}-vpc", vpc_cidr, region_code)
+        if not stack["vpc_id"]:
+            vpc_allocator.release(vpc_cidr)
+            del stack["vpc_cidr"]
+            return fail("VPC 생성에 실패했습니다.")
+        subnet_cidr = CidrAllocator(vpc_cidr).allocate(spec["subnet_prefixlen"])
+        stack["subnet_id"] = create_vpc_subnet(ctx, stack["vpc_id"], f"{name}-subnet", subnet_cidr, region_code)
+        if not stack["subnet_id"]:
+            return fail("서브넷 생성에 실패했습니다.")
+
+        # 2. 인터넷 게이트웨이
+        progress("gateway", "인터넷 게이트웨이를 설정합니다.")
+        vpc_details = get_vpc_details(ctx, stack["vpc_id"], region_code)
+        if vpc_details and vpc_details.get('subnets'):
+            stack["routing_table_id"] = vpc_details['subnets'][0].get('routingtable', {}).get('id')
+        if not stack.get("routing_table_id"):
+            return fail("라우팅 테이블 ID를 찾지 못했습니다.")
+        external_network_id = get_external_network_id(ctx, region_code)
+        if not external_network_id:
+            return fail("외부 네트워크 ID를 찾지 못했습니다.")
+        stack["internet_gateway_id"] = create_internet_gateway(ctx, f"{name}-igw", external_network_id, region_code)
+        if not stack["internet_gateway_id"]:
+            return fail("인터넷 게이트웨이 생성에 실패했습니다.")
+        if not attach_gateway_to_routing_table(ctx, stack["routing_table_id"], stack["internet_gateway_id"], region_code):
+            return fail("인터넷 게이트웨이를 라우팅 테이블에 연결하지 못했습니다.")
+        stack["gateway_attached"] = True
+
+        # 3. 보안 그룹
+        progress("security_group", "보안 그룹과 규칙을 생성합니다.")
+        # 인스턴스에는 보안 그룹을 이름으로 연결하므로, 같은 이름의 스택이 여러 개여도 겹치지 않도록 고유 접미사를 붙입니다.
+        sg_name = f"{name}-sg-{uuid.uuid4().hex[:8]}"
+        stack["security_group_name"] = sg_name
+        stack["security_group_id"] = create_security_group(ctx, sg_name, f"{name} 스택 보안 그룹", region_code)
+        if not stack["security_group_id"]:
+            return fail("보안 그룹 생성에 실패했습니다.")
+        rules = [
+            {"direction": "ingress", "protocol": "tcp", "port_range_min": port, "port_range_max": port, "remote_ip_prefix": spec["allowed_cidr"]}
+            for port in spec["ingress_ports"]
+        ]
+        if rules and not apply_security_group_rules(ctx, stack["security_group_id"], rules, region_code):
+            return fail("보안 그룹 규칙 추가에 실패했습니다.")
+
+        # 4. 인스턴스 + Floating IP
+        progress("instance", "인스턴스를 생성하고 Floating IP를 연결합니다.")
+        user_data = build_user_data(scripts=spec["scripts"], files=spec["files"])
+        if user_data is None:
+            return fail("User Data 구성에 실패했습니다.")
+
+        instance_id, port_id, fip_data = launch_instance_with_floating_ip(
+            ctx, tenant_id, f"{name}-instance", spec["key_name"], spec["image_ref"], flavor_ref,
+            stack["subnet_id"], [sg_name], user_data, external_network_id, spec["volume_size"], region_code
+        )
+        stack["instance_id"], stack["port_id"] = instance_id, port_id
+        if not instance_id:
+            return fail("인스턴스 생성에 실패했습니다.")
+        if not fip_data:
+            return fail("Floating IP 생성 또는 연결에 실패했습니다.")
+        stack["floating_ip_id"] = fip_data['id']
+        stack["floating_ip_address"] = fip_data['ip_address']
+
+        progress("done", f"프로비저닝 완료: http://{stack['floating_ip_address']}")
+        print(f"🎉 [{name}] 스택 프로비저닝 성공: http://{stack['floating_ip_address']}")
+        return stack
+    finally:
+        if reservation:
+            reservation.release()
+
+def teardown_stack(token, tenant_id: str, stack: dict, progress=None, vpc_allocator: CidrAllocator = None):
+    """
+    provision_stack이 반환한 스택 정보의 리소스를 생성의 역순으로 삭제합니다.
+    일부만 생성된 스택도 정리할 수 있으며, 이미 삭제된 리소스가 있어도 나머지를 계속 정리합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param tenant_id: 테넌트 ID
+    :param stack: provision_stack이 반환한 스택 정보 dict
+    :param progress: 진행 상황을 받을 콜백 progress(단계 이름, 메시지) (선택)
+    :param vpc_allocator: 스택의 VPC CIDR을 반납할 할당기 (선택)
+    :return: {"deleted": [리소스 키, ...], "failed": [리소스 키, ...]}
+    """
+    ctx = as_context(token)
+    progress = progress or _noop_progress
+    region_code = stack.get("region_code", "kr1")
+    result = {"deleted": [], "failed": []}
+
+    def step(key, action):
+        if not stack.get(key):
+            return True
+        ok = action(stack[key])
+        result["deleted" if ok else "failed"].append(key)
+        return ok
+
+    progress("instance", "Floating IP와 인스턴스를 삭제합니다.")
+    step("floating_ip_id", lambda fip_id: delete_floating_ip(ctx, fip_id, region_code))
+    step("instance_id", lambda iid: delete_instance(ctx, tenant_id, iid, region_code) and wait_for_instance_deleted(ctx, tenant_id, iid, region_code))
+
+    progress("security_group", "보안 그룹을 삭제합니다.")
+    step("security_group_id", lambda sg_id: delete_security_group(ctx, sg_id, region_code))
+
+    progress("network", "인터넷 게이트웨이, 서브넷, VPC를 삭제합니다.")
+    if stack.get("gateway_attached"):
+        step("routing_table_id", lambda table_id: detach_gateway_from_routing_table(ctx, table_id, region_code))
+    step("subnet_id", lambda subnet_id: delete_vpc_subnet(ctx, subnet_id, region_code))
+    if step("vpc_id", lambda vpc_id: delete_vpc(ctx, vpc_id, region_code)) and vpc_allocator and stack.get("vpc_cidr"):
+        vpc_allocator.release(stack["vpc_cidr"])
+    step("internet_gateway_id", lambda igw_id: delete_internet_gateway(ctx, igw_id, region_code))
+
+    progress("done", f"정리 완료: 삭제 {len(result['deleted'])}개, 실패 {len(result['failed'])}개")
+    return result
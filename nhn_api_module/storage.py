@@ -0,0 +1,347 @@
+# nhn_api_module/storage.py
+
+"""
+NHN Cloud Object Storage(Swift 호환) API를 호출하는 함수들을 모아놓은 모듈입니다.
+- 컨테이너/오브젝트 생성, 조회, 삭제
+- 내용 해시(MD5)가 같은 오브젝트는 업로드 생략
+- 큰 파일은 세그먼트로 나눠 병렬 업로드 후 SLO(Static Large Object) 매니페스트로 결합
+- 만료 시간이 있는 임시 URL(TempURL) 생성과, 이를 내려받는 작은 User Data 스크립트 구성
+
+사이트 파일이나 부트스트랩 번들을 한 번만 올려 두고 인스턴스는 임시 URL로 받아 가게 하면,
+User Data 크기 제한(64KB)에 걸리지 않고 인스턴스 생성 요청마다 같은 내용을 다시 보내지 않아도 됩니다.
+
+사용 예시:
+    create_container(ctx, tenant_id, "web-assets")
+    upload_object(ctx, tenant_id, "web-assets", "site/index.html", "index.html")
+    set_temp_url_key(ctx, tenant_id, temp_url_key)
+    url = generate_temp_url(ctx, tenant_id, "web-assets", "site/index.html", temp_url_key, expires_in=3600)
+    user_data = build_user_data(scripts=[build_fetch_script({"/var/www/html/index.html": url})])
+"""
+
+import requests
+import json
+import hashlib
+import hmac
+import mimetypes
+import os
+import shlex
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote, urlsplit
+
+from .client import as_context
+
+# 이 크기보다 큰 파일은 세그먼트로 나눠 업로드합니다. (Swift 단일 오브젝트 최대 크기는 5GB)
+SEGMENT_SIZE = 32 * 1024 * 1024
+
+# 세그먼트를 저장할 컨테이너 이름의 접미사 (예: "web-assets" -> "web-assets_segments")
+SEGMENT_CONTAINER_SUFFIX = "_segments"
+
+# 파일 전체의 MD5를 기록하는 오브젝트 메타데이터 (SLO의 ETag는 파일 내용의 MD5가 아니므로 별도로 기록)
+CONTENT_MD5_HEADER = "X-Object-Meta-Content-Md5"
+
+def _storage_path(tenant_id: str, container: str = None, object_name: str = None):
+    path = f"/v1/AUTH_{tenant_id}"
+    if container:
+        path += "/" + quote(container)
+    if object_name:
+        path += "/" + quote(object_name)
+    return path
+
+def file_md5(path: str, chunk_size: int = 1024 * 1024):
+    """
+    파일 내용의 MD5(16진수 문자열)를 계산합니다.
+
+    :param path: 파일 경로
+    :param chunk_size: 한 번에 읽을 크기 (바이트)
+    :return: MD5 16진수 문자열
+    """
+    digest = hashlib.md5()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+# --- Container ---
+
+def create_container(token, tenant_id: str, container: str, region_code: str = "kr1"):
+    """
+    컨테이너를 생성합니다. 이미 있으면 그대로 둡니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param tenant_id: 테넌트 ID
+    :param container: 컨테이너 이름
+    :param region_code: 리전 코드
+    :return: 성공 시 True, 실패 시 False
+    """
+    ctx = as_context(token)
+    url = ctx.url("object-store", _storage_path(tenant_id, container), region_code)
+
+    try:
+        response = ctx.session.put(url, headers=ctx.headers)
+        response.raise_for_status()
+        print(f"✅ 컨테이너 '{container}' 준비 완료")
+        return True
+
+    except requests.exceptions.HTTPError as http_err:
+        print(f"❗ 컨테이너 생성 중 HTTP 오류 발생: {http_err}")
+        print(f"    응답 내용: {http_err.response.text}")
+        return False
+    except Exception as e:
+        print(f"❗ 컨테이너 생성 중 예상치 못한 오류 발생: {e}")
+        return False
+
+# --- Object ---
+
+def head_object(token, tenant_id: str, container: str, object_name: str, region_code: str = "kr1"):
+    """
+    오브젝트의 메타데이터(응답 헤더)를 조회합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param tenant_id: 테넌트 ID
+    :param container: 컨테이너 이름
+    :param object_name: 오브젝트 이름
+    :param region_code: 리전 코드
+    :return: 성공 시 응답 헤더(대소문자 구분 없는 dict), 오브젝트가 없으면 {}, 실패 시 None
+    """
+    ctx = as_context(token)
+    url = ctx.url("object-store", _storage_path(tenant_id, container, object_name), region_code)
+
+    try:
+        response = ctx.session.head(url, headers=ctx.headers)
+        if response.status_code == 404:
+            return {}
+        response.raise_for_status()
+        return response.headers
+
+    except requests.exceptions.HTTPError as http_err:
+        print(f"❗ 오브젝트 조회 중 HTTP 오류 발생: {http_err}")
+        return None
+    except Exception as e:
+        print(f"❗ 오브젝트 조회 중 예상치 못한 오류 발생: {e}")
+        return None
+
+def delete_object(token, tenant_id: str, container: str, object_name: str, region_code: str = "kr1"):
+    """
+    오브젝트를 삭제합니다. 세그먼트로 업로드된 오브젝트(SLO)는 세그먼트도 함께 삭제합니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param tenant_id: 테넌트 ID
+    :param container: 컨테이너 이름
+    :param object_name: 오브젝트 이름
+    :param region_code: 리전 코드
+    :return: 성공 시(이미 없는 경우 포함) True, 실패 시 False
+    """
+    ctx = as_context(token)
+    url = ctx.url("object-store", _storage_path(tenant_id, container, object_name), region_code)
+
+    try:
+        metadata = head_object(ctx, tenant_id, container, object_name, region_code)
+        if metadata is None:
+            return False
+        if not metadata:
+            return True
+        if metadata.get("X-Static-Large-Object", "").lower() == "true":
+            url += "?multipart-manifest=delete"
+        response = ctx.session.delete(url, headers=ctx.headers)
+        response.raise_for_status()
+        print(f"✅ 오브젝트 '{container}/{object_name}' 삭제 성공")
+        return True
+
+    except requests.exceptions.HTTPError as http_err:
+        print(f"❗ 오브젝트 삭제 중 HTTP 오류 발생: {http_err}")
+        print(f"    응답 내용: {http_err.response.text}")
+        return False
+    except Exception as e:
+        print(f"❗ 오브젝트 삭제 중 예상치 못한 오류 발생: {e}")
+        return False
+
+def _put_segment(ctx, url: str, path: str, offset: int, size: int):
+    """(내부 함수) 파일의 한 구간을 세그먼트로 업로드하고 세그먼트의 MD5를 반환합니다."""
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        data = f.read(size)
+    etag = hashlib.md5(data).hexdigest()
+    headers = dict(ctx.headers, **{"Content-Type": "application/octet-stream", "ETag": etag})
+    response = ctx.session.put(url, headers=headers, data=data)
+    response.raise_for_status()
+    return etag
+
+def upload_object(token, tenant_id: str, container: str, object_name: str, path: str, region_code: str = "kr1", segment_size: int = SEGMENT_SIZE, max_workers: int = 8, skip_unchanged: bool = True, content_type: str = None):
+    """
+    파일을 오브젝트로 업로드합니다.
+
+    같은 이름의 오브젝트가 이미 같은 내용(MD5)이면 업로드하지 않습니다. segment_size보다 큰 파일은
+    세그먼트 컨테이너(`{container}_segments`)에 병렬로 나눠 올린 뒤 SLO 매니페스트로 결합하며,
+    각 세그먼트와 단일 오브젝트는 ETag(MD5)로 전송 중 손상 여부를 서버가 검증합니다.
+    동시에 읽어 두는 데이터는 최대 segment_size × max_workers 바이트입니다.
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param tenant_id: 테넌트 ID
+    :param container: 컨테이너 이름 (미리 생성되어 있어야 함)
+    :param object_name: 오브젝트 이름 (예: "site/index.html")
+    :param path: 업로드할 로컬 파일 경로
+    :param region_code: 리전 코드
+    :param segment_size: 세그먼트 크기 (바이트)
+    :param max_workers: 세그먼트 동시 업로드 수
+    :param skip_unchanged: 내용이 같은 오브젝트가 있으면 업로드 생략
+    :param content_type: Content-Type (생략 시 파일 확장자로 추정)
+    :return: 성공 시 {"name", "md5", "size", "segments", "skipped"} dict, 실패 시 None
+    """
+    ctx = as_context(token)
+    url = ctx.url("object-store", _storage_path(tenant_id, container, object_name), region_code)
+    try:
+        size = os.path.getsize(path)
+        md5 = file_md5(path)
+        result = {"name": object_name, "md5": md5, "size": size, "segments": 0, "skipped": False}
+
+        if skip_unchanged:
+            existing = head_object(ctx, tenant_id, container, object_name, region_code)
+            if existing and md5 in (existing.get(CONTENT_MD5_HEADER), existing.get("ETag", "").strip('"')):
+                print(f"✅ 오브젝트 '{container}/{object_name}' 내용이 같아 업로드를 건너뜁니다.")
+                result["skipped"] = True
+                return result
+
+        headers = dict(ctx.headers, **{
+            "Content-Type": content_type or mimetypes.guess_type(path)[0] or "application/octet-stream",
+            CONTENT_MD5_HEADER: md5,
+        })
+
+        if size <= segment_size:
+            with open(path, 'rb') as f:
+                response = ctx.session.put(url, headers=dict(headers, ETag=md5), data=f.read())
+            response.raise_for_status()
+        else:
+            segment_container = container + SEGMENT_CONTAINER_SUFFIX
+            if not create_container(ctx, tenant_id, segment_container, region_code):
+                return None
+            # 세그먼트 경로에 파일 MD5를 넣어, 내용이 바뀐 파일을 올리는 동안 기존 매니페스트가 가리키는 세그먼트를 덮어쓰지 않습니다.
+            offsets = list(range(0, size, segment_size))
+            segment_names = [f"{object_name}/{md5}/{index:08d}" for index in range(len(offsets))]
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                etags = list(executor.map(
+                    lambda item: _put_segment(
+                        ctx, ctx.url("object-store", _storage_path(tenant_id, segment_container, item[0]), region_code),
+                        path, item[1], segment_size
+                    ),
+                    zip(segment_names, offsets)
+                ))
+            manifest = [
+                {"path": f"/{segment_container}/{name}", "etag": etag, "size_bytes": min(segment_size, size - offset)}
+                for name, etag, offset in zip(segment_names, etags, offsets)
+            ]
+            response = ctx.session.put(url + "?multipart-manifest=put", headers=headers, data=json.dumps(manifest))
+            response.raise_for_status()
+            result["segments"] = len(manifest)
+
+        print(f"✅ 오브젝트 '{container}/{object_name}' 업로드 성공 ({size}바이트, 세그먼트 {result['segments']}개)")
+        return result
+
+    except requests.exceptions.HTTPError as http_err:
+        print(f"❗ 오브젝트 업로드 중 HTTP 오류 발생: {http_err}")
+        print(f"    응답 내용: {http_err.response.text}")
+        return None
+    except Exception as e:
+        print(f"❗ 오브젝트 업로드 중 예상치 못한 오류 발생: {e}")
+        return None
+
+def upload_directory(token, tenant_id: str, container: str, directory: str, prefix: str = "", region_code: str = "kr1", max_workers: int = 8, **upload_kwargs):
+    """
+    디렉터리의 파일을 모두 오브젝트로 업로드합니다. (내용이 같은 파일은 건너뜀)
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param tenant_id: 테넌트 ID
+    :param container: 컨테이너 이름 (미리 생성되어 있어야 함)
+    :param directory: 업로드할 로컬 디렉터리
+    :param prefix: 오브젝트 이름 앞에 붙일 경로 (예: "site/v1/")
+    :param region_code: 리전 코드
+    :param max_workers: 파일 동시 업로드 수
+    :param upload_kwargs: upload_object에 전달할 추가 인자 (segment_size 등)
+    :return: {"uploaded": [이름, ...], "skipped": [이름, ...], "failed": [이름, ...]}
+    """
+    ctx = as_context(token)
+    files = []
+    for root, _, names in os.walk(directory):
+        for name in sorted(names):
+            path = os.path.join(root, name)
+            files.append((prefix + os.path.relpath(path, directory).replace(os.sep, "/"), path))
+
+    summary = {"uploaded": [], "skipped": [], "failed": []}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(
+            lambda item: upload_object(ctx, tenant_id, container, item[0], item[1], region_code, **upload_kwargs),
+            files
+        )
+        for (object_name, _), result in zip(files, results):
+            key = "failed" if result is None else "skipped" if result["skipped"] else "uploaded"
+            summary[key].append(object_name)
+
+    print(f"--- 파일 {len(files)}개 중 업로드 {len(summary['uploaded'])}개, 건너뜀 {len(summary['skipped'])}개, 실패 {len(summary['failed'])}개 ---")
+    return summary
+
+# --- Temp URL ---
+
+def set_temp_url_key(token, tenant_id: str, key: str, region_code: str = "kr1"):
+    """
+    계정에 임시 URL 서명 키를 설정합니다. (한 번만 설정하면 됨)
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext)
+    :param tenant_id: 테넌트 ID
+    :param key: 서명 키 (추측하기 어려운 임의의 문자열)
+    :param region_code: 리전 코드
+    :return: 성공 시 True, 실패 시 False
+    """
+    ctx = as_context(token)
+    url = ctx.url("object-store", _storage_path(tenant_id), region_code)
+
+    try:
+        response = ctx.session.post(url, headers=dict(ctx.headers, **{"X-Account-Meta-Temp-URL-Key": key}))
+        response.raise_for_status()
+        print("✅ 임시 URL 서명 키 설정 완료")
+        return True
+
+    except requests.exceptions.HTTPError as http_err:
+        print(f"❗ 임시 URL 서명 키 설정 중 HTTP 오류 발생: {http_err}")
+        print(f"    응답 내용: {http_err.response.text}")
+        return False
+    except Exception as e:
+        print(f"❗ 임시 URL 서명 키 설정 중 예상치 못한 오류 발생: {e}")
+        return False
+
+def generate_temp_url(token, tenant_id: str, container: str, object_name: str, key: str, expires_in: int = 3600, region_code: str = "kr1", method: str = "GET"):
+    """
+    인증 없이 오브젝트에 접근할 수 있는 임시 URL을 만듭니다. (API 호출 없이 로컬에서 서명)
+
+    :param token: 인증 토큰 (문자열 또는 ClientContext, 엔드포인트 해석에만 사용)
+    :param tenant_id: 테넌트 ID
+    :param container: 컨테이너 이름
+    :param object_name: 오브젝트 이름
+    :param key: set_temp_url_key로 설정한 서명 키
+    :param expires_in: 유효 시간 (초)
+    :param region_code: 리전 코드
+    :param method: 허용할 HTTP 메서드
+    :return: 임시 URL 문자열
+    """
+    ctx = as_context(token)
+    url = ctx.url("object-store", _storage_path(tenant_id, container, object_name), region_code)
+    expires = int(time.time()) + expires_in
+    path = urlsplit(url).path
+    signature = hmac.new(key.encode(), f"{method}\n{expires}\n{path}".encode(), hashlib.sha1).hexdigest()
+    return f"{url}?temp_url_sig={signature}&temp_url_expires={expires}"
+
+def build_fetch_script(assets: dict, commands=()):
+    """
+    임시 URL에서 파일을 내려받는 작은 User Data 셸 스크립트를 만듭니다. (build_user_data의 scripts로 사용)
+
+    :param assets: {인스턴스 내 저장 경로: URL} dict
+    :param commands: 내려받은 뒤 실행할 셸 명령 리스트 (예: ["tar -xzf /tmp/app.tgz -C /opt", "systemctl restart nginx"])
+    :return: 셸 스크립트 문자열
+    """
+    lines = [
+        "#!/bin/bash",
+        "set -euo pipefail",
+        'fetch() { mkdir -p "$(dirname "$2")"; curl -fsSL --retry 5 --retry-delay 2 --retry-connrefused -o "$2" "$1"; }',
+    ]
+    lines += [f"fetch {shlex.quote(url)} {shlex.quote(dest)}" for dest, url in assets.items()]
+    lines += list(commands)
+    return "\n".join(lines) + "\n"
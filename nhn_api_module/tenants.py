@@ -0,0 +1,162 @@
+# nhn_api_module/tenants.py
+
+"""
+여러 테넌트(프로젝트)에 같은 작업을 병렬로 실행하는 모듈입니다.
+- 테넌트별 인증 정보/토큰/클라이언트 컨텍스트 격리
+- 프로세스 풀 또는 스레드 풀에서 동시 실행 개수 제한
+- 테넌트별 결과와 실패 집계
+
+사용 예시 (명령행):
+    python -m nhn_api_module.tenants tenants.json --operation inventory --workers 8
+"""
+
+import argparse
+import json
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+from .auth import get_token
+from .cleanup import cleanup_sweep
+from .client import create_client_context
+from .compute import list_instances
+from .networking import list_vpcs, list_floating_ips
+from .security import list_security_groups
+
+def load_tenants(path: str):
+    """
+    테넌트 인증 정보 파일(JSON)을 로드합니다.
+
+    파일 형식: [{"tenant_id": "...", "username": "...", "password": "...", "name": "고객사A", "regions": ["kr1"]}, ...]
+    name과 regions는 생략할 수 있습니다.
+
+    :param path: JSON 파일 경로
+    :return: 테넌트 정보 dict의 리스트
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        tenants = json.load(f)
+    for tenant in tenants:
+        missing = [k for k in ("tenant_id", "username", "password") if not tenant.get(k)]
+        if missing:
+            raise ValueError(f"테넌트 정보에 필수 항목이 없습니다: {', '.join(missing)} ({tenant.get('name') or tenant.get('tenant_id')})")
+    return tenants
+
+# --- Operations ---
+# 작업 함수는 (ClientContext, 테넌트 정보 dict, **kwargs)를 받아 JSON으로 직렬화 가능한 결과를 반환합니다.
+# 프로세스 풀에서 실행되려면 모듈 최상위 함수여야 합니다.
+
+def inventory_sweep(ctx, tenant: dict, regions: list = None):
+    """
+    테넌트의 리전별 인스턴스, VPC, Floating IP, 보안 그룹 수를 집계합니다.
+
+    :param ctx: 테넌트의 ClientContext
+    :param tenant: 테넌트 정보 dict
+    :param regions: 조회할 리전 코드 리스트 (생략 시 tenant["regions"] 또는 ["kr1"])
+    :return: {리전 코드: {"instances": n, "vpcs": n, "floating_ips": n, "unassociated_floating_ips": n, "security_groups": n}}
+    """
+    result = {}
+    for region_code in regions or tenant.get("regions") or ["kr1"]:
+        instances = list_instances(ctx, ctx.tenant_id, region_code)
+        vpcs = list_vpcs(ctx, region_code)
+        floating_ips = list_floating_ips(ctx, region_code)
+        security_groups = list_security_groups(ctx, region_code)
+        if None in (instances, vpcs, floating_ips, security_groups):
+            raise RuntimeError(f"리전 {region_code}의 리소스 목록 조회에 실패했습니다.")
+        result[region_code] = {
+            "instances": len(instances),
+            "vpcs": len([v for v in vpcs if not v.get('router:external')]),
+            "floating_ips": len(floating_ips),
+            "unassociated_floating_ips": len([f for f in floating_ips if not f.get('port_id')]),
+            "security_groups": len(security_groups),
+        }
+    return result
+
+# 명령행 및 이름으로 작업을 지정할 때 사용하는 작업 목록
+OPERATIONS = {
+    "inventory": inventory_sweep,
+    "cleanup": cleanup_sweep,  # 기본값은 드라이런 (cleanup.collect_orphans 참고)
+}
+
+def _run_for_tenant(tenant: dict, operation, operation_kwargs: dict):
+    """
+    (내부 함수) 한 테넌트에 대해 인증 후 작업을 실행합니다. 풀의 워커에서 실행됩니다.
+    토큰은 테넌트별 파일에 캐시되고, 컨텍스트(세션 포함)는 이 호출 안에서만 사용됩니다.
+    """
+    started = time.time()
+    token_data = get_token(tenant["tenant_id"], tenant["username"], tenant["password"])
+    if not token_data:
+        raise RuntimeError("토큰 발급에 실패했습니다.")
+    ctx = create_client_context(token_data, tenant["tenant_id"])
+    try:
+        result = operation(ctx, tenant, **operation_kwargs)
+    finally:
+        ctx.session.close()
+    return result, time.time() - started
+
+def run_across_tenants(tenants: list, operation, max_workers: int = 8, use_processes: bool = True, **operation_kwargs):
+    """
+    여러 테넌트에 같은 작업을 동시에 실행하고 결과를 집계합니다.
+
+    각 테넌트는 자신의 인증 정보로 토큰을 발급받고(테넌트별 토큰 캐시 파일),
+    별도의 ClientContext로 작업을 실행하므로 인증 정보와 토큰이 섞이지 않습니다.
+    한 테넌트의 실패는 다른 테넌트의 실행에 영향을 주지 않습니다.
+
+    :param tenants: 테넌트 정보 dict의 리스트 (load_tenants 참고)
+    :param operation: 작업 함수 또는 OPERATIONS에 등록된 이름 (예: "inventory")
+    :param max_workers: 동시에 실행할 최대 테넌트 수
+    :param use_processes: True이면 프로세스 풀, False이면 스레드 풀 사용
+    :param operation_kwargs: 작업 함수에 전달할 추가 인자
+    :return: {"succeeded": {테넌트 ID: 결과}, "failed": {테넌트 ID: 오류 메시지},
+              "durations": {테넌트 ID: 초}, "elapsed": 전체 소요 시간(초)}
+    """
+    if isinstance(operation, str):
+        if operation not in OPERATIONS:
+            raise ValueError(f"알 수 없는 작업입니다: {operation} (사용 가능: {', '.join(OPERATIONS)})")
+        operation = OPERATIONS[operation]
+
+    summary = {"succeeded": {}, "failed": {}, "durations": {}, "elapsed": 0.0}
+    started = time.time()
+    pool_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+
+    with pool_class(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_run_for_tenant, tenant, operation, operation_kwargs): tenant
+            for tenant in tenants
+        }
+        for future in as_completed(futures):
+            tenant = futures[future]
+            tenant_id = tenant["tenant_id"]
+            label = tenant.get("name") or tenant_id
+            try:
+                result, duration = future.result()
+                summary["succeeded"][tenant_id] = result
+                summary["durations"][tenant_id] = round(duration, 2)
+                print(f"✅ [{label}] 작업 완료 ({duration:.1f}초)")
+            except Exception as e:
+                summary["failed"][tenant_id] = f"{type(e).__name__}: {e}"
+                print(f"❗ [{label}] 작업 실패: {e}")
+                if not use_processes:
+                    traceback.print_exc()
+
+    summary["elapsed"] = round(time.time() - started, 2)
+    print(f"--- 테넌트 {len(tenants)}개 중 성공 {len(summary['succeeded'])}개, 실패 {len(summary['failed'])}개 ({summary['elapsed']}초) ---")
+    return summary
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="여러 테넌트에 같은 작업을 병렬로 실행합니다.")
+    parser.add_argument("tenants_file", help="테넌트 인증 정보 JSON 파일")
+    parser.add_argument("--operation", default="inventory", choices=sorted(OPERATIONS), help="실행할 작업")
+    parser.add_argument("--workers", type=int, default=8, help="동시에 실행할 최대 테넌트 수")
+    parser.add_argument("--threads", action="store_true", help="프로세스 대신 스레드 풀 사용")
+    parser.add_argument("--output", default=None, help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    summary = run_across_tenants(
+        load_tenants(args.tenants_file), args.operation,
+        max_workers=args.workers, use_processes=not args.threads
+    )
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=4, ensure_ascii=False)
+    else:
+        print(json.dumps(summary, indent=4, ensure_ascii=False))
@@ -0,0 +1,126 @@
+# nhn_api_module/transport.py
+
+"""
+API 함수들이 사용하는 HTTP 전송 계층을 만드는 모듈입니다.
+- http1: requests.Session + 호스트별 연결 풀 (기본값)
+- http2: httpx 기반, 호스트당 하나의 연결에서 여러 요청을 다중화 (선택 의존성)
+
+두 전송 계층 모두 requests.Session과 같은 get/post/put/patch/delete/head 인터페이스를 가지며,
+응답 객체도 status_code, headers, content, text, json(), raise_for_status()를 제공합니다.
+"""
+
+import json as jsonlib
+
+import requests
+from requests.adapters import HTTPAdapter
+
+TRANSPORTS = ("http1", "http2")
+
+def create_transport(kind: str = "http1", pool_maxsize: int = 32):
+    """
+    전송 계층 세션을 만듭니다.
+
+    :param kind: "http1" 또는 "http2"
+    :param pool_maxsize: http1은 호스트별 최대 연결 수, http2는 전체 최대 연결 수
+    :return: requests.Session 또는 Http2Session
+    """
+    if kind == "http1":
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=pool_maxsize)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+    if kind == "http2":
+        return Http2Session(pool_maxsize)
+    raise ValueError(f"지원하지 않는 전송 방식입니다: {kind} (사용 가능: {', '.join(TRANSPORTS)})")
+
+class Http2Response:
+    """httpx 응답을 requests.Response처럼 다룰 수 있게 감싼 객체입니다."""
+
+    def __init__(self, response):
+        self._response = response
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self.content = response.content
+        self.url = str(response.url)
+        self.reason = response.reason_phrase
+        self.http_version = response.http_version
+
+    @property
+    def text(self):
+        return self._response.text
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    def json(self, **kwargs):
+        return jsonlib.loads(self.content, **kwargs)
+
+    def raise_for_status(self):
+        """4xx/5xx 응답이면 기존 코드가 처리하는 requests.exceptions.HTTPError를 발생시킵니다."""
+        if 400 <= self.status_code < 600:
+            kind = "Client" if self.status_code < 500 else "Server"
+            raise requests.exceptions.HTTPError(
+                f"{self.status_code} {kind} Error: {self.reason} for url: {self.url}",
+                response=self
+            )
+
+class Http2Session:
+    """
+    httpx.Client(http2=True)를 requests.Session과 같은 인터페이스로 감싼 세션입니다.
+    같은 호스트로 가는 동시 요청이 하나의 HTTP/2 연결에서 다중화됩니다.
+    """
+
+    def __init__(self, max_connections: int = 32):
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError("HTTP/2 전송을 사용하려면 httpx가 필요합니다: pip install 'httpx[http2]'")
+        self._httpx = httpx
+        self._client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            timeout=httpx.Timeout(60.0),
+            follow_redirects=True,
+        )
+
+    def request(self, method: str, url: str, headers=None, data=None, json=None, params=None, timeout=None, allow_redirects=None, **kwargs):
+        # 지원하지 않는 requests 인자(stream, files 등)를 조용히 무시하면 다르게 동작하므로 오류로 알립니다.
+        if kwargs:
+            raise TypeError(f"Http2Session이 지원하지 않는 인자입니다: {', '.join(sorted(kwargs))}")
+        options = {"headers": headers, "params": params, "json": json}
+        # requests와 같이 HEAD를 제외한 요청은 기본적으로 리다이렉트를 따라갑니다.
+        options["follow_redirects"] = allow_redirects if allow_redirects is not None else method.upper() != "HEAD"
+        if data is not None:
+            options["content"] = data.encode('utf-8') if isinstance(data, str) else data
+        if timeout is not None:
+            options["timeout"] = timeout
+        try:
+            response = self._client.request(method, url, **options)
+        except self._httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e)) from e
+        except self._httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+        return Http2Response(response)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url, **kwargs):
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request("DELETE", url, **kwargs)
+
+    def head(self, url, **kwargs):
+        return self.request("HEAD", url, **kwargs)
+
+    def close(self):
+        self._client.close()
@@ -0,0 +1,162 @@
+# nhn_api_module/userdata.py
+
+"""
+인스턴스 User Data(cloud-init)를 구성하는 함수들을 모아놓은 모듈입니다.
+- 셸 스크립트 / cloud-config / 파일 파트를 multipart로 묶기
+- gzip 압축 및 크기 제한 검사
+- 동일한 입력에 대한 빌드 결과 캐시
+"""
+
+import base64
+import gzip
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from email.charset import Charset
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from string import Template
+
+# 서버 생성 API가 허용하는 user_data의 최대 크기 (Base64 인코딩 후 기준)
+MAX_USER_DATA_BYTES = 65535
+
+_BUILD_CACHE_SIZE = 64
+_build_cache = OrderedDict()
+_build_cache_lock = threading.Lock()
+
+# 파트 본문을 Base64로 다시 인코딩하지 않도록 8bit 전송 인코딩을 사용합니다.
+_UTF8_8BIT = Charset('utf-8')
+_UTF8_8BIT.body_encoding = None
+
+def build_user_data(
+    scripts: list = None,
+    files: list = None,
+    cloud_config: dict = None,
+    template_vars: dict = None,
+    compress: bool = True,
+    size_limit: int = MAX_USER_DATA_BYTES
+):
+    """
+    cloud-init용 multipart User Data를 만들고 gzip으로 압축합니다.
+
+    파일은 cloud-config의 write_files로 전달되므로 스크립트 안에 Base64로 다시 넣을 필요가 없습니다.
+    텍스트 파일은 원문 그대로 넣고 전체 payload를 한 번만 압축하며, bytes 파일만 Base64로 넣습니다.
+    template_vars가 주어지면 스크립트와 텍스트 파일의 `${이름}` 자리표시자를 치환합니다.
+    (정의되지 않은 `${...}`는 그대로 남으므로 셸 변수와 함께 사용할 수 있습니다.)
+
+    같은 입력에 대해서는 빌드 결과를 캐시하여 재사용합니다.
+
+    :param scripts: 부팅 시 순서대로 실행할 셸 스크립트(str)의 리스트
+    :param files: 기록할 파일 정보 dict의 리스트
+                  (예: {"path": "/var/www/html/index.html", "content": "...", "permissions": "0644", "owner": "root:root"})
+    :param cloud_config: write_files 외에 추가할 cloud-config 항목 dict (예: {"packages": ["nginx"]})
+    :param template_vars: 자리표시자 치환에 사용할 dict
+    :param compress: True이면 gzip으로 압축
+    :param size_limit: Base64 인코딩 후 허용되는 최대 크기 (bytes)
+    :return: 성공 시 create_instance에 그대로 전달할 수 있는 bytes, 크기 초과 시 None
+    """
+    cache_key = _build_cache_key(scripts, files, cloud_config, template_vars, compress)
+    with _build_cache_lock:
+        if cache_key in _build_cache:
+            _build_cache.move_to_end(cache_key)
+            payload = _build_cache[cache_key]
+        else:
+            payload = None
+
+    if payload is None:
+        raw = _render_multipart(scripts or [], files or [], cloud_config, template_vars, cache_key)
+        payload = gzip.compress(raw, mtime=0) if compress else raw
+        with _build_cache_lock:
+            _build_cache[cache_key] = payload
+            while len(_build_cache) > _BUILD_CACHE_SIZE:
+                _build_cache.popitem(last=False)
+
+    encoded_size = encoded_user_data_size(payload)
+    if encoded_size > size_limit:
+        print(f"🚨 User Data 크기가 제한을 초과합니다. ({encoded_size} > {size_limit} bytes, Base64 기준)")
+        return None
+
+    print(f"✅ User Data 구성 완료 ({len(payload)} bytes, Base64 {encoded_size} bytes)")
+    return payload
+
+def encoded_user_data_size(user_data):
+    """
+    User Data를 Base64로 인코딩했을 때의 크기(bytes)를 반환합니다.
+
+    :param user_data: str 또는 bytes
+    :return: Base64 인코딩 후 크기
+    """
+    if isinstance(user_data, str):
+        user_data = user_data.encode('utf-8')
+    return len(base64.b64encode(user_data))
+
+def _render_multipart(scripts, files, cloud_config, template_vars, boundary_seed):
+    """(내부 함수) cloud-config와 스크립트 파트로 multipart/mixed 문서를 만듭니다."""
+    # 경계 문자열을 입력 해시로 고정해, 같은 입력이면 항상 같은 바이트열이 나오게 합니다.
+    message = MIMEMultipart('mixed', boundary=f"==nhn-user-data-{boundary_seed[:16]}==")
+
+    config = dict(cloud_config or {})
+    write_files = list(config.get('write_files', []))
+    for f in files:
+        write_files.append(_render_write_file(f, template_vars))
+    if write_files:
+        config['write_files'] = write_files
+
+    if config:
+        # JSON은 YAML의 부분집합이므로 별도 의존성 없이 cloud-config를 만들 수 있습니다.
+        config_text = "#cloud-config\n" + json.dumps(config, ensure_ascii=False, indent=1) + "\n"
+        message.attach(_make_part(config_text, 'cloud-config', 'cloud-config.txt'))
+
+    for index, script in enumerate(scripts, start=1):
+        script = _substitute(script, template_vars)
+        if not script.startswith('#!'):
+            script = "#!/bin/bash\n" + script
+        message.attach(_make_part(script, 'x-shellscript', f"part-{index:03d}.sh"))
+
+    return message.as_bytes()
+
+def _render_write_file(file_spec: dict, template_vars):
+    """(내부 함수) 파일 정보 dict를 cloud-config write_files 항목으로 변환합니다."""
+    content = file_spec['content']
+    entry = {
+        "path": file_spec['path'],
+        "permissions": file_spec.get('permissions', '0644'),
+        "owner": file_spec.get('owner', 'root:root'),
+    }
+    if isinstance(content, bytes):
+        entry["encoding"] = "b64"
+        entry["content"] = base64.b64encode(content).decode('ascii')
+    else:
+        entry["content"] = _substitute(content, template_vars)
+    return entry
+
+def _make_part(text: str, subtype: str, filename: str):
+    """(내부 함수) 8bit 인코딩의 text/* MIME 파트를 만듭니다."""
+    part = MIMEText(text, subtype, _UTF8_8BIT)
+    part.add_header('Content-Disposition', 'attachment', filename=filename)
+    return part
+
+def _substitute(text: str, template_vars):
+    """(내부 함수) template_vars가 있으면 `${이름}` 자리표시자를 치환합니다."""
+    if not template_vars:
+        return text
+    return Template(text).safe_substitute(template_vars)
+
+def _build_cache_key(scripts, files, cloud_config, template_vars, compress):
+    """(내부 함수) 빌드 입력 전체에 대한 SHA-256 캐시 키를 계산합니다."""
+    digest = hashlib.sha256()
+    for script in scripts or []:
+        digest.update(b"script\0" + script.encode('utf-8') + b"\0")
+    for f in files or []:
+        content = f['content']
+        if isinstance(content, str):
+            content = b"text\0" + content.encode('utf-8')
+        else:
+            content = b"bytes\0" + content
+        meta = {k: v for k, v in f.items() if k != 'content'}
+        digest.update(b"file\0" + json.dumps(meta, sort_keys=True).encode('utf-8') + b"\0" + content + b"\0")
+    digest.update(b"config\0" + json.dumps(cloud_config or {}, sort_keys=True).encode('utf-8') + b"\0")
+    digest.update(b"vars\0" + json.dumps(template_vars or {}, sort_keys=True).encode('utf-8') + b"\0")
+    digest.update(b"gzip\0" if compress else b"raw\0")
+    return digest.hexdigest()